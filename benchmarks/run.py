@@ -0,0 +1,441 @@
+"""Benchmarks for the logger, graph and bridge hot paths.
+
+Usage (from the repository root)::
+
+    python benchmarks/run.py                                  # 10k rows
+    python benchmarks/run.py --sizes 10k,1m,10m --save-baseline
+    python benchmarks/run.py --sizes 1m --threshold 0.25 --only graph_data,export_csv,export_npz
+
+Datasets are generated with ``utils.synthetic_data`` and cached under
+``benchmarks/.data``. Each run writes ``benchmarks/results/<timestamp>.json``
+and is compared against ``benchmarks/baseline.json`` when it exists; the exit
+status is 1 if any metric is worse than the baseline by more than
+``--threshold``. Metrics ending in ``_per_s`` are better when higher, all
+others (milliseconds, seconds, megabytes) when lower.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import psutil
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from utils import db_utils, synthetic_data  # noqa: E402
+from bridge.api_bridge import TimeTrackerApi  # noqa: E402
+from models import exporters  # noqa: E402
+from models.graph_service import GraphService  # noqa: E402
+from models.logger_service import LoggerService  # noqa: E402
+from models.tracker import WindowTracker  # noqa: E402
+
+DATA_DIR = BENCH_DIR / ".data"
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+DEFAULT_THRESHOLD = 0.2
+# Absolute changes below these are timer noise, whatever the relative change.
+NOISE_FLOORS = {"_ms": 1.0, "_s": 0.01, "_mb": 0.5}
+DATASET_SEED = 42
+
+LOG_ACTIVITY_CALLS = 500
+DASHBOARD_POLLS = 50
+GRAPH_REPEATS = 5
+CATEGORY_BATCH_SIZE = 200
+STARTUP_REPEATS = 3
+# Polling period for the export memory sampler; shorter catches brief worker peaks.
+RSS_SAMPLE_SECONDS = 0.02
+
+_STARTUP_SCRIPT = """
+import sys
+from pathlib import Path
+sys.path.insert(0, {src!r})
+from utils import db_utils
+db_utils.DATABASE_PATH = Path({db!r})
+from bridge.api_bridge import TimeTrackerApi
+from models.graph_service import GraphService
+from models.logger_service import LoggerService
+db_utils.initialize_database()
+logger = LoggerService()
+logger.get_category_summary()
+GraphService(logger).get_graph_data()
+"""
+
+
+class BenchContext:
+    """One dataset plus the services under test, wired like the bridge does."""
+
+    def __init__(self, db_path: Path, rows: int) -> None:
+        self.db_path = db_path
+        self.rows = rows
+        db_utils.DATABASE_PATH = db_path
+        db_utils.initialize_database()
+        self.reset_services()
+
+    def reset_services(self) -> None:
+        self.logger = LoggerService()
+        self.tracker = WindowTracker(
+            self.logger, self.logger.log_activity, self.logger.category_map
+        )
+        self.tracker.running = False
+        self.graph = GraphService(
+            self.logger, live_session_provider=self.tracker.get_live_session
+        )
+        self.api = TimeTrackerApi()
+        self.api._logger = self.logger
+        self.api._tracker = self.tracker
+        self.api._graph = self.graph
+
+
+def parse_size(text: str) -> int:
+    text = text.strip().lower().replace("_", "")
+    for suffix, factor in (("k", 1_000), ("m", 1_000_000)):
+        if text.endswith(suffix):
+            return int(float(text[:-1]) * factor)
+    return int(text)
+
+
+def size_label(rows: int) -> str:
+    if rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows % 1_000 == 0:
+        return f"{rows // 1_000}k"
+    return str(rows)
+
+
+def dataset(rows: int) -> Path:
+    """Cached synthetic database with ``rows`` sessions (about 1k per day)."""
+    path = DATA_DIR / f"bench_{size_label(rows)}_{DATASET_SEED}.sqlite"
+    if not path.exists():
+        days = max(30, min(3 * 365, rows // 1_000))
+        partial = path.with_name(path.name + ".partial")
+        partial.unlink(missing_ok=True)
+        print(f"Generating {rows:,} sessions over {days} days into {path}", file=sys.stderr)
+        synthetic_data.generate_entries(partial, sessions=rows, days=days, seed=DATASET_SEED)
+        for suffix in ("-wal", "-shm"):
+            Path(f"{partial}{suffix}").unlink(missing_ok=True)
+        partial.replace(path)
+    return path
+
+
+def _timings(fn: Callable[[], object], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - began)
+    return samples
+
+
+def _latency(samples: list[float], prefix: str) -> dict[str, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        f"{prefix}_median_ms": round(statistics.median(ordered) * 1000, 3),
+        f"{prefix}_p95_ms": round(p95 * 1000, 3),
+    }
+
+
+def _max_entry_id() -> int:
+    with db_utils.get_db_connection() as conn:
+        return conn.execute("SELECT COALESCE(MAX(id), 0) FROM time_entries").fetchone()[0]
+
+
+def _delete_entries_after(entry_id: int) -> None:
+    with db_utils.get_db_connection() as conn:
+        conn.execute("DELETE FROM time_entries WHERE id > ?", (entry_id,))
+        conn.commit()
+
+
+def bench_log_activity(ctx: BenchContext) -> dict[str, float]:
+    """Sessions logged per second, each committed like the tracker does."""
+    last_id = _max_entry_id()
+    start = time.time()
+    try:
+        began = time.perf_counter()
+        for index in range(LOG_ACTIVITY_CALLS):
+            at = start + index * 2
+            ctx.logger.log_activity("bench.exe", f"Bench {index}", at, at + 2, 2.0)
+        elapsed = time.perf_counter() - began
+    finally:
+        _delete_entries_after(last_id)
+    return {"log_activity_per_s": round(LOG_ACTIVITY_CALLS / elapsed, 1)}
+
+
+def bench_dashboard_state(ctx: BenchContext) -> dict[str, float]:
+    """The 1 s poll, both steady state and right after a session is logged."""
+    ctx.api.get_dashboard_state()
+    steady = _timings(lambda: ctx.api.get_dashboard_state(), DASHBOARD_POLLS)
+
+    last_id = _max_entry_id()
+    after_write = []
+    try:
+        start = time.time()
+        for index in range(5):
+            ctx.logger.log_activity("bench.exe", "", start + index, start + index + 1, 1.0)
+            after_write.extend(_timings(lambda: ctx.api.get_dashboard_state(), 1))
+    finally:
+        _delete_entries_after(last_id)
+    return {**_latency(steady, "dashboard"), **_latency(after_write, "dashboard_after_write")}
+
+
+def bench_graph_data(ctx: BenchContext) -> dict[str, float]:
+    """Graph payload from fresh services (cold) and on repeat calls (warm)."""
+    cold = []
+    for _ in range(GRAPH_REPEATS):
+        ctx.reset_services()
+        cold.extend(_timings(lambda: ctx.graph.get_graph_data(), 1))
+    warm = _timings(lambda: ctx.graph.get_graph_data(), GRAPH_REPEATS)
+    return {**_latency(cold, "graph_data_cold"), **_latency(warm, "graph_data_warm")}
+
+
+class _PeakTreeRss:
+    """Samples RSS of this process plus all its children until stopped.
+
+    tracemalloc only sees the parent interpreter, but large CSV reports are
+    written by ``report_engine`` worker processes, so their memory has to be
+    read from the OS.
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_SECONDS) -> None:
+        self._interval = interval
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.peak = 0
+
+    def _sample(self) -> int:
+        total = 0
+        for proc in [self._process, *self._process.children(recursive=True)]:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._sample())
+            self._stop.wait(self._interval)
+
+    def __enter__(self) -> "_PeakTreeRss":
+        self.peak = self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _bench_export(ctx: BenchContext, fmt: str) -> dict[str, float]:
+    """Whole-history report in ``fmt``: throughput and peak memory.
+
+    ``_parent_alloc_mb`` is tracemalloc's peak for this interpreter only;
+    ``_tree_rss_mb`` is the sampled peak RSS of this process and any export
+    workers combined.
+    """
+    with tempfile.TemporaryDirectory() as scratch:
+        path = Path(scratch) / f"report.{fmt}"
+        tracemalloc.start()
+        with _PeakTreeRss() as rss:
+            began = time.perf_counter()
+            exporters.export_report(ctx.logger, path, fmt)
+            elapsed = time.perf_counter() - began
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        f"export_{fmt}_s": round(elapsed, 3),
+        f"export_{fmt}_rows_per_s": round(ctx.rows / elapsed, 1),
+        f"export_{fmt}_parent_alloc_mb": round(peak / 1024 / 1024, 2),
+        f"export_{fmt}_tree_rss_mb": round(rss.peak / 1024 / 1024, 2),
+    }
+
+
+def bench_export_csv(ctx: BenchContext) -> dict[str, float]:
+    return _bench_export(ctx, "csv")
+
+
+def bench_export_jsonl(ctx: BenchContext) -> dict[str, float]:
+    return _bench_export(ctx, "jsonl")
+
+
+def bench_export_npz(ctx: BenchContext) -> dict[str, float]:
+    return _bench_export(ctx, "npz")
+
+
+def bench_export_sqlite(ctx: BenchContext) -> dict[str, float]:
+    return _bench_export(ctx, "sqlite")
+
+
+def bench_category_batch(ctx: BenchContext) -> dict[str, float]:
+    """Saving a batch of program categories from the settings dialog."""
+    batch = {f"bench_{index:04d}.exe": "Work" for index in range(CATEGORY_BATCH_SIZE)}
+    try:
+        (elapsed,) = _timings(lambda: ctx.logger.save_program_categories_batch(batch), 1)
+    finally:
+        with db_utils.get_db_connection() as conn:
+            conn.execute("DELETE FROM program_categories WHERE program_name LIKE 'bench_%'")
+            conn.commit()
+        ctx.reset_services()
+    return {"category_batch_ms": round(elapsed * 1000, 3)}
+
+
+def bench_startup(ctx: BenchContext) -> dict[str, float]:
+    """Fresh interpreter to first dashboard summary and graph payload."""
+    script = _STARTUP_SCRIPT.format(src=str(SRC_DIR), db=str(ctx.db_path))
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+    def run() -> None:
+        subprocess.run(
+            [sys.executable, "-c", script], check=True, env=env, capture_output=True
+        )
+
+    samples = _timings(run, STARTUP_REPEATS)
+    return {"startup_s": round(statistics.median(samples), 3)}
+
+
+BENCHMARKS: dict[str, Callable[[BenchContext], dict[str, float]]] = {
+    "log_activity": bench_log_activity,
+    "dashboard_state": bench_dashboard_state,
+    "graph_data": bench_graph_data,
+    "export_csv": bench_export_csv,
+    "export_jsonl": bench_export_jsonl,
+    "export_npz": bench_export_npz,
+    "export_sqlite": bench_export_sqlite,
+    "category_batch": bench_category_batch,
+    "startup": bench_startup,
+}
+
+
+def run_benchmarks(sizes: list[int], only: list[str]) -> dict:
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for rows in sizes:
+        label = size_label(rows)
+        ctx = BenchContext(dataset(rows), rows)
+        results[label] = {}
+        for name in only:
+            print(f"[{label}] {name} ...", file=sys.stderr)
+            results[label][name] = BENCHMARKS[name](ctx)
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric.endswith("_per_s")
+
+
+def _noise_floor(metric: str) -> float:
+    if higher_is_better(metric):
+        return 0.0
+    return next((floor for suffix, floor in NOISE_FLOORS.items() if metric.endswith(suffix)), 0.0)
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[dict]:
+    """One row per metric present in both runs; ``regressed`` beyond ``threshold``.
+
+    Changes smaller than the metric's noise floor never count as regressions.
+    """
+    rows = []
+    for size, benches in current["results"].items():
+        for bench, metrics in benches.items():
+            previous = baseline.get("results", {}).get(size, {}).get(bench, {})
+            for metric, value in metrics.items():
+                before = previous.get(metric)
+                if not before:
+                    continue
+                change = (value - before) / before
+                worse = -change if higher_is_better(metric) else change
+                rows.append(
+                    {
+                        "size": size,
+                        "metric": metric,
+                        "baseline": before,
+                        "current": value,
+                        "change": round(change, 4),
+                        "regressed": worse > threshold
+                        and abs(value - before) > _noise_floor(metric),
+                    }
+                )
+    return rows
+
+
+def print_report(report: dict, comparison: list[dict]) -> None:
+    changes = {(row["size"], row["metric"]): row for row in comparison}
+    for size, benches in report["results"].items():
+        print(f"\n== {size} rows ==")
+        for metrics in benches.values():
+            for metric, value in metrics.items():
+                row = changes.get((size, metric))
+                note = ""
+                if row:
+                    flag = "  REGRESSION" if row["regressed"] else ""
+                    note = f"  ({row['change']:+.1%} vs {row['baseline']}){flag}"
+                print(f"  {metric:<34}{value:>14}{note}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10k", help="Comma-separated row counts, e.g. 10k,1m,10m")
+    parser.add_argument("--only", help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown before a metric counts as a regression",
+    )
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/)")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Also store this run as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    only = [name.strip() for name in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = sorted(set(only) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+
+    report = run_benchmarks(sizes, only)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    comparison = compare(report, baseline, args.threshold) if baseline else []
+    report["comparison"] = comparison
+    report["threshold"] = args.threshold
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+
+    print_report(report, comparison)
+    print(f"\nResults written to {output}")
+    regressions = [row for row in comparison if row["regressed"]]
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
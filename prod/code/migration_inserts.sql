@@ -1,5 +0,0 @@
-INSERT INTO time_entries (date_text, program_name, window_title, category, start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, end_timestamp_epoch, percent_text) VALUES ('26/03/2024', 'Google Chrome', 'Gmail - Inbox', 'Web Browsing', '10:00:00', '10:30:00', 30.0, 1711447200.0, 1711449000.0, '50%');
-INSERT INTO time_entries (date_text, program_name, window_title, category, start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, end_timestamp_epoch, percent_text) VALUES ('26/03/2024', 'Visual Studio Code', 'main.py - MyProject', 'Development', '10:30:00', '11:00:00', 30.0, 1711449000.0, 1711450800.0, '50%');
-INSERT INTO time_entries (date_text, program_name, window_title, category, start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, end_timestamp_epoch, percent_text) VALUES ('26/03/2024', 'Slack', 'general - MyWorkspace', 'Communication', '11:00:00', '11:05:00', 5.0, 1711450800.0, 1711451100.0, '100%');
-INSERT INTO time_entries (date_text, program_name, window_title, category, start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, end_timestamp_epoch, percent_text) VALUES ('01/10/2023', 'Spotify', 'Chill Vibes Playlist', 'Entertainment', '15:00:00', '16:00:00', 60.0, 1696172400.0, 1696176000.0, '80%');
-INSERT INTO time_entries (date_text, program_name, window_title, category, start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, end_timestamp_epoch, percent_text) VALUES ('01/10/2023', 'Microsoft Outlook', 'Meeting Reminder: Bob''s Project', 'Work', '16:00:00', '16:05:00', 5.0, 1696176000.0, 1696176300.0, '20%');
@@ -5,17 +5,22 @@ from __future__ import annotations
 import json
 import os
 import sys
+import time
 import webbrowser
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from utils import config
+from utils import config, tracing
 from utils import update_check
-from utils.app_logger import app_logger
+from utils.backup import BackupScheduler
+from utils.maintenance import MaintenanceScheduler
+from utils.app_logger import app_logger, get_log_stats
 from utils.core_functions import asset_file_uri, migrate_legacy_data_if_needed
 from utils.db_utils import initialize_database
-from utils.user_config import load_config, save_config
+from utils.user_config import get_store
+from bridge.dashboard_state import DashboardStateDelta
+from models import exporters
 from models.category_coordinator import CategoryCoordinator
 from models.graph_service import GraphService
 from models.logger_service import LoggerService
@@ -33,6 +38,11 @@ class TimeTrackerApi:
         )
         self._started = False
         self._initial_category_map: dict[str, str] = {}
+        self._dashboard_state = DashboardStateDelta()
+        self._backup_scheduler: BackupScheduler | None = None
+        self._maintenance_scheduler: MaintenanceScheduler | None = None
+        # {"done", "total"} of the export in progress; polled by export.js.
+        self._export_progress: dict[str, int] | None = None
 
     def set_window(self, window) -> None:
         self._window = window
@@ -53,7 +63,7 @@ class TimeTrackerApi:
             js = f"if (window.{handler}) window.{handler}({json.dumps(payload)});"
             self._window.evaluate_js(js)
         except Exception:
-            app_logger.debug(f"Failed to emit JS event {handler}", exc_info=True)
+            app_logger.debug("Failed to emit JS event %s", handler, exc_info=True)
 
     def _lift_window(self) -> None:
         if not self._window:
@@ -81,7 +91,13 @@ class TimeTrackerApi:
         if self._logger:
             self._logger.save_program_category_to_db(program_name, category)
 
-    def prepare_startup(self) -> dict:
+    @tracing.traced("bridge")
+    def prepare_startup(self, track: bool = True, background_jobs: bool = True) -> dict:
+        """Open the database and services.
+
+        ``track=False`` serves data without watching windows and
+        ``background_jobs=False`` leaves backups and maintenance to another process.
+        """
         try:
             migrate_legacy_data_if_needed(
                 config.LEGACY_DATABASE_FILE_PATH,
@@ -90,15 +106,29 @@ class TimeTrackerApi:
             config.ensure_directories_exist()
             initialize_database()
             self._logger = LoggerService()
-            self._graph = GraphService(self._logger)
             self._initial_category_map = dict(self._logger.category_map)
+            settings = get_store()
             self._tracker = WindowTracker(
                 self._logger,
                 self._logger.log_activity,
                 self._logger.category_map,
+                break_time_seconds=settings.setting("break_interval_minutes") * 60,
                 category_callback=self._coordinator.request_category,
+                poll_seconds=settings.setting("tracker_poll_seconds"),
+            )
+            self._graph = GraphService(
+                self._logger,
+                cache_size=settings.setting("graph_cache_entries"),
+                live_session_provider=self._tracker.get_live_session,
             )
-            self._tracker.start_tracking()
+            if track:
+                self._tracker.start_tracking()
+            if background_jobs and config.BACKUP_ENABLED:
+                self._backup_scheduler = BackupScheduler()
+                self._backup_scheduler.start()
+            if background_jobs and config.MAINTENANCE_ENABLED:
+                self._maintenance_scheduler = MaintenanceScheduler(self._database_is_idle)
+                self._maintenance_scheduler.start()
             self._started = True
             app_logger.info("Startup completed successfully.")
             return self._ok()
@@ -106,6 +136,18 @@ class TimeTrackerApi:
             app_logger.critical(f"Startup failed: {exc}", exc_info=True)
             return self._err(str(exc))
 
+    def _database_is_idle(self) -> bool:
+        """True once the current session has run long enough that nothing was written lately."""
+        if not self._tracker:
+            return False
+        quiet_seconds = time.time() - self._tracker.current_session_start_time_epoch
+        return quiet_seconds >= config.MAINTENANCE_IDLE_MINUTES * 60
+
+    def refresh_external_changes(self) -> bool:
+        """Invalidate caches if another process wrote to the database."""
+        return bool(self._logger and self._logger.refresh_from_database())
+
+    @tracing.traced("bridge")
     def get_initial_data(self) -> dict:
         if not self._logger or not self._tracker:
             return self._err("Application not initialized")
@@ -116,7 +158,7 @@ class TimeTrackerApi:
                 "version": __version__,
                 "categories_summary": self._logger.get_category_summary(),
                 "category_names": self._logger.get_CATEGORIES(),
-                "program_categories": self._logger.get_program_categories(),
+                "program_categories_version": self._logger.get_program_categories_version(),
                 "break_interval_minutes": self._tracker.break_interval_minutes,
                 "min_break_minutes": config.MIN_BREAK_TIME_SECONDS // 60,
                 "run_icon_uri": self._icon_uri(config.RUN_IMAGE_PATH),
@@ -130,9 +172,20 @@ class TimeTrackerApi:
             return path.resolve().as_uri()
         return ""
 
-    def get_dashboard_state(self) -> dict:
+    @tracing.traced("bridge")
+    def get_dashboard_state(
+        self, since_version: int | None = None, acknowledge_break: bool = True
+    ) -> dict:
+        """Dashboard delta since ``since_version``.
+
+        A due break reminder is acknowledged (countdown restarted) unless
+        ``acknowledge_break`` is False, which keeps the call free of tracker
+        side effects for read-only clients.
+        """
         if not self._tracker or not self._logger:
             return self._err("Application not initialized")
+        # Polled every second, so sessions from cli.py import show up promptly.
+        self.refresh_external_changes()
         program = self._coordinator.peek_ui_prompt()
         category_prompt = None
         if program:
@@ -140,25 +193,34 @@ class TimeTrackerApi:
                 "program": program,
                 "categories": self._logger.get_CATEGORIES(),
             }
-        state = self._tracker.get_dashboard_state()
+        state = self._tracker.get_dashboard_state(consume_reminder=acknowledge_break)
         break_reminder = bool(state.pop("break_reminder", False))
-        if break_reminder:
+        if break_reminder and acknowledge_break:
             self._tracker.reset_break_timer_countdown()
             self._tracker.set_break_timer_running(True)
-        return self._ok(
+        self._dashboard_state.update(
             {
                 **state,
                 "categories_summary": self._logger.get_category_summary(),
                 "category_prompt": category_prompt,
-                "break_reminder": break_reminder,
             }
         )
+        try:
+            since = int(since_version) if since_version is not None else None
+        except (TypeError, ValueError):
+            since = None
+        delta = self._dashboard_state.diff(since)
+        if break_reminder:
+            delta.pop("unchanged", None)
+            delta["break_reminder"] = True
+        return self._ok(delta)
 
     def set_break_interval(self, minutes: int) -> dict:
         if not self._tracker:
             return self._err("Tracker not initialized")
         try:
             self._tracker.set_break_interval_minutes(int(minutes))
+            get_store().set("settings.break_interval_minutes", int(minutes))
             return self._ok({"break_interval_display": self._tracker.break_time_setting_display})
         except BreakTimeValidationError as exc:
             return self._err(str(exc))
@@ -180,16 +242,57 @@ class TimeTrackerApi:
         except BreakTimeValidationError as exc:
             return self._err(str(exc))
 
-    def get_program_categories(self) -> dict:
+    @tracing.traced("bridge")
+    def get_program_categories(self, since_version: int | None = None) -> dict:
+        """Full mapping when ``since_version`` is None, else only later changes."""
         if not self._logger:
             return self._err("Logger not initialized")
+        if since_version is None:
+            return self._ok(
+                {
+                    "full": True,
+                    "version": self._logger.get_program_categories_version(),
+                    "program_categories": self._logger.get_program_categories(),
+                    "category_names": self._logger.get_CATEGORIES(),
+                    "data_version": self._logger.data_version,
+                }
+            )
+        try:
+            changes, version = self._logger.get_program_category_changes(
+                int(since_version)
+            )
+        except (TypeError, ValueError):
+            return self._err("Invalid version")
         return self._ok(
             {
-                "program_categories": self._logger.get_program_categories(),
+                "full": False,
+                "version": version,
+                "changes": changes,
                 "category_names": self._logger.get_CATEGORIES(),
+                "data_version": self._logger.data_version,
             }
         )
 
+    @tracing.traced("bridge")
+    def list_program_categories(self, query: dict | None = None) -> dict:
+        if not self._logger:
+            return self._err("Logger not initialized")
+        query = query or {}
+        try:
+            page = self._logger.list_program_categories(
+                prefix=str(query.get("prefix") or ""),
+                category=query.get("category") or None,
+                sort=str(query.get("sort") or "name"),
+                descending=bool(query.get("descending", False)),
+                offset=int(query.get("offset") or 0),
+                limit=int(query.get("limit") or 100),
+            )
+        except (TypeError, ValueError):
+            return self._err("Invalid listing query")
+        # Totals move with every logged session; clients key cached pages on this.
+        return self._ok({**page, "data_version": self._logger.data_version})
+
+    @tracing.traced("bridge")
     def save_program_categories(self, payload: dict) -> dict:
         if not self._logger:
             return self._err("Logger not initialized")
@@ -230,6 +333,7 @@ class TimeTrackerApi:
         self._coordinator.dismiss_category(program)
         return self._ok({"category": "Misc"})
 
+    @tracing.traced("bridge")
     def graph_get_data(self, filter_category: str = "All Categories") -> dict:
         if not self._graph:
             return self._err("Graph service not initialized")
@@ -238,6 +342,75 @@ class TimeTrackerApi:
             return self._err(result.get("message", "Graph error"))
         return result
 
+    @tracing.traced("bridge")
+    def graph_get_time_series(self, payload: dict | None = None) -> dict:
+        if not self._graph:
+            return self._err("Graph service not initialized")
+        payload = payload or {}
+        try:
+            result = self._graph.get_time_series(
+                category=payload.get("category") or "All Categories",
+                bucket=payload.get("bucket") or "day",
+                start=payload.get("start"),
+                end=payload.get("end"),
+                max_points=int(payload.get("max_points") or config.TIME_SERIES_MAX_POINTS),
+            )
+        except (TypeError, ValueError):
+            return self._err("Invalid time series request")
+        if result.get("status") == "error":
+            return self._err(result.get("message", "Time series error"))
+        return result
+
+    @tracing.traced("bridge")
+    def graph_get_heatmap(self, payload: dict | None = None) -> dict:
+        if not self._graph:
+            return self._err("Graph service not initialized")
+        payload = payload or {}
+        result = self._graph.get_activity_heatmap(
+            category=payload.get("category") or "All Categories",
+            start=payload.get("start"),
+            end=payload.get("end"),
+        )
+        if result.get("status") == "error":
+            return self._err(result.get("message", "Heatmap error"))
+        return result
+
+    @tracing.traced("bridge")
+    def graph_get_top_programs(self, payload: dict | None = None) -> dict:
+        if not self._graph:
+            return self._err("Graph service not initialized")
+        payload = payload or {}
+        result = self._graph.get_top_programs(
+            category=payload.get("category") or "All Categories",
+            start=payload.get("start"),
+            end=payload.get("end"),
+            limit=payload.get("limit") or config.TOP_PROGRAMS_PAGE_SIZE,
+            offset=payload.get("offset") or 0,
+        )
+        if result.get("status") == "error":
+            return self._err(result.get("message", "Top programs error"))
+        return result
+
+    @tracing.traced("bridge")
+    def graph_get_focus_report(self, payload: dict | None = None) -> dict:
+        if not self._graph:
+            return self._err("Graph service not initialized")
+        payload = payload or {}
+        kwargs = {
+            name: payload[name]
+            for name in ("max_interruption_minutes", "min_block_minutes")
+            if payload.get(name) is not None
+        }
+        result = self._graph.get_focus_report(
+            start=payload.get("start"),
+            end=payload.get("end"),
+            category=payload.get("category") or "All Categories",
+            **kwargs,
+        )
+        if result.get("status") == "error":
+            return self._err(result.get("message", "Focus report error"))
+        return result
+
     def pick_save_path(self, initial_dir: str = "", default_name: str = "activity_report.csv") -> dict:
         if not self._window:
             return self._err("Window not ready")
@@ -251,7 +424,10 @@ class TimeTrackerApi:
                 webview.SAVE_DIALOG,
                 directory=directory,
                 save_filename=default_name,
-                file_types=("CSV files (*.csv)", "All files (*.*)"),
+                file_types=(
+                    exporters.FILE_TYPE_LABELS[exporters.format_for_path(default_name)],
+                    "All files (*.*)",
+                ),
             )
             if not result:
                 return self._ok({"path": "", "cancelled": True})
@@ -261,6 +437,7 @@ class TimeTrackerApi:
             app_logger.error("pick_save_path failed", exc_info=True)
             return self._err(str(exc))
 
+    @tracing.traced("bridge")
     def export_report(self, payload: dict) -> dict:
         if not self._logger:
             return self._err("Logger not initialized")
@@ -270,14 +447,64 @@ class TimeTrackerApi:
         end_date = payload.get("end_date")
         if not file_path:
             return self._err("No file path provided")
+        self._export_progress = {"done": 0, "total": 0}
         try:
-            self._logger.export_to_csv(file_path, export_type, start_date, end_date)
-            return self._ok({"path": file_path})
+            result = exporters.export_report(
+                self._logger,
+                file_path,
+                payload.get("format"),
+                export_type,
+                start_date,
+                end_date,
+                progress=self._record_export_progress,
+            )
+            return self._ok(result)
         except ValueError as exc:
             return self._err(str(exc))
         except Exception as exc:
             app_logger.error("export_report failed", exc_info=True)
             return self._err(str(exc))
+        finally:
+            self._export_progress = None
+
+    def _record_export_progress(self, done: int, total: int) -> None:
+        self._export_progress = {"done": done, "total": total}
+
+    def get_export_progress(self) -> dict:
+        """Progress of the running export, if any; the UI polls this while it waits."""
+        progress = self._export_progress
+        return self._ok({"running": progress is not None, **(progress or {})})
+
+    def get_perf_stats(self) -> dict:
+        """Cache sizes and hit rates for diagnostics."""
+        if not self._logger:
+            return self._err("Logger not initialized")
+        return self._ok(
+            {
+                "graph_cache": self._graph.get_cache_stats() if self._graph else {},
+                "data_version": self._logger.data_version,
+                "history_version": self._logger.history_version,
+                "logging": get_log_stats(),
+                "tracing": tracing.is_enabled(),
+            }
+        )
+
+    def set_tracing(self, enabled: bool, capacity: int | None = None) -> dict:
+        """Start or stop recording spans into the in-memory ring buffer."""
+        if enabled:
+            tracing.enable(capacity)
+        else:
+            tracing.disable()
+        return self._ok({"tracing": tracing.is_enabled()})
+
+    def dump_trace(self, path: str = "") -> dict:
+        """Write recorded spans as Chrome trace JSON (default: the traces folder)."""
+        try:
+            written, spans = tracing.dump_chrome_trace(path or None)
+        except OSError as exc:
+            app_logger.error("dump_trace failed", exc_info=True)
+            return self._err(str(exc))
+        return self._ok({"path": str(written), "spans": spans, "tracing": tracing.is_enabled()})
 
     def log_js(self, message: str) -> dict:
         app_logger.warning(f"JS: {message}")
@@ -286,11 +513,11 @@ class TimeTrackerApi:
     def check_for_updates(self, force: bool = False) -> dict:
         from _version import __version__
 
-        cfg = load_config()
-        result = update_check.check_for_update(__version__, cfg, force=bool(force))
+        store = get_store()
+        # The manifest fetch can take seconds; check against a copy, not under the lock.
+        result = update_check.check_for_update(__version__, store.snapshot(), force=bool(force))
         now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        cfg.setdefault("updates", {})["update_last_check_at"] = now
-        save_config(cfg)
+        store.set("updates.update_last_check_at", now)
         return self._ok(result)
 
     def open_update_download(self, url: str) -> dict:
@@ -304,14 +531,19 @@ class TimeTrackerApi:
         return self._ok()
 
     def dismiss_update_notice(self, latest_version: str, action: str = "later") -> dict:
-        cfg = load_config()
-        update_check.apply_snooze(cfg, action, latest_version)
-        save_config(cfg)
+        get_store().update(
+            lambda cfg: update_check.apply_snooze(cfg, action, latest_version)
+        )
         return self._ok()
 
     def exit_app(self) -> dict:
         if self._tracker:
             self._tracker.stop_tracking()
+        if self._backup_scheduler:
+            self._backup_scheduler.stop()
+        if self._maintenance_scheduler:
+            self._maintenance_scheduler.stop()
+        get_store().flush()
         if self._window:
             try:
                 self._window.destroy()
@@ -0,0 +1,54 @@
+"""Versioned dashboard snapshot so polls only ship fields that changed."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+
+class DashboardStateDelta:
+    """Track dashboard fields and the version at which each last changed.
+
+    Every ``update`` that changes at least one field bumps the version once.
+    Clients send back the last version they saw and receive only the fields
+    changed after it; an unknown or missing version gets the full snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version = 0
+        self._values: dict[str, Any] = {}
+        self._changed_at: dict[str, int] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def update(self, fields: dict[str, Any]) -> int:
+        with self._lock:
+            changed = [
+                key
+                for key, value in fields.items()
+                if key not in self._values or self._values[key] != value
+            ]
+            if changed:
+                self._version += 1
+                for key in changed:
+                    self._values[key] = fields[key]
+                    self._changed_at[key] = self._version
+            return self._version
+
+    def diff(self, since_version: int | None) -> dict[str, Any]:
+        """Return ``{"version", "full"|"unchanged", ...changed fields}``."""
+        with self._lock:
+            version = self._version
+            if since_version is None or not 0 <= since_version <= version:
+                return {"version": version, "full": True, **self._values}
+            if since_version == version:
+                return {"version": version, "unchanged": True}
+            changed = {
+                key: self._values[key]
+                for key, at in self._changed_at.items()
+                if at > since_version
+            }
+            return {"version": version, **changed}
@@ -0,0 +1,225 @@
+"""Local HTTP JSON API over the bridge's read methods (``cli.py serve``)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import tempfile
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+from utils.app_logger import app_logger
+from bridge.api_bridge import TimeTrackerApi
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "npz": "application/octet-stream",
+    "sqlite": "application/vnd.sqlite3",
+}
+# Bytes per write when streaming an export file.
+_STREAM_CHUNK_BYTES = 256 * 1024
+
+
+def _flag(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("1", "true", "yes", "on"):
+        return True
+    if lowered in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"Expected a boolean, got {value!r}")
+
+
+def _params(query: dict[str, list[str]], **types: Callable[[str], Any]) -> dict[str, Any]:
+    """Last value of each named query parameter, converted; unknown names are ignored."""
+    return {name: convert(query[name][-1]) for name, convert in types.items() if name in query}
+
+
+# path -> (handler(api, query), cacheable). Cacheable responses carry an ETag
+# and answer a matching If-None-Match with 304; the dashboard state already
+# has its own ``since_version`` delta protocol, so it is never cached. HTTP
+# reads never acknowledge a break reminder; that stays with the desktop UI.
+ROUTES: dict[str, tuple[Callable[[TimeTrackerApi, dict], dict], bool]] = {
+    "/api/initial-data": (lambda api, q: api.get_initial_data(), True),
+    "/api/dashboard-state": (
+        lambda api, q: api.get_dashboard_state(
+            **_params(q, since_version=int), acknowledge_break=False
+        ),
+        False,
+    ),
+    "/api/categories": (
+        lambda api, q: api.get_program_categories(**_params(q, since_version=int)),
+        True,
+    ),
+    "/api/program-categories": (
+        lambda api, q: api.list_program_categories(
+            _params(
+                q, prefix=str, category=str, sort=str, descending=_flag, offset=int, limit=int
+            )
+        ),
+        True,
+    ),
+    "/api/graph": (
+        lambda api, q: api.graph_get_data(_params(q, category=str).get("category", "")),
+        True,
+    ),
+    "/api/time-series": (
+        lambda api, q: api.graph_get_time_series(
+            _params(q, category=str, bucket=str, start=str, end=str, max_points=int)
+        ),
+        True,
+    ),
+    "/api/heatmap": (
+        lambda api, q: api.graph_get_heatmap(_params(q, category=str, start=str, end=str)),
+        True,
+    ),
+    "/api/top-programs": (
+        lambda api, q: api.graph_get_top_programs(
+            _params(q, category=str, start=str, end=str, limit=int, offset=int)
+        ),
+        True,
+    ),
+    "/api/focus": (
+        lambda api, q: api.graph_get_focus_report(
+            _params(
+                q,
+                category=str,
+                start=str,
+                end=str,
+                max_interruption_minutes=float,
+                min_block_minutes=float,
+            )
+        ),
+        True,
+    ),
+    "/api/perf": (lambda api, q: api.get_perf_stats(), False),
+}
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """GET-only JSON endpoints; HTTP/1.1 so clients can keep connections open."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # body waits on the client's delayed ACK (~40 ms) on kept-alive sockets.
+    disable_nagle_algorithm = True
+    server: "ApiServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        app_logger.debug("HTTP %s " + format, self.address_string(), *args)
+
+    def _send_json(
+        self, status: HTTPStatus, payload: dict, cacheable: bool = False
+    ) -> None:
+        body = json.dumps(payload, default=str).encode("utf-8")
+        etag = _etag(body) if cacheable and status == HTTPStatus.OK else None
+        if etag and _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        else:
+            self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error_json(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"status": "error", "message": message})
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        query = parse_qs(url.query, keep_blank_values=True)
+        path = url.path.rstrip("/") or "/"
+        if path in ("/", "/api"):
+            self._send_json(
+                HTTPStatus.OK, {"status": "success", "endpoints": [*ROUTES, "/api/export"]}
+            )
+            return
+        route = ROUTES.get(path)
+        if route is None and path != "/api/export":
+            self._send_error_json(HTTPStatus.NOT_FOUND, f"No endpoint {path}")
+            return
+        # The desktop app usually owns the writes; notice them before reading.
+        self.server.api.refresh_external_changes()
+        if path == "/api/export":
+            self._export(query)
+            return
+        handler, cacheable = route
+        try:
+            result = handler(self.server.api, query)
+        except ValueError as exc:
+            self._send_error_json(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+        except Exception:
+            app_logger.error(f"HTTP {path} failed", exc_info=True)
+            self._send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal error")
+            return
+        status = HTTPStatus.OK if result.get("status") != "error" else HTTPStatus.BAD_REQUEST
+        self._send_json(status, result, cacheable)
+
+    def _export(self, query: dict[str, list[str]]) -> None:
+        """Run an export into a temporary file and stream it back as an attachment."""
+        params = _params(query, format=str, type=str, start=str, end=str)
+        fmt = params.get("format", "csv")
+        if fmt not in EXPORT_CONTENT_TYPES:
+            self._send_error_json(HTTPStatus.BAD_REQUEST, f"Unknown export format: {fmt}")
+            return
+        with tempfile.TemporaryDirectory(prefix="time_tracker_export_") as tmp:
+            path = Path(tmp) / f"activity_report.{fmt}"
+            result = self.server.api.export_report(
+                {
+                    "path": str(path),
+                    "format": fmt,
+                    "export_type": params.get("type", "all"),
+                    "start_date": params.get("start"),
+                    "end_date": params.get("end"),
+                }
+            )
+            if result.get("status") == "error":
+                self._send_json(HTTPStatus.BAD_REQUEST, result)
+                return
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", EXPORT_CONTENT_TYPES[fmt])
+            self.send_header("Content-Length", str(path.stat().st_size))
+            self.send_header("Content-Disposition", f'attachment; filename="{path.name}"')
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            with open(path, "rb") as handle:
+                shutil.copyfileobj(handle, self.wfile, _STREAM_CHUNK_BYTES)
+
+
+class ApiServer(ThreadingHTTPServer):
+    """One thread per connection, all sharing a single started ``TimeTrackerApi``."""
+
+    daemon_threads = True
+
+    def __init__(self, api: TimeTrackerApi, host: str, port: int) -> None:
+        self.api = api
+        super().__init__((host, port), ApiRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
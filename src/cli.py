@@ -1,11 +1,20 @@
-"""Headless utilities for database init and export."""
+"""Headless utilities: database init, export, backups, maintenance, analytics and the HTTP API."""
 
 from __future__ import annotations
 
 import argparse
+import csv
+import json
+import sqlite3
 import sys
+import time
+from datetime import date, timedelta
 from pathlib import Path
 
+# Answered straight from the rollup tables, without pandas or LoggerService.
+ANALYTICS_COMMANDS = ("stats", "top", "timeline", "categories")
+TIMELINE_DEFAULT_DAYS = 14
+
 
 def _ensure_src_on_path() -> None:
     src_dir = Path(__file__).resolve().parent
@@ -13,38 +22,542 @@ def _ensure_src_on_path() -> None:
         sys.path.insert(0, str(src_dir))
 
 
+def _print_progress(done: int, total: int) -> None:
+    print(
+        f"\rAggregated {done}/{total} months",
+        end="\n" if done == total else "",
+        file=sys.stderr,
+    )
+
+
+def _run_import(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    from models import importers
+
+    if args.categories:
+        added = importers.import_program_categories(args.categories)
+        print(f"Added {added} program categories from {args.categories}")
+    try:
+        result = importers.import_files(
+            args.paths,
+            max_workers=args.workers,
+            chunk_rows=args.chunk_rows,
+            progress=lambda done, total, rows: print(
+                f"\rImported {done}/{total} files ({rows} rows read)",
+                end="\n" if done == total else "",
+                file=sys.stderr,
+            ),
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(
+        f"Inserted {result['inserted']} of {result['read']} sessions from "
+        f"{result['files']} files in {result['seconds']}s "
+        f"({result['duplicates']} duplicates, {result['invalid']} invalid rows skipped)"
+    )
+    for path, message in result["errors"].items():
+        print(f"Failed to import {path}: {message}", file=sys.stderr)
+    if result["errors"]:
+        sys.exit(1)
+
+
+def _run_backup(args: argparse.Namespace) -> None:
+    from utils import backup, config
+
+    backup_dir = Path(args.dest) if args.dest else config.BACKUP_DIR_PATH
+    if args.list:
+        for path in backup.list_backups(backup_dir):
+            print(f"{path}  {path.stat().st_size / 1024 / 1024:.1f} MB")
+        return
+    if args.every:
+        scheduler = backup.BackupScheduler(args.every * 3600, backup_dir, args.keep)
+        scheduler.start()
+        print(f"Backing up to {backup_dir} every {args.every:g}h; Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            scheduler.stop()
+        return
+    print(f"Backup written to {backup.create_backup(backup_dir, args.keep)}")
+
+
+def _run_maintenance(args: argparse.Namespace, config) -> None:
+    from utils import maintenance
+
+    if args.last:
+        report = maintenance.last_report(config.MAINTENANCE_REPORT_PATH)
+        if report is None:
+            print("No maintenance has run yet.")
+            return
+    else:
+        _prepare_database(config)
+        report = maintenance.run_maintenance(
+            args.budget,
+            vacuum=not args.no_vacuum,
+            check=not args.no_check,
+            report_path=config.MAINTENANCE_REPORT_PATH,
+            convert=True,
+        )
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"Maintenance started {report['started']}, took {report['seconds']}s")
+    for name, result in report["steps"].items():
+        details = ", ".join(
+            f"{key}={value}" for key, value in result.items() if key not in ("status", "seconds")
+        )
+        seconds = f" in {result['seconds']}s" if "seconds" in result else ""
+        print(f"  {name}: {result['status']}{seconds}" + (f" ({details})" if details else ""))
+    print(
+        f"Reclaimed {report['bytes_reclaimed'] / 1024 / 1024:.2f} MB "
+        f"({report['bytes_before']} -> {report['bytes_after']} bytes)"
+    )
+    for name, before in report["timings_before_ms"].items():
+        print(f"  {name}: {before:.2f} ms -> {report['timings_after_ms'][name]:.2f} ms")
+
+
+def _run_server(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    from bridge.api_bridge import TimeTrackerApi
+    from bridge.http_server import ApiServer
+
+    api = TimeTrackerApi()
+    # Read-only by default: the desktop app normally owns tracking, backups
+    # and maintenance, and a second tracker would log every window twice.
+    started = api.prepare_startup(track=args.track, background_jobs=False)
+    if started["status"] != "success":
+        parser.error(f"Could not start: {started['message']}")
+    try:
+        server = ApiServer(api, args.host, args.port)
+    except OSError as exc:
+        api.exit_app()
+        parser.error(f"Cannot listen on {args.host}:{args.port}: {exc}")
+    if args.host not in ("127.0.0.1", "localhost", "::1"):
+        print(f"Warning: serving on {args.host}, reachable from other machines", file=sys.stderr)
+    print(f"Serving the Time Tracker API at {server.url}/api; Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        api.exit_app()
+
+
+def _prepare_database(config) -> None:
+    from utils.core_functions import migrate_legacy_data_if_needed
+    from utils.db_utils import initialize_database
+
+    migrate_legacy_data_if_needed(
+        config.LEGACY_DATABASE_FILE_PATH,
+        config.DATABASE_FILE_PATH,
+    )
+    config.ensure_directories_exist()
+    initialize_database()
+
+
+def _connect_read_only(db_path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _connect_stats(config) -> sqlite3.Connection:
+    """Read-only connection; a missing or pre-rollup database is set up first."""
+    db_path = Path(config.DATABASE_FILE_PATH)
+    if db_path.exists():
+        conn = _connect_read_only(db_path)
+        try:
+            conn.execute("SELECT 1 FROM program_totals LIMIT 1")
+            return conn
+        except sqlite3.OperationalError:
+            conn.close()
+    _prepare_database(config)
+    return _connect_read_only(db_path)
+
+
+def _date_range(args: argparse.Namespace, default_days: int | None = None):
+    from models.stats_queries import parse_day
+
+    start, end = parse_day(args.start), parse_day(args.end)
+    days = args.days or (default_days if start is None and end is None else None)
+    if days:
+        end = end or date.today()
+        start = end - timedelta(days=days - 1)
+    return start, end
+
+
+def _cell(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return "" if value is None else str(value)
+
+
+def _emit(headers: list[str], rows: list[tuple], fmt: str) -> None:
+    if fmt == "json":
+        print(json.dumps([dict(zip(headers, row)) for row in rows], indent=2))
+    elif fmt == "csv":
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(headers)
+        writer.writerows(rows)
+    elif not rows:
+        print("No data for the selected range.")
+    else:
+        cells = [[_cell(value) for value in row] for row in rows]
+        widths = [
+            max(len(header), *(len(row[i]) for row in cells))
+            for i, header in enumerate(headers)
+        ]
+        numeric = [isinstance(value, (int, float)) for value in rows[0]]
+        for row in [headers, *cells]:
+            print(
+                "  ".join(
+                    cell.rjust(width) if is_number else cell.ljust(width)
+                    for cell, width, is_number in zip(row, widths, numeric)
+                ).rstrip()
+            )
+
+
+def _hours(minutes: float) -> float:
+    return round(minutes / 60, 2)
+
+
+def _duration(minutes: float) -> tuple[float, float]:
+    return round(minutes, 2), _hours(minutes)
+
+
+def _run_analytics(args: argparse.Namespace, config) -> None:
+    from models import stats_queries
+
+    default_days = TIMELINE_DEFAULT_DAYS if args.command == "timeline" else None
+    start, end = _date_range(args, default_days)
+    conn = _connect_stats(config)
+    try:
+        if args.command == "stats":
+            summary = stats_queries.overview(conn, start, end, args.category)
+            leaders = stats_queries.top_programs(conn, start, end, args.category, limit=1)
+            summary["hours"] = _hours(summary["total_minutes"])
+            summary["top_program"] = leaders[0][0] if leaders else None
+            if args.format == "json":
+                print(json.dumps(summary, indent=2))
+            else:
+                _emit(["metric", "value"], list(summary.items()), args.format)
+        elif args.command == "top":
+            rows = stats_queries.top_programs(
+                conn, start, end, args.category, limit=args.limit, offset=args.offset
+            )
+            _emit(
+                ["rank", "program", "category", "minutes", "hours", "sessions"],
+                [
+                    (args.offset + rank, program, category, *_duration(minutes), sessions)
+                    for rank, (program, category, minutes, sessions) in enumerate(rows, 1)
+                ],
+                args.format,
+            )
+        elif args.command == "timeline":
+            rows = stats_queries.period_totals(conn, start, end, args.by, args.category)
+            _emit(
+                [args.by, "minutes", "hours", "sessions"],
+                [(key, *_duration(minutes), sessions) for key, minutes, sessions in rows],
+                args.format,
+            )
+        else:
+            rows = stats_queries.category_totals(conn, start, end)
+            scale = 100 / (sum(minutes for _, minutes, _ in rows) or 1.0)
+            _emit(
+                ["category", "minutes", "hours", "sessions", "percent"],
+                [
+                    (category, *_duration(minutes), sessions, round(minutes * scale, 1))
+                    for category, minutes, sessions in rows
+                ],
+                args.format,
+            )
+    finally:
+        conn.close()
+
+
+def _has_entries(db_path: Path) -> bool:
+    if not db_path.exists():
+        return False
+    conn = _connect_read_only(db_path)
+    try:
+        return conn.execute("SELECT 1 FROM time_entries LIMIT 1").fetchone() is not None
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+def _generate_data(args: argparse.Namespace, config, parser: argparse.ArgumentParser) -> None:
+    from models.stats_queries import parse_day
+    from utils import synthetic_data
+
+    db_path = Path(args.db) if args.db else Path(config.DATABASE_FILE_PATH)
+    if _has_entries(db_path) and not args.append:
+        parser.error(f"{db_path} already has sessions; pass --append to add to it")
+    began = time.perf_counter()
+    written = synthetic_data.generate_entries(
+        db_path,
+        sessions=args.sessions,
+        days=args.days,
+        seed=args.seed,
+        end_day=parse_day(args.end),
+        programs=args.programs,
+        progress=lambda done, total: print(
+            f"\rGenerated {done}/{total} sessions", end="", file=sys.stderr
+        ),
+    )
+    print(file=sys.stderr)
+    print(f"Wrote {written} sessions to {db_path} in {time.perf_counter() - began:.1f}s")
+
+
+def _print_focus_report(logger, args: argparse.Namespace) -> None:
+    from models.graph_service import GraphService
+
+    report = GraphService(logger).get_focus_report(
+        start=args.start,
+        end=args.end,
+        category=args.category,
+        max_interruption_minutes=args.gap,
+        min_block_minutes=args.min_block,
+    )
+    if args.json or report.get("status") != "success":
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{'Day':<12}{'Focus':>16}{'Blocks':>8}{'Longest':>10}{'Switches':>10}{'/hour':>8}")
+    for day in report["days"]:
+        if not day["focus_minutes"] and not day["switches"]:
+            continue
+        print(
+            f"{day['day']:<12}{day['focus']:>16}{day['blocks']:>8}"
+            f"{day['longest_block_minutes']:>10.1f}{day['switches']:>10}"
+            f"{day['switches_per_hour']:>8.2f}"
+        )
+    totals = report["totals"]
+    print(
+        f"\n{report['display_name']} focus: {totals['focus']} in {totals['blocks']} blocks "
+        f"({totals['focus_share']}% of tracked time); "
+        f"longest streak {totals['longest_streak_days']} days"
+    )
+
+
 def main() -> None:
     _ensure_src_on_path()
     from utils import config
-    from utils.core_functions import migrate_legacy_data_if_needed
-    from utils.db_utils import initialize_database
-    from models.logger_service import LoggerService
 
     parser = argparse.ArgumentParser(description="Time Tracker CLI")
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record timing spans and write them as Chrome trace JSON to PATH",
+    )
     sub = parser.add_subparsers(dest="command")
 
     sub.add_parser("init-db", help="Initialize SQLite database")
 
-    export_parser = sub.add_parser("export", help="Export activity report to CSV")
-    export_parser.add_argument("path", help="Output CSV path")
+    export_parser = sub.add_parser("export", help="Export activity data")
+    export_parser.add_argument(
+        "path", help="Output path; .csv, .jsonl, .npz or .sqlite picks the format"
+    )
+    export_parser.add_argument(
+        "--format",
+        choices=["csv", "jsonl", "npz", "sqlite"],
+        help="Override the format implied by the extension",
+    )
     export_parser.add_argument("--type", choices=["all", "range"], default="all")
     export_parser.add_argument("--start", help="Start date DD/MM/YYYY")
     export_parser.add_argument("--end", help="End date DD/MM/YYYY")
+    export_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Append only sessions and recategorizations since the last run (JSON Lines)",
+    )
+    export_parser.add_argument(
+        "--target", help="Watermark name for --incremental (defaults to the output path)"
+    )
+    export_parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.REPORT_MAX_WORKERS,
+        help="Maximum worker processes for large ranges",
+    )
 
-    args = parser.parse_args()
-    migrate_legacy_data_if_needed(
-        config.LEGACY_DATABASE_FILE_PATH,
-        config.DATABASE_FILE_PATH,
+    backup_parser = sub.add_parser("backup", help="Snapshot the database with rotation")
+    backup_parser.add_argument("--dest", help="Backup directory")
+    backup_parser.add_argument(
+        "--keep", type=int, default=config.BACKUP_RETENTION, help="Snapshots to retain"
     )
-    config.ensure_directories_exist()
-    initialize_database()
+    backup_parser.add_argument(
+        "--every", type=float, help="Keep running and back up every N hours"
+    )
+    backup_parser.add_argument("--list", action="store_true", help="List snapshots")
+
+    focus_parser = sub.add_parser("focus", help="Deep-work blocks and context switches")
+    focus_parser.add_argument("--start", help="Start date YYYY-MM-DD or DD/MM/YYYY")
+    focus_parser.add_argument("--end", help="End date YYYY-MM-DD or DD/MM/YYYY")
+    focus_parser.add_argument("--category", default="All Categories")
+    focus_parser.add_argument(
+        "--gap", type=float, default=5, help="Longest interruption inside a block (minutes)"
+    )
+    focus_parser.add_argument(
+        "--min-block", type=float, default=25, help="Shortest block to count (minutes)"
+    )
+    focus_parser.add_argument("--json", action="store_true", help="Print the raw report")
+
+    for name, help_text in (
+        ("stats", "Tracked time, sessions and active days"),
+        ("top", "Programs ranked by tracked time"),
+        ("timeline", "Tracked time per day, week or month"),
+        ("categories", "Tracked time per category"),
+    ):
+        analytics_parser = sub.add_parser(name, help=help_text)
+        analytics_parser.add_argument("--start", help="Start date YYYY-MM-DD or DD/MM/YYYY")
+        analytics_parser.add_argument("--end", help="End date YYYY-MM-DD or DD/MM/YYYY")
+        analytics_parser.add_argument(
+            "--days", type=int, help="Last N days up to --end (default today)"
+        )
+        analytics_parser.add_argument(
+            "--format", choices=["table", "json", "csv"], default="table"
+        )
+        if name != "categories":
+            analytics_parser.add_argument("--category", help="Only this category")
+    sub.choices["top"].add_argument(
+        "--limit", type=int, default=config.TOP_PROGRAMS_PAGE_SIZE
+    )
+    sub.choices["top"].add_argument("--offset", type=int, default=0)
+    sub.choices["timeline"].add_argument(
+        "--by", choices=["day", "week", "month"], default="day"
+    )
+
+    import_parser = sub.add_parser("import", help="Bulk-load session logs (CSV, JSON Lines)")
+    import_parser.add_argument("paths", nargs="+", help="Files, or directories of them")
+    import_parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.IMPORT_MAX_WORKERS,
+        help="Files parsed concurrently",
+    )
+    import_parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=config.IMPORT_CHUNK_ROWS,
+        help="Rows parsed and inserted per transaction",
+    )
+    import_parser.add_argument(
+        "--categories", help="JSON object of program -> category to add first"
+    )
+
+    serve_parser = sub.add_parser("serve", help="Serve the read API as local HTTP JSON")
+    serve_parser.add_argument("--host", default=config.SERVE_HOST)
+    serve_parser.add_argument("--port", type=int, default=config.SERVE_PORT)
+    serve_parser.add_argument(
+        "--track",
+        action="store_true",
+        help="Also track windows (only when the desktop app is not running)",
+    )
+
+    maintain_parser = sub.add_parser(
+        "maintain", help="Optimize, reclaim free space, checkpoint and check the database"
+    )
+    maintain_parser.add_argument(
+        "--budget",
+        type=float,
+        default=config.MAINTENANCE_BUDGET_SECONDS,
+        help="Stop starting or continuing work after N seconds",
+    )
+    maintain_parser.add_argument(
+        "--no-vacuum", action="store_true", help="Skip the incremental vacuum"
+    )
+    maintain_parser.add_argument(
+        "--no-check", action="store_true", help="Skip the quick integrity check"
+    )
+    maintain_parser.add_argument(
+        "--last", action="store_true", help="Show the report of the last run instead"
+    )
+    maintain_parser.add_argument("--json", action="store_true", help="Print the raw report")
+
+    gen_parser = sub.add_parser("gen-data", help="Fill a database with synthetic sessions")
+    gen_parser.add_argument("--sessions", type=int, default=100_000)
+    gen_parser.add_argument("--days", type=int, default=365)
+    gen_parser.add_argument("--seed", type=int, default=0)
+    gen_parser.add_argument("--end", help="Last generated day (default yesterday)")
+    gen_parser.add_argument(
+        "--programs", type=int, default=40, help="Distinct programs including the long tail"
+    )
+    gen_parser.add_argument("--db", help="Target database (default: the app database)")
+    gen_parser.add_argument(
+        "--append", action="store_true", help="Allow adding to a database that has sessions"
+    )
+
+    args = parser.parse_args()
+    if not args.trace:
+        _dispatch(args, parser, config)
+        return
+    from utils import tracing
+
+    tracing.enable()
+    try:
+        with tracing.span(f"cli.{args.command}", "cli"):
+            _dispatch(args, parser, config)
+    finally:
+        path, spans = tracing.dump_chrome_trace(args.trace)
+        print(f"Wrote {spans} trace spans to {path}", file=sys.stderr)
+
+
+def _dispatch(args: argparse.Namespace, parser: argparse.ArgumentParser, config) -> None:
+    if args.command == "gen-data":
+        try:
+            _generate_data(args, config, parser)
+        except ValueError as exc:
+            parser.error(str(exc))
+        return
+    if args.command == "serve":
+        _run_server(args, parser)
+        return
+    if args.command == "maintain":
+        _run_maintenance(args, config)
+        return
+    if args.command in ANALYTICS_COMMANDS:
+        try:
+            _run_analytics(args, config)
+        except ValueError as exc:
+            parser.error(str(exc))
+        return
+
+    from models import exporters
+    from models.logger_service import LoggerService
+
+    _prepare_database(config)
     logger = LoggerService()
 
     if args.command == "init-db":
         print(f"Database ready at {config.DATABASE_FILE_PATH}")
+    elif args.command == "export" and args.incremental:
+        if exporters.format_for_path(args.path, args.format) != "jsonl":
+            parser.error("--incremental only supports JSON Lines output")
+        result = exporters.export_jsonl_incremental(logger, args.path, args.target)
+        print(
+            f"Appended {result['rows']} sessions and {result['corrections']} corrections "
+            f"to {result['path']} in {result['seconds']}s"
+        )
     elif args.command == "export":
-        logger.export_to_csv(args.path, args.type, args.start, args.end)
-        print(f"Exported to {args.path}")
+        result = exporters.export_report(
+            logger,
+            args.path,
+            args.format,
+            args.type,
+            args.start,
+            args.end,
+            max_workers=args.workers,
+            progress=_print_progress,
+        )
+        print(
+            f"Exported {result['rows']} rows as {result['format']} to {result['path']} "
+            f"in {result['seconds']}s"
+        )
+    elif args.command == "import":
+        _run_import(args, parser)
+    elif args.command == "backup":
+        _run_backup(args)
+    elif args.command == "focus":
+        _print_focus_report(logger, args)
     else:
         parser.print_help()
 
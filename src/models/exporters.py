@@ -0,0 +1,270 @@
+"""Report export targets: CSV summary, JSON Lines, NumPy columns, SQLite snapshot."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sqlite3
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from utils import db_utils
+from utils.app_logger import app_logger
+from models import report_engine, stats_queries
+from models.logger_service import ALL_LOGGED_COLUMNS, LoggerService
+
+EXPORT_FORMATS = ("csv", "jsonl", "npz", "sqlite")
+FORMAT_EXTENSIONS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".npz": "npz",
+    ".sqlite": "sqlite",
+    ".sqlite3": "sqlite",
+    ".db": "sqlite",
+}
+FILE_TYPE_LABELS = {
+    "csv": "CSV files (*.csv)",
+    "jsonl": "JSON Lines files (*.jsonl)",
+    "npz": "NumPy archives (*.npz)",
+    "sqlite": "SQLite databases (*.sqlite)",
+}
+
+# Fixed dtypes per column in .npz exports; text columns are stored as int32
+# codes into a "<column>_categories" array (-1 marks a missing value).
+NPZ_NUMERIC_DTYPES = {
+    "id": np.int64,
+    "total_time_minutes": np.float32,
+    "start_timestamp_epoch": np.float64,
+    "end_timestamp_epoch": np.float64,
+}
+
+
+def format_for_path(path: str | Path, fmt: str | None = None) -> str:
+    """Explicit ``fmt`` wins; otherwise the file extension decides (CSV by default)."""
+    if fmt:
+        fmt = fmt.lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        return fmt
+    return FORMAT_EXTENSIONS.get(Path(path).suffix.lower(), "csv")
+
+
+def export_report(
+    logger: LoggerService,
+    path: str | Path,
+    fmt: str | None = None,
+    export_type: str = "all",
+    start_date_str: str | None = None,
+    end_date_str: str | None = None,
+    max_workers: int | None = None,
+    progress: report_engine.ProgressCallback | None = None,
+) -> dict[str, Any]:
+    """Write one export and return ``{format, path, rows, bytes, seconds}``."""
+    fmt = format_for_path(path, fmt)
+    start = end = None
+    if export_type == "range":
+        start = stats_queries.parse_day(start_date_str)
+        end = stats_queries.parse_day(end_date_str)
+
+    began = time.perf_counter()
+    if fmt == "csv":
+        kwargs = {"max_workers": max_workers} if max_workers else {}
+        rows = logger.export_to_csv(
+            path, export_type, start_date_str, end_date_str, progress=progress, **kwargs
+        )
+    elif fmt == "jsonl":
+        rows = export_jsonl(logger, path, start, end)
+    elif fmt == "npz":
+        rows = export_npz(logger, path, start, end)
+    else:
+        rows = export_sqlite_snapshot(path, start, end)
+    if not rows:
+        Path(path).unlink(missing_ok=True)
+        raise ValueError("No data available for the selected criteria.")
+
+    result = {
+        "format": fmt,
+        "path": str(path),
+        "rows": rows,
+        "bytes": Path(path).stat().st_size,
+        "seconds": round(time.perf_counter() - began, 3),
+    }
+    app_logger.info(f"Export finished: {result}")
+    return result
+
+
+def export_jsonl(logger: LoggerService, path: str | Path, start=None, end=None) -> int:
+    """Raw sessions, one JSON object per line, written batch by batch."""
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as handle:
+        for batch in logger.iter_entries(start, end):
+            batch.to_json(handle, orient="records", lines=True, force_ascii=False)
+            rows += len(batch)
+    return rows
+
+
+def export_jsonl_incremental(
+    logger: LoggerService, path: str | Path, target: str | None = None
+) -> dict[str, Any]:
+    """Append sessions and recategorizations newer than ``target``'s watermark.
+
+    New sessions are written as in ``export_jsonl``; each recategorization
+    since the last run becomes ``{"record": "correction", "program_name",
+    "category", "up_to_id"}``, meaning sessions of that program with
+    ``id <= up_to_id`` now carry ``category``. A missing output file restarts
+    from scratch, and a failed run truncates the file back to where it began.
+    """
+    path = Path(path)
+    target = target or str(path.resolve())
+    began = time.perf_counter()
+    watermark = logger.get_export_watermark(target)
+    if not path.exists():
+        watermark = {"last_entry_id": 0, "last_correction_seq": 0, "last_end_epoch": None}
+    last_id = int(watermark["last_entry_id"])
+    last_seq = int(watermark["last_correction_seq"])
+    last_end = watermark["last_end_epoch"]
+
+    # Read corrections first: any recategorization after this point is also
+    # reflected in the sessions read below or picked up by the next run.
+    corrections = logger.get_entry_corrections(last_seq)
+    rows = 0
+    with open(path, "a", encoding="utf-8", newline="\n") as handle:
+        start_offset = handle.tell()
+        try:
+            for batch in logger.iter_entries(after_id=last_id):
+                batch.to_json(handle, orient="records", lines=True, force_ascii=False)
+                rows += len(batch)
+                last_id = max(last_id, int(batch["id"].max()))
+                batch_end = float(batch["end_timestamp_epoch"].max())
+                last_end = batch_end if last_end is None else max(last_end, batch_end)
+            for correction in corrections:
+                if watermark["last_entry_id"]:
+                    handle.write(
+                        json.dumps(
+                            {
+                                "record": "correction",
+                                "program_name": correction["program_name"],
+                                "category": correction["category"],
+                                "up_to_id": correction["max_entry_id"],
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+                last_seq = correction["seq"]
+            handle.flush()
+            logger.set_export_watermark(target, last_id, last_seq, last_end)
+        except BaseException:
+            handle.truncate(start_offset)
+            raise
+
+    result = {
+        "format": "jsonl",
+        "path": str(path),
+        "rows": rows,
+        "corrections": len(corrections) if watermark["last_entry_id"] else 0,
+        "bytes": path.stat().st_size,
+        "seconds": round(time.perf_counter() - began, 3),
+        "last_entry_id": last_id,
+    }
+    app_logger.info(f"Incremental export finished: {result}")
+    return result
+
+
+def _encode(values: pd.Series, dictionary: dict[str, int]) -> np.ndarray:
+    """Codes into a dictionary shared across batches (grown in place)."""
+    codes, uniques = pd.factorize(values)
+    mapping = np.array(
+        [dictionary.setdefault(value, len(dictionary)) for value in uniques],
+        dtype=np.int32,
+    )
+    if not len(mapping):
+        return np.full(len(codes), -1, dtype=np.int32)
+    return np.where(codes >= 0, mapping[codes], -1).astype(np.int32)
+
+
+def _write_npy(archive: zipfile.ZipFile, name: str, dtype: np.dtype, rows: int, raw: Path):
+    with archive.open(f"{name}.npy", "w", force_zip64=True) as out:
+        np.lib.format.write_array_header_1_0(
+            out,
+            {
+                "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                "fortran_order": False,
+                "shape": (rows,),
+            },
+        )
+        with open(raw, "rb") as source:
+            shutil.copyfileobj(source, out, 1024 * 1024)
+
+
+def export_npz(logger: LoggerService, path: str | Path, start=None, end=None) -> int:
+    """Columnar ``.npz`` readable with ``numpy.load``.
+
+    Each batch is appended to per-column scratch files, which are then
+    streamed into the archive behind an ``.npy`` header, so memory stays
+    bounded by the batch size plus the text dictionaries.
+    """
+    path = Path(path)
+    dictionaries = {
+        column: {} for column in ALL_LOGGED_COLUMNS if column not in NPZ_NUMERIC_DTYPES
+    }
+    rows = 0
+    with tempfile.TemporaryDirectory(dir=path.parent) as scratch:
+        raw_paths = {column: Path(scratch) / column for column in ALL_LOGGED_COLUMNS}
+        handles = {column: open(raw, "wb") for column, raw in raw_paths.items()}
+        try:
+            for batch in logger.iter_entries(start, end):
+                for column, handle in handles.items():
+                    if column in dictionaries:
+                        values = _encode(batch[column], dictionaries[column])
+                    else:
+                        values = batch[column].to_numpy(dtype=NPZ_NUMERIC_DTYPES[column])
+                    values.tofile(handle)
+                rows += len(batch)
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for column, raw in raw_paths.items():
+                dtype = NPZ_NUMERIC_DTYPES.get(column, np.int32)
+                _write_npy(archive, column, dtype, rows, raw)
+            for column, dictionary in dictionaries.items():
+                with archive.open(f"{column}_categories.npy", "w", force_zip64=True) as out:
+                    np.save(out, np.array(list(dictionary), dtype=str), allow_pickle=False)
+    return rows
+
+
+def export_sqlite_snapshot(path: str | Path, start=None, end=None) -> int:
+    """Self-contained copy of the database made with the online backup API.
+
+    A date range deletes sessions outside it from the copy (the rollup
+    triggers keep the summary tables consistent) and compacts the file.
+    """
+    path = Path(path)
+    path.unlink(missing_ok=True)
+    db_utils.backup_database(path)
+    conn = sqlite3.connect(path)
+    try:
+        if start or end:
+            conditions = []
+            params: list[float] = []
+            if start:
+                conditions.append("start_timestamp_epoch < ?")
+                params.append(time.mktime(start.timetuple()))
+            if end:
+                conditions.append("start_timestamp_epoch >= ?")
+                params.append(time.mktime(end.timetuple()) + 86400)
+            conn.execute(f"DELETE FROM time_entries WHERE {' OR '.join(conditions)}", params)
+            conn.commit()
+            conn.execute("VACUUM")
+        return conn.execute("SELECT COUNT(*) FROM time_entries").fetchone()[0]
+    finally:
+        conn.close()
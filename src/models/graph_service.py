@@ -2,15 +2,44 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+import math
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
-from utils.app_logger import app_logger
+from utils import config, tracing
+from utils.intervals import (
+    local_hour_edges,
+    merge_intervals,
+    run_starts,
+    split_into_bins,
+)
 from models.logger_service import LoggerService
+from models.stats_queries import day_key, parse_day
 
 
+AGGREGATE_KEYS = ["parsed_date", "category", "program_name"]
+
+TIME_SERIES_BUCKETS = {"day": "D", "week": "W-MON", "month": "MS"}
+WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+TODAY_COLUMNS = ["category", "program_name", "total_time_minutes"]
+HISTORY_COLUMNS = [
+    "date_text",
+    "category",
+    "program_name",
+    "total_time_minutes",
+    "end_timestamp_epoch",
+]
+FOCUS_DEFAULT_MAX_INTERRUPTION_MINUTES = 5
+FOCUS_DEFAULT_MIN_BLOCK_MINUTES = 25
+
+# Returns (program, session start epoch) for the session still in progress.
+LiveSessionProvider = Callable[[], "tuple[str, float] | None"]
+
 CHART_COLORS = [
     "#87CEEB",
     "#FFA500",
@@ -34,88 +63,296 @@ def format_time_display(total_minutes: float) -> str:
 
 
 class GraphService:
-    def __init__(self, logger_service: LoggerService) -> None:
+    def __init__(
+        self,
+        logger_service: LoggerService,
+        cache_size: int = config.GRAPH_CACHE_MAX_ENTRIES,
+        live_session_provider: LiveSessionProvider | None = None,
+    ) -> None:
         self.logger = logger_service
+        self._live_session_provider = live_session_provider
+        self._cache_size = max(1, int(cache_size))
+        self._cache_lock = threading.Lock()
+        self._payload_cache: OrderedDict[tuple, dict] = OrderedDict()
+        self._history_cache: tuple[tuple[date, int], dict[str, Any]] | None = None
+        # Per-closed-day results by report key, valid for one history version.
+        self._day_caches: dict[tuple, dict[date, Any]] = {}
+        self._day_cache_version: int | None = None
+
+    def _data_version(self) -> int:
+        return int(getattr(self.logger, "data_version", 0))
+
+    def _history_version(self) -> int:
+        return int(getattr(self.logger, "history_version", 0))
+
+    @staticmethod
+    @tracing.traced("pandas")
+    def _aggregate_entries(df_entries: pd.DataFrame) -> pd.DataFrame:
+        """Collapse sessions to minutes per (day, category, program)."""
+        if df_entries.empty:
+            return pd.DataFrame(columns=AGGREGATE_KEYS + ["total_time_minutes"])
+        df = df_entries[["date_text", "category", "program_name"]].copy()
+        df["total_time_minutes"] = pd.to_numeric(
+            df_entries["total_time_minutes"], errors="coerce"
+        ).astype("float64").fillna(0)
+        df["parsed_date"] = pd.to_datetime(
+            df["date_text"].astype(str), format="%d/%m/%Y", errors="coerce"
+        )
+        df.dropna(subset=["parsed_date"], inplace=True)
+        df_agg = df.groupby(AGGREGATE_KEYS, as_index=False, observed=True)[
+            "total_time_minutes"
+        ].sum()
+        # The aggregate is small; plain strings keep later index alignment simple.
+        return df_agg.astype({"category": str, "program_name": str})
+
+    @staticmethod
+    def _period_totals(df_agg: pd.DataFrame) -> dict[str, Any]:
+        """Minutes and active-day counts per category, plus the non-Break total."""
+        by_category = df_agg.groupby("category").agg(
+            minutes=("total_time_minutes", "sum"),
+            days=("parsed_date", "nunique"),
+        )
+        productive = df_agg[df_agg["category"] != "Break"]
+        return {
+            "by_category": by_category,
+            "productive": (
+                float(productive["total_time_minutes"].sum()),
+                int(productive["parsed_date"].nunique()),
+            ),
+        }
+
+    @tracing.traced("graph")
+    def _history_summary(self, today: date) -> dict[str, Any]:
+        """Closed-day totals, reused until history changes or the day rolls over."""
+        key = (today, self._history_version())
+        with self._cache_lock:
+            if self._history_cache is not None and self._history_cache[0] == key:
+                return self._history_cache[1]
+        df_entries = self.logger.get_all_logged_data(
+            None, today - timedelta(days=1), columns=HISTORY_COLUMNS
+        )
+        # A session running past midnight keeps only its pre-midnight part here;
+        # the today aggregator already counts the rest.
+        midnight = datetime.combine(today, datetime.min.time()).timestamp()
+        overflow = (
+            (pd.to_numeric(df_entries["end_timestamp_epoch"], errors="coerce") - midnight)
+            .clip(lower=0)
+            .fillna(0)
+        )
+        df_agg = self._aggregate_entries(
+            df_entries.assign(
+                total_time_minutes=(
+                    pd.to_numeric(df_entries["total_time_minutes"], errors="coerce")
+                    - overflow / 60
+                ).clip(lower=0)
+            )
+        )
+        month_start = pd.Timestamp(today.replace(day=1))
+        summary = {
+            "category_minutes": df_agg.groupby("category")["total_time_minutes"].sum(),
+            "overall": self._period_totals(df_agg),
+            "month": self._period_totals(df_agg[df_agg["parsed_date"] >= month_start]),
+        }
+        with self._cache_lock:
+            self._history_cache = (key, summary)
+        return summary
+
+    def _live_session(self, today: date) -> tuple[str, str, float] | None:
+        """``(category, program, minutes today)`` of the open tracker session."""
+        if not self._live_session_provider:
+            return None
+        live = self._live_session_provider()
+        if not live:
+            return None
+        program, start_epoch = live
+        day_start = datetime.combine(today, datetime.min.time()).timestamp()
+        seconds = datetime.now().timestamp() - max(start_epoch, day_start)
+        if seconds <= 0:
+            return None
+        category = self.logger.category_map.get(program, "Misc")
+        return category, program, seconds / 60
+
+    @tracing.traced("graph")
+    def _today_frame(
+        self, today: date, live: tuple[str, str, float] | None = None
+    ) -> pd.DataFrame:
+        """Today's minutes per (category, program), plus the open session if given."""
+        totals = self.logger.get_today_totals(today)
+        if live:
+            category, program, minutes = live
+            totals[(category, program)] = totals.get((category, program), 0.0) + minutes
+        return pd.DataFrame(
+            [(category, program, minutes) for (category, program), minutes in totals.items()],
+            columns=TODAY_COLUMNS,
+        ).astype({"total_time_minutes": "float64"})
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._payload_cache.clear()
+            self._history_cache = None
+            self._day_caches.clear()
+            self._day_cache_version = None
 
-    def _fetch_and_prepare_data(
+    def get_cache_stats(self) -> dict[str, int]:
+        with self._cache_lock:
+            return {
+                "payload_entries": len(self._payload_cache),
+                "payload_max_entries": self._cache_size,
+                "closed_days_cached": sum(len(days) for days in self._day_caches.values()),
+            }
+
+    def _compute_hourly_minutes(
+        self, first_day: date, day_count: int
+    ) -> dict[date, dict[str, np.ndarray]]:
+        """Minutes per (category, local hour) for consecutive days, in one pass."""
+        days = [first_day + timedelta(days=i) for i in range(day_count)]
+        result: dict[date, dict[str, np.ndarray]] = {day: {} for day in days}
+        edges = local_hour_edges(first_day, day_count)
+        df = self.logger.get_sessions_between(float(edges[0]), float(edges[-1]))
+        if df.empty:
+            return result
+
+        codes, categories = pd.factorize(df["category"])
+        session_ids, bins, seconds = split_into_bins(
+            df["start_timestamp_epoch"].to_numpy(),
+            df["end_timestamp_epoch"].to_numpy(),
+            edges,
+        )
+        grid = np.zeros((day_count, len(categories), 24))
+        np.add.at(grid, (bins // 24, codes[session_ids], bins % 24), seconds / 60)
+        for day_index, cat_index in zip(*np.nonzero(grid.any(axis=2))):
+            result[days[day_index]][str(categories[cat_index])] = grid[day_index, cat_index]
+        return result
+
+    def _per_day(
         self,
-    ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        df_all_entries = self.logger.get_all_logged_data()
-        if df_all_entries.empty:
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-
-        df_all_entries["total_time_minutes"] = pd.to_numeric(
-            df_all_entries["total_time_minutes"], errors="coerce"
-        ).fillna(0)
-        df_all_entries["parsed_date"] = pd.to_datetime(
-            df_all_entries["date_text"], format="%d/%m/%Y", errors="coerce"
-        )
-        df_all_entries.dropna(subset=["parsed_date"], inplace=True)
-
-        if df_all_entries.empty:
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-
-        today_dt = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
-        current_month_start = today_dt.replace(day=1)
-
-        df_today = df_all_entries[df_all_entries["parsed_date"] == today_dt].copy()
-        df_this_month = df_all_entries[
-            df_all_entries["parsed_date"] >= current_month_start
-        ].copy()
-        return df_today, df_this_month, df_all_entries
-
-    def get_top_ten_programs(self, df_source: pd.DataFrame) -> list[dict]:
-        if (
-            df_source.empty
-            or "program_name" not in df_source.columns
-            or "total_time_minutes" not in df_source.columns
-        ):
-            return []
+        report_key: tuple,
+        start_day: date,
+        end_day: date,
+        today: date,
+        compute: Callable[[date, int], dict[date, Any]],
+    ) -> dict[date, Any]:
+        """Per-day results; closed days are cached, today is always recomputed.
+
+        ``compute(first_day, day_count)`` must return an entry for every day
+        of the span, so missing closed days are filled in one query.
+        """
+        history_version = self._history_version()
+        last_closed = min(end_day, today - timedelta(days=1))
+        closed = [
+            start_day + timedelta(days=i)
+            for i in range((last_closed - start_day).days + 1)
+        ]
+        with self._cache_lock:
+            if self._day_cache_version != history_version:
+                self._day_caches.clear()
+                self._day_cache_version = history_version
+            cache = self._day_caches.setdefault(report_key, {})
+            missing = [day for day in closed if day not in cache]
+        computed = (
+            compute(missing[0], (missing[-1] - missing[0]).days + 1) if missing else {}
+        )
+        with self._cache_lock:
+            if self._day_cache_version == history_version:
+                cache.update((day, computed[day]) for day in missing)
+            result = {day: computed[day] if day in computed else cache[day] for day in closed}
+        if start_day <= today <= end_day:
+            result.update(compute(today, 1))
+        return result
+
+    def _hourly_minutes(
+        self, start_day: date, end_day: date, today: date
+    ) -> dict[date, dict[str, np.ndarray]]:
+        return self._per_day(
+            ("hourly",), start_day, end_day, today, self._compute_hourly_minutes
+        )
+
+    def get_top_programs(
+        self,
+        category: str = "All Categories",
+        start: date | str | None = None,
+        end: date | str | None = None,
+        limit: int = config.TOP_PROGRAMS_PAGE_SIZE,
+        offset: int = 0,
+    ) -> dict:
+        """One page of programs ranked by time, from the rollup tables."""
         try:
-            value_counts = df_source.groupby(["program_name", "category"])[
-                "total_time_minutes"
-            ].sum()
-            top_10 = value_counts.nlargest(10).reset_index(name="total_minutes")
-            return [
-                {
-                    "program_name": str(row["program_name"])[:25],
-                    "category": str(row["category"])[:15],
-                    "time_display": format_time_display(row["total_minutes"]),
-                    "total_minutes": float(row["total_minutes"]),
-                }
-                for _, row in top_10.iterrows()
-            ]
-        except KeyError:
-            app_logger.error("KeyError in get_top_ten_programs", exc_info=True)
-            return []
+            start_day = parse_day(start)
+            end_day = parse_day(end)
+            limit = max(1, int(limit))
+            offset = max(0, int(offset))
+        except (TypeError, ValueError) as exc:
+            return {"status": "error", "message": str(exc)}
+        if start_day and end_day and start_day > end_day:
+            return {"status": "error", "message": "Start date is after end date."}
+
+        key = ("top", category, start_day, end_day, limit, offset, self._data_version())
+        cached = self._cached_payload(key)
+        if cached is not None:
+            return cached
 
+        rows = self.logger.get_top_programs(
+            start_day,
+            end_day,
+            category=None if category == "All Categories" else category,
+            limit=limit + 1,
+            offset=offset,
+        )
+        return self._store_payload(
+            key,
+            {
+                "status": "success",
+                "category": category,
+                "offset": offset,
+                "limit": limit,
+                "has_more": len(rows) > limit,
+                "items": [
+                    {
+                        "rank": offset + index + 1,
+                        "program_name": str(program_name)[:25],
+                        "category": str(program_category)[:15],
+                        "total_minutes": round(minutes, 2),
+                        "session_count": sessions,
+                        "time_display": format_time_display(minutes),
+                    }
+                    for index, (program_name, program_category, minutes, sessions) in enumerate(
+                        rows[:limit]
+                    )
+                ],
+            },
+        )
+
+    @tracing.traced("pandas")
     def _compute_stats(
         self,
         df_today: pd.DataFrame,
-        df_this_month: pd.DataFrame,
-        df_overall: pd.DataFrame,
+        history: dict[str, Any],
         selected_cat: str,
     ) -> dict[str, Any]:
         if selected_cat != "All Categories":
             df_today_stat = df_today[df_today["category"] == selected_cat]
-            df_month_stat = df_this_month[df_this_month["category"] == selected_cat]
-            df_overall_stat = df_overall[df_overall["category"] == selected_cat]
             cat_display_name = selected_cat
         else:
             df_today_stat = df_today[df_today["category"] != "Break"]
-            df_month_stat = df_this_month[df_this_month["category"] != "Break"]
-            df_overall_stat = df_overall[df_overall["category"] != "Break"]
             cat_display_name = "Productive"
 
+        def closed_totals(period: dict[str, Any]) -> tuple[float, int]:
+            if selected_cat == "All Categories":
+                return period["productive"]
+            by_category = period["by_category"]
+            if selected_cat not in by_category.index:
+                return 0.0, 0
+            row = by_category.loc[selected_cat]
+            return float(row["minutes"]), int(row["days"])
+
         time_today = float(df_today_stat["total_time_minutes"].sum())
-        time_month = float(df_month_stat["total_time_minutes"].sum())
-        days_month = int(df_month_stat["parsed_date"].nunique()) if not df_month_stat.empty else 0
-        time_overall = float(df_overall_stat["total_time_minutes"].sum())
-        days_overall = (
-            int(df_overall_stat["parsed_date"].nunique())
-            if not df_overall_stat.empty
-            else 0
-        )
+        active_today = 1 if not df_today_stat.empty else 0
+        time_month, days_month = closed_totals(history["month"])
+        time_overall, days_overall = closed_totals(history["overall"])
+        time_month += time_today
+        time_overall += time_today
+        days_month += active_today
+        days_overall += active_today
 
         prod_month = (
             ((time_month / 60) / (days_month * 16) * 100)
@@ -131,6 +368,7 @@ class GraphService:
         return {
             "display_name": cat_display_name,
             "today": format_time_display(time_today),
+            "today_minutes": round(time_today, 2),
             "month": format_time_display(time_month),
             "month_days": days_month,
             "month_productivity": round(prod_month, 1),
@@ -139,25 +377,409 @@ class GraphService:
             "overall_productivity": round(prod_overall, 1),
         }
 
+    def _cached_payload(self, key: tuple) -> dict | None:
+        with self._cache_lock:
+            cached = self._payload_cache.get(key)
+            if cached is not None:
+                self._payload_cache.move_to_end(key)
+            return cached
+
+    def _store_payload(self, key: tuple, payload: dict) -> dict:
+        if payload.get("status") == "success":
+            with self._cache_lock:
+                self._payload_cache[key] = payload
+                self._payload_cache.move_to_end(key)
+                while len(self._payload_cache) > self._cache_size:
+                    self._payload_cache.popitem(last=False)
+        return payload
+
+    @tracing.traced("graph")
     def get_graph_data(self, filter_category: str = "All Categories") -> dict:
-        df_today, df_this_month, df_overall = self._fetch_and_prepare_data()
-        if df_overall.empty:
-            return {"status": "error", "message": "No data available to display."}
+        today = date.today()
+        key = ("graph", filter_category, today, self._data_version())
+        payload = self._cached_payload(key)
+        if payload is None:
+            payload = self._store_payload(
+                key, self._build_graph_data(filter_category, today, self._today_frame(today))
+            )
+        # The open session grows every poll, so it is applied on top of the
+        # cached closed-session payload rather than being part of its key.
+        live = self._live_session(today)
+        if live is None:
+            return payload
+        df_today = self._today_frame(today, live)
+        if payload.get("status") != "success":
+            return self._build_graph_data(filter_category, today, df_today)
+        return {
+            **payload,
+            **self._chart_and_stats(filter_category, self._history_summary(today), df_today),
+        }
+
+    def get_activity_heatmap(
+        self,
+        category: str = "All Categories",
+        start: date | str | None = None,
+        end: date | str | None = None,
+    ) -> dict:
+        """Minutes per (weekday, local hour) over a day range."""
+        try:
+            start_day = parse_day(start)
+            end_day = parse_day(end) or date.today()
+        except ValueError as exc:
+            return {"status": "error", "message": str(exc)}
+
+        today = date.today()
+        key = ("heatmap", category, start_day, end_day, today, self._data_version())
+        cached = self._cached_payload(key)
+        if cached is not None:
+            return cached
+
+        if start_day is None:
+            bounds = self.logger.get_day_bounds()
+            if bounds is None:
+                return {"status": "error", "message": "No data available to display."}
+            start_day = bounds[0]
+        if start_day > end_day:
+            return {"status": "error", "message": "Start date is after end date."}
+
+        grid = np.zeros((7, 24))
+        for day, per_category in self._hourly_minutes(start_day, end_day, today).items():
+            for name, minutes in per_category.items():
+                if category == "All Categories":
+                    if name != "Break":
+                        grid[day.weekday()] += minutes
+                elif name == category:
+                    grid[day.weekday()] += minutes
+
+        return self._store_payload(
+            key,
+            {
+                "status": "success",
+                "display_name": category if category != "All Categories" else "Productive",
+                "start": day_key(start_day),
+                "end": day_key(end_day),
+                "weekdays": WEEKDAY_LABELS,
+                "hours": list(range(24)),
+                "minutes": [[round(float(v), 1) for v in row] for row in grid],
+                "max_minutes": round(float(grid.max()), 1),
+            },
+        )
+
+    def get_time_series(
+        self,
+        category: str = "All Categories",
+        bucket: str = "day",
+        start: date | str | None = None,
+        end: date | str | None = None,
+        max_points: int = config.TIME_SERIES_MAX_POINTS,
+    ) -> dict:
+        """Minutes per day/week/month from the daily rollup, capped at ``max_points``.
+
+        Longer ranges are downsampled by averaging runs of adjacent buckets,
+        so values stay in "minutes per bucket" whatever the range.
+        """
+        if bucket not in TIME_SERIES_BUCKETS:
+            return {"status": "error", "message": f"Unknown bucket: {bucket}"}
+        try:
+            start_day = parse_day(start)
+            end_day = parse_day(end) or date.today()
+        except ValueError as exc:
+            return {"status": "error", "message": str(exc)}
+        max_points = max(2, int(max_points))
+
+        key = (
+            "series",
+            category,
+            bucket,
+            start_day,
+            end_day,
+            max_points,
+            date.today(),
+            self._data_version(),
+        )
+        cached = self._cached_payload(key)
+        if cached is not None:
+            return cached
+
+        if start_day is None:
+            bounds = self.logger.get_day_bounds()
+            if bounds is None:
+                return {"status": "error", "message": "No data available to display."}
+            start_day = bounds[0]
+        if start_day > end_day:
+            return {"status": "error", "message": "Start date is after end date."}
+
+        if category != "All Categories":
+            rows = self.logger.get_daily_totals(start_day, end_day, category=category)
+            display_name = category
+        else:
+            rows = self.logger.get_daily_totals(
+                start_day, end_day, exclude_categories=("Break",)
+            )
+            display_name = "Productive"
+
+        days = pd.date_range(start_day, end_day, freq="D")
+        series = pd.Series(0.0, index=days)
+        if rows:
+            observed = pd.Series(
+                [minutes for _, minutes in rows],
+                index=pd.to_datetime([day for day, _ in rows], format="%Y-%m-%d"),
+            )
+            series = observed.reindex(days, fill_value=0.0)
+        if bucket != "day":
+            series = series.resample(
+                TIME_SERIES_BUCKETS[bucket], label="left", closed="left"
+            ).sum()
+
+        group_size = max(1, math.ceil(len(series) / max_points))
+        if group_size > 1:
+            groups = pd.Series(range(len(series))) // group_size
+            labels = series.index[::group_size]
+            series = pd.Series(
+                series.groupby(groups.values).mean().values, index=labels
+            )
+
+        return self._store_payload(
+            key,
+            {
+                "status": "success",
+                "display_name": display_name,
+                "bucket": bucket,
+                "start": day_key(start_day),
+                "end": day_key(end_day),
+                "downsample_factor": group_size,
+                "labels": [day_key(ts.date()) for ts in series.index],
+                "values": [round(float(v), 1) for v in series.values],
+            },
+        )
+
+    def _compute_focus(
+        self,
+        first_day: date,
+        day_count: int,
+        category: str,
+        max_gap_seconds: float,
+        min_block_seconds: float,
+    ) -> dict[date, dict[str, Any]]:
+        """Focus blocks and context switches for consecutive days, in one pass.
+
+        Sessions are cut at midnight, then sorted by (day, start). Productive
+        pieces separated by at most ``max_gap_seconds`` merge into one block;
+        a context switch is any change of program within a day.
+        """
+        days = [first_day + timedelta(days=i) for i in range(day_count)]
+        hour_edges = local_hour_edges(first_day, day_count)
+        day_edges = hour_edges[::24]
+        empty = {
+            "tracked_minutes": 0.0,
+            "focus_minutes": 0.0,
+            "blocks": 0,
+            "longest_block_minutes": 0.0,
+            "switches": 0,
+            "switches_by_hour": np.zeros(24, dtype=np.int64),
+        }
+        result = {day: dict(empty) for day in days}
+        df = self.logger.get_sessions_between(float(day_edges[0]), float(day_edges[-1]))
+        if df.empty:
+            return result
+
+        starts = df["start_timestamp_epoch"].to_numpy(dtype=np.float64)
+        session_ids, day_index, seconds = split_into_bins(
+            starts, df["end_timestamp_epoch"].to_numpy(), day_edges
+        )
+        lo = np.maximum(starts[session_ids], day_edges[day_index])
+        order = np.lexsort((lo, day_index))
+        session_ids, day_index, lo = session_ids[order], day_index[order], lo[order]
+        hi = lo + seconds[order]
 
-        stats = self._compute_stats(
-            df_today, df_this_month, df_overall, filter_category
+        categories = df["category"].to_numpy()[session_ids]
+        if category == "All Categories":
+            productive = categories != "Break"
+        else:
+            productive = categories == category
+        program_codes = pd.factorize(df["program_name"])[0][session_ids]
+
+        tracked = np.bincount(day_index, weights=hi - lo, minlength=day_count) / 60
+
+        first, block_start, block_end, covered = merge_intervals(
+            lo[productive], hi[productive], max_gap_seconds, groups=day_index[productive]
         )
+        span = block_end - block_start
+        keep = span >= min_block_seconds
+        block_day = day_index[productive][first[keep]]
+        focus = np.bincount(block_day, weights=covered[keep], minlength=day_count) / 60
+        blocks = np.bincount(block_day, minlength=day_count)
+        longest = np.zeros(day_count)
+        np.maximum.at(longest, block_day, span[keep] / 60)
+
+        switch = run_starts(program_codes, day_index) & ~run_starts(day_index)
+        switch_hours = np.searchsorted(hour_edges, lo[switch], side="right") - 1
+        switch_grid = np.zeros((day_count, 24), dtype=np.int64)
+        np.add.at(switch_grid, (switch_hours // 24, switch_hours % 24), 1)
+
+        for i, day in enumerate(days):
+            result[day] = {
+                "tracked_minutes": float(tracked[i]),
+                "focus_minutes": float(focus[i]),
+                "blocks": int(blocks[i]),
+                "longest_block_minutes": float(longest[i]),
+                "switches": int(switch_grid[i].sum()),
+                "switches_by_hour": switch_grid[i],
+            }
+        return result
+
+    def get_focus_report(
+        self,
+        start: date | str | None = None,
+        end: date | str | None = None,
+        category: str = "All Categories",
+        max_interruption_minutes: float = FOCUS_DEFAULT_MAX_INTERRUPTION_MINUTES,
+        min_block_minutes: float = FOCUS_DEFAULT_MIN_BLOCK_MINUTES,
+    ) -> dict:
+        """Deep-work blocks, daily focus streaks and context switches per hour.
+
+        A block is a run of ``category`` sessions ("All Categories" meaning
+        everything but Break) whose interruptions are at most
+        ``max_interruption_minutes`` long and which spans at least
+        ``min_block_minutes``. Closed days are cached per history version.
+        """
+        try:
+            start_day = parse_day(start)
+            end_day = parse_day(end) or date.today()
+            max_gap = float(max_interruption_minutes)
+            min_block = float(min_block_minutes)
+        except (TypeError, ValueError) as exc:
+            return {"status": "error", "message": str(exc)}
+        if max_gap < 0 or min_block < 0:
+            return {"status": "error", "message": "Thresholds must not be negative."}
+
+        today = date.today()
+        key = (
+            "focus",
+            category,
+            start_day,
+            end_day,
+            max_gap,
+            min_block,
+            today,
+            self._data_version(),
+        )
+        cached = self._cached_payload(key)
+        if cached is not None:
+            return cached
+
+        if start_day is None:
+            bounds = self.logger.get_day_bounds()
+            if bounds is None:
+                return {"status": "error", "message": "No data available to display."}
+            start_day = bounds[0]
+        if start_day > end_day:
+            return {"status": "error", "message": "Start date is after end date."}
+
+        per_day = self._per_day(
+            ("focus", category, max_gap, min_block),
+            start_day,
+            end_day,
+            today,
+            lambda first_day, day_count: self._compute_focus(
+                first_day, day_count, category, max_gap * 60, min_block * 60
+            ),
+        )
+
+        days = []
+        switches_by_hour = np.zeros(24, dtype=np.int64)
+        longest_streak = current_streak = 0
+        best_day = None
+        for day in sorted(per_day):
+            stats = per_day[day]
+            switches_by_hour += stats["switches_by_hour"]
+            current_streak = current_streak + 1 if stats["blocks"] else 0
+            longest_streak = max(longest_streak, current_streak)
+            if stats["blocks"] and (
+                best_day is None
+                or stats["longest_block_minutes"] > best_day["longest_block_minutes"]
+            ):
+                best_day = {"day": day_key(day), **stats}
+            tracked_hours = stats["tracked_minutes"] / 60
+            days.append(
+                {
+                    "day": day_key(day),
+                    "focus_minutes": round(stats["focus_minutes"], 1),
+                    "focus": format_time_display(stats["focus_minutes"]),
+                    "blocks": stats["blocks"],
+                    "longest_block_minutes": round(stats["longest_block_minutes"], 1),
+                    "switches": stats["switches"],
+                    "switches_per_hour": (
+                        round(stats["switches"] / tracked_hours, 2) if tracked_hours else 0.0
+                    ),
+                }
+            )
+
+        focus_total = sum(per_day[day]["focus_minutes"] for day in per_day)
+        tracked_total = sum(per_day[day]["tracked_minutes"] for day in per_day)
+        return self._store_payload(
+            key,
+            {
+                "status": "success",
+                "display_name": category if category != "All Categories" else "Productive",
+                "start": day_key(start_day),
+                "end": day_key(end_day),
+                "max_interruption_minutes": max_gap,
+                "min_block_minutes": min_block,
+                "days": days,
+                "totals": {
+                    "focus_minutes": round(focus_total, 1),
+                    "focus": format_time_display(focus_total),
+                    "focus_share": (
+                        round(focus_total / tracked_total * 100, 1) if tracked_total else 0.0
+                    ),
+                    "blocks": sum(day["blocks"] for day in days),
+                    "longest_block_minutes": (
+                        round(best_day["longest_block_minutes"], 1) if best_day else 0.0
+                    ),
+                    "longest_block_day": best_day["day"] if best_day else None,
+                    "longest_streak_days": longest_streak,
+                    "switches": int(switches_by_hour.sum()),
+                    "switches_by_hour": switches_by_hour.tolist(),
+                },
+            },
+        )
+
+    @tracing.traced("graph")
+    def _build_graph_data(
+        self, filter_category: str, today: date, df_today: pd.DataFrame
+    ) -> dict:
+        history = self._history_summary(today)
+        if history["category_minutes"].empty and df_today.empty:
+            return {"status": "error", "message": "No data available to display."}
+
+        top_programs = self.get_top_programs(filter_category)
+        available_categories = ["All Categories"] + self.logger.get_CATEGORIES()
+
+        return {
+            "status": "success",
+            "top_programs": top_programs.get("items", []),
+            "top_programs_has_more": top_programs.get("has_more", False),
+            "available_categories": available_categories,
+            **self._chart_and_stats(filter_category, history, df_today),
+        }
+
+    def _chart_and_stats(
+        self, filter_category: str, history: dict[str, Any], df_today: pd.DataFrame
+    ) -> dict:
+        """The payload fields that depend on today's minutes."""
+        stats = self._compute_stats(df_today, history, filter_category)
 
-        total_time_today = df_today["total_time_minutes"].sum()
         cat_time_today = df_today.groupby("category")["total_time_minutes"].sum()
+        total_time_today = cat_time_today.sum()
         cat_perc_today = (
             (cat_time_today / total_time_today * 100)
             if total_time_today > 0
             else pd.Series(dtype="float64")
         )
 
-        total_time_overall = df_overall["total_time_minutes"].sum()
-        cat_time_overall = df_overall.groupby("category")["total_time_minutes"].sum()
+        cat_time_overall = history["category_minutes"].add(cat_time_today, fill_value=0)
+        total_time_overall = cat_time_overall.sum()
         cat_perc_overall = (
             (cat_time_overall / total_time_overall * 100)
             if total_time_overall > 0
@@ -174,13 +796,8 @@ class GraphService:
             CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(all_categories))
         ]
 
-        available_categories = ["All Categories"] + self.logger.get_CATEGORIES()
-
         return {
-            "status": "success",
             "stats": stats,
-            "top_programs": self.get_top_ten_programs(df_overall),
-            "available_categories": available_categories,
             "chart": {
                 "labels": list(all_categories),
                 "today_values": [round(float(v), 1) for v in cat_perc_today],
@@ -0,0 +1,289 @@
+"""Bulk import of session logs from CSV and JSON Lines files."""
+
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import pandas as pd
+
+from utils import config, db_utils, tracing
+from utils.app_logger import app_logger
+from models.logger_service import ALL_LOGGED_COLUMNS
+
+IMPORT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+SESSION_COLUMNS = [column for column in ALL_LOGGED_COLUMNS if column != "id"]
+# Headers of the CSV logs written before the SQLite database existed.
+COLUMN_ALIASES = {
+    "date": "date_text",
+    "program": "program_name",
+    "window": "window_title",
+    "start_time": "start_time_text",
+    "end_time": "end_time_text",
+    "total_time": "total_time_minutes",
+}
+# A session of the same program starting this close to an existing one is a duplicate.
+DEDUPE_TOLERANCE_SECONDS = 0.5
+
+# Called with (files finished, files total, rows read so far).
+ImportProgress = Callable[[int, int, int], None]
+
+_COLUMN_LIST = ", ".join(SESSION_COLUMNS)
+_PLACEHOLDERS = ", ".join("?" for _ in SESSION_COLUMNS)
+_FILE_DONE = object()
+
+
+def expand_paths(paths: Iterable[str | Path]) -> list[Path]:
+    """Files as given; directories contribute their importable files, sorted."""
+    files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(
+                sorted(child for child in path.iterdir() if child.suffix.lower() in IMPORT_FORMATS)
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def format_for_import(path: str | Path) -> str:
+    fmt = IMPORT_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Cannot import {path}: expected .csv, .jsonl or .ndjson")
+    return fmt
+
+
+def _read_raw(path: Path, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    if format_for_import(path) == "csv":
+        reader = pd.read_csv(
+            path, chunksize=chunk_rows, dtype=str, keep_default_na=False, encoding="utf-8-sig"
+        )
+    else:
+        reader = pd.read_json(
+            path, lines=True, chunksize=chunk_rows, dtype=False, convert_dates=False
+        )
+    with reader:
+        yield from reader
+
+
+def _text(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame:
+        return pd.Series(pd.NA, index=frame.index, dtype="string")
+    values = frame[column].astype("string").str.strip()
+    return values.mask(values == "")
+
+
+def _number(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame:
+        return pd.Series(float("nan"), index=frame.index)
+    return pd.to_numeric(frame[column], errors="coerce")
+
+
+def _local_midnights(dates: pd.Series) -> pd.Series:
+    """Epoch of local midnight for each ``DD/MM/YYYY`` string (parsed once per day)."""
+    midnights = {}
+    for text in dates.dropna().unique():
+        try:
+            midnights[text] = datetime.strptime(text, "%d/%m/%Y").timestamp()
+        except ValueError:
+            continue
+    return dates.map(midnights).astype(float)
+
+
+def _local_texts(epochs: pd.Series) -> tuple[pd.Series, pd.Series]:
+    stamps = [time.localtime(epoch) for epoch in epochs]
+    return (
+        pd.Series([time.strftime("%d/%m/%Y", s) for s in stamps], index=epochs.index),
+        pd.Series([time.strftime("%H:%M:%S", s) for s in stamps], index=epochs.index),
+    )
+
+
+def normalize_chunk(raw: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """Map one raw chunk onto ``time_entries`` columns; returns ``(rows, invalid count)``.
+
+    Epochs missing from legacy logs are derived from the date and clock
+    columns (one ``strptime`` per distinct day, vectorized otherwise);
+    sessions that end past midnight roll over to the next day. Rows without
+    a program or a usable start/end are dropped and counted as invalid.
+    JSON Lines correction records from incremental exports are ignored.
+    """
+    frame = raw.rename(columns=COLUMN_ALIASES)
+    if "record" in frame:
+        record = _text(frame, "record")
+        frame = frame[record.isna() | (record == "session")]
+    received = len(frame)
+
+    date_text = _text(frame, "date_text")
+    start_text = _text(frame, "start_time_text")
+    end_text = _text(frame, "end_time_text")
+    start = _number(frame, "start_timestamp_epoch")
+    end = _number(frame, "end_timestamp_epoch")
+
+    derive = start.isna() | end.isna()
+    if derive.any():
+        midnight = _local_midnights(date_text[derive])
+        start_seconds = pd.to_timedelta(start_text[derive], errors="coerce").dt.total_seconds()
+        end_seconds = pd.to_timedelta(end_text[derive], errors="coerce").dt.total_seconds()
+        end_seconds = end_seconds.where(end_seconds >= start_seconds, end_seconds + 86400)
+        start = start.fillna(midnight + start_seconds)
+        end = end.fillna(midnight + end_seconds)
+
+    describe = (date_text.isna() | start_text.isna() | end_text.isna()) & start.notna()
+    if describe.any():
+        start_day, start_clock = _local_texts(start[describe])
+        _, end_clock = _local_texts(end[describe].fillna(start[describe]))
+        date_text = date_text.fillna(start_day)
+        start_text = start_text.fillna(start_clock)
+        end_text = end_text.fillna(end_clock)
+
+    minutes = _number(frame, "total_time_minutes")
+    minutes = minutes.fillna(((end - start) / 60).round(2))
+    program = _text(frame, "program_name")
+    rows = pd.DataFrame(
+        {
+            "date_text": date_text,
+            "program_name": program,
+            "window_title": _text(frame, "window_title"),
+            "category": _text(frame, "category").fillna("Misc"),
+            "start_time_text": start_text,
+            "end_time_text": end_text,
+            "total_time_minutes": minutes,
+            "start_timestamp_epoch": start,
+            "end_timestamp_epoch": end,
+        }
+    )
+    valid = program.notna() & start.notna() & end.notna() & (end >= start) & minutes.notna()
+    rows = rows[valid].astype(object)
+    return rows.where(rows.notna(), None), received - len(rows)
+
+
+def _insert_chunk(conn: sqlite3.Connection, rows: pd.DataFrame) -> int:
+    """Insert ``rows`` that do not duplicate a stored session; returns the count."""
+    with tracing.span("import_chunk", "writer", rows=len(rows)), db_utils.deferred_rollup(conn):
+        conn.execute("DELETE FROM temp.import_staging")
+        conn.executemany(
+            f"INSERT OR IGNORE INTO temp.import_staging ({_COLUMN_LIST}) "
+            f"VALUES ({_PLACEHOLDERS})",
+            rows.itertuples(index=False, name=None),
+        )
+        cursor = conn.execute(
+            f"INSERT INTO time_entries ({_COLUMN_LIST}) "
+            f"SELECT {_COLUMN_LIST} FROM temp.import_staging AS s "
+            "WHERE NOT EXISTS (SELECT 1 FROM time_entries AS t "
+            "WHERE t.start_timestamp_epoch BETWEEN s.start_timestamp_epoch - ? "
+            "AND s.start_timestamp_epoch + ? AND t.program_name = s.program_name) "
+            "ORDER BY s.start_timestamp_epoch",
+            (DEDUPE_TOLERANCE_SECONDS, DEDUPE_TOLERANCE_SECONDS),
+        )
+        return cursor.rowcount
+
+
+def import_files(
+    paths: Iterable[str | Path],
+    max_workers: int = config.IMPORT_MAX_WORKERS,
+    chunk_rows: int = config.IMPORT_CHUNK_ROWS,
+    progress: ImportProgress | None = None,
+) -> dict[str, Any]:
+    """Stream session logs into ``time_entries``, skipping sessions already stored.
+
+    Up to ``max_workers`` threads parse files chunk by chunk into a bounded
+    queue while this thread writes each chunk in its own transaction, so
+    memory stays at a few chunks however large the inputs are. Returns
+    totals plus a per-file breakdown; a file that fails to parse is
+    reported under ``errors`` and the others still import.
+    """
+    files = expand_paths(paths)
+    for path in files:
+        format_for_import(path)
+    began = time.perf_counter()
+    per_file = {
+        str(path): {"read": 0, "inserted": 0, "duplicates": 0, "invalid": 0} for path in files
+    }
+    errors: dict[str, str] = {}
+    chunks: queue.Queue = queue.Queue(maxsize=max(2, max_workers * 2))
+    stop = threading.Event()
+
+    def put(item: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(path: Path) -> None:
+        try:
+            for raw in _read_raw(path, chunk_rows):
+                if not put((path, *normalize_chunk(raw))):
+                    return
+        except Exception as exc:
+            app_logger.error(f"Failed to read {path} for import", exc_info=True)
+            errors[str(path)] = str(exc)
+        finally:
+            put((path, _FILE_DONE, 0))
+
+    files_done = rows_read = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        try:
+            with db_utils.get_db_connection() as conn:
+                conn.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS import_staging ({_COLUMN_LIST}, "
+                    "UNIQUE (program_name, start_timestamp_epoch))"
+                )
+                for path in files:
+                    pool.submit(read, path)
+                while files_done < len(files):
+                    path, rows, invalid = chunks.get()
+                    if rows is _FILE_DONE:
+                        files_done += 1
+                        if progress:
+                            progress(files_done, len(files), rows_read)
+                        continue
+                    stats = per_file[str(path)]
+                    inserted = _insert_chunk(conn, rows) if len(rows) else 0
+                    stats["read"] += len(rows) + invalid
+                    stats["invalid"] += invalid
+                    stats["inserted"] += inserted
+                    stats["duplicates"] += len(rows) - inserted
+                    rows_read += len(rows) + invalid
+        finally:
+            stop.set()
+
+    totals = {
+        key: sum(stats[key] for stats in per_file.values())
+        for key in ("read", "inserted", "duplicates", "invalid")
+    }
+    result = {
+        **totals,
+        "files": len(files),
+        "seconds": round(time.perf_counter() - began, 3),
+        "per_file": per_file,
+        "errors": errors,
+    }
+    app_logger.info(
+        f"Imported {totals['inserted']} of {totals['read']} sessions from {len(files)} files "
+        f"({totals['duplicates']} duplicates, {totals['invalid']} invalid) "
+        f"in {result['seconds']}s"
+    )
+    return result
+
+
+def import_program_categories(path: str | Path) -> int:
+    """Add ``{program: category}`` mappings from a JSON file, keeping existing ones."""
+    mapping = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(mapping, dict):
+        raise ValueError(f"{path} must contain a JSON object of program -> category")
+    with db_utils.get_db_connection() as conn:
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO program_categories (program_name, category) VALUES (?, ?)",
+            [(str(program), str(category)) for program, category in mapping.items()],
+        )
+        return cursor.rowcount
@@ -2,35 +2,152 @@
 
 from __future__ import annotations
 
+import numbers
 import sqlite3
+import threading
 import time
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import pandas as pd
 
-from utils import config
+from utils import config, db_utils, tracing
 from utils.app_logger import app_logger
 from utils.db_utils import get_db_connection
+from models import report_engine, stats_queries
+from models.today_aggregator import TodayAggregator
+
+PROGRAM_LIST_SORTS = {
+    "name": "pc.program_name COLLATE NOCASE",
+    "category": "pc.category COLLATE NOCASE, pc.program_name COLLATE NOCASE",
+    "total_time": "total_minutes",
+}
+PROGRAM_LIST_MAX_LIMIT = 500
+# Sessions overlapping a window may start this long before it.
+# Range bound: epoch seconds, datetime, date, or DD/MM/YYYY / ISO date string.
+DateBound = numbers.Real | date | datetime | str | None
+ALL_LOGGED_COLUMNS = (
+    "id",
+    "date_text",
+    "program_name",
+    "window_title",
+    "category",
+    "start_time_text",
+    "end_time_text",
+    "total_time_minutes",
+    "start_timestamp_epoch",
+    "end_timestamp_epoch",
+)
+COMPACT_DTYPES = {
+    "date_text": "category",
+    "program_name": "category",
+    "category": "category",
+    "total_time_minutes": "float32",
+}
 
 
 class LoggerService:
     def __init__(self) -> None:
+        self._version_lock = threading.Lock()
+        self.data_version = 0
+        self.history_version = 0
+        self._category_summary_cache: tuple[int, list[dict]] | None = None
+        self.today_totals = TodayAggregator()
         self.category_map = self._load_program_categories_from_db()
         self.CATEGORIES: set[str] = set()
         for category_value in self.category_map.values():
             if isinstance(category_value, str) and category_value.strip():
                 self.CATEGORIES.add(category_value)
+        # (max entry id, category change version, correction seq) last accounted for.
+        self._db_fingerprint = self._read_db_fingerprint()
         app_logger.info(
             f"LoggerService initialized. Categories loaded from DB: {len(self.CATEGORIES)}"
         )
 
+    def _bump_data_version(self, history: bool = False) -> None:
+        """Advance ``data_version``; ``history`` also marks closed days as changed."""
+        with self._version_lock:
+            self.data_version += 1
+            if history:
+                self.history_version += 1
+
+    @staticmethod
+    def _read_db_fingerprint() -> tuple[int, int, int] | None:
+        """Counters that move with every write to entries, categories or corrections."""
+        sql = (
+            "SELECT (SELECT COALESCE(MAX(id), 0) FROM time_entries), "
+            "(SELECT COALESCE(MAX(version), 0) FROM program_category_changes), "
+            "(SELECT COALESCE(MAX(seq), 0) FROM entry_corrections)"
+        )
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    return tuple(int(value) for value in conn.execute(sql).fetchone())
+                except sqlite3.Error:
+                    app_logger.error("Failed to read database fingerprint", exc_info=True)
+        return None
+
+    def refresh_from_database(self) -> bool:
+        """Pick up writes made by other processes; True if anything changed.
+
+        ``data_version`` only moves for writes made through this instance, so
+        a server that does not track, or an app running next to ``cli.py
+        import``, calls this before answering reads. New sessions from closed
+        days and recategorizations also advance ``history_version``.
+        """
+        current = self._read_db_fingerprint()
+        with self._version_lock:
+            seen = self._db_fingerprint
+            if current is None or current == seen:
+                return False
+            self._db_fingerprint = current
+        if seen is None:
+            return False
+        max_id, category_version, correction_seq = current
+        history = correction_seq != seen[2]
+        if max_id != seen[0]:
+            today_start = datetime.combine(date.today(), datetime.min.time()).timestamp()
+            with get_db_connection() as conn:
+                if conn:
+                    try:
+                        row = conn.execute(
+                            "SELECT MIN(start_timestamp_epoch) FROM time_entries WHERE id > ?",
+                            (seen[0],),
+                        ).fetchone()
+                        history = history or (row[0] is not None and row[0] < today_start)
+                    except sqlite3.Error:
+                        history = True
+        if category_version != seen[1]:
+            categories = self._load_program_categories_from_db()
+            # Updated in place: the tracker holds a reference to this mapping.
+            self.category_map.clear()
+            self.category_map.update(categories)
+            self.CATEGORIES |= {
+                value for value in categories.values() if isinstance(value, str) and value.strip()
+            }
+        if max_id != seen[0] or history:
+            self.today_totals.invalidate()
+        self._bump_data_version(history=history)
+        app_logger.info(
+            "Picked up external database changes (history changed: %s)", history
+        )
+        return True
+
+    def _account_own_insert(self, entry_id: int | None) -> None:
+        """Advance the fingerprint past a row this instance wrote, if nothing came between."""
+        with self._version_lock:
+            seen = self._db_fingerprint
+            if seen is not None and entry_id is not None and entry_id == seen[0] + 1:
+                self._db_fingerprint = (entry_id, *seen[1:])
+
     def get_CATEGORIES(self) -> list[str]:
         return sorted(self.CATEGORIES)
 
     def get_program_categories(self) -> dict[str, str]:
         return dict(self.category_map)
 
+    @tracing.traced("writer")
     def log_activity(
         self,
         program: str,
@@ -44,14 +161,13 @@ class LoggerService:
         end_time_str = time.strftime("%H:%M:%S", time.localtime(end_time_epoch))
         total_time_minutes = round(total_time_seconds / 60, 2)
         category = self.category_map.get(program, "Misc")
-        percent_text_placeholder = "0%"
 
         sql = """
             INSERT INTO time_entries
             (date_text, program_name, window_title, category,
              start_time_text, end_time_text, total_time_minutes,
-             start_timestamp_epoch, end_timestamp_epoch, percent_text)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             start_timestamp_epoch, end_timestamp_epoch)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         params = (
             current_date_str,
@@ -63,7 +179,6 @@ class LoggerService:
             total_time_minutes,
             start_time_epoch,
             end_time_epoch,
-            percent_text_placeholder,
         )
         with get_db_connection() as conn:
             if conn:
@@ -71,8 +186,18 @@ class LoggerService:
                     cursor = conn.cursor()
                     cursor.execute(sql, params)
                     conn.commit()
+                    self._account_own_insert(cursor.lastrowid)
+                    self._bump_data_version(
+                        history=current_date_str != time.strftime("%d/%m/%Y")
+                    )
+                    self.today_totals.add_session(
+                        program, category, start_time_epoch, end_time_epoch
+                    )
                     app_logger.debug(
-                        f"Activity logged: Prog={program}, Cat={category}, TotalMin={total_time_minutes}"
+                        "Activity logged: Prog=%s, Cat=%s, TotalMin=%s",
+                        program,
+                        category,
+                        total_time_minutes,
                     )
                 except sqlite3.Error:
                     app_logger.error("Failed to log activity to database", exc_info=True)
@@ -99,8 +224,8 @@ class LoggerService:
 
     def save_program_category_to_db(self, program_name: str, category: str) -> bool:
         sql = (
-            "INSERT OR REPLACE INTO program_categories (program_name, category) "
-            "VALUES (?, ?)"
+            "INSERT INTO program_categories (program_name, category) VALUES (?, ?) "
+            "ON CONFLICT(program_name) DO UPDATE SET category = excluded.category"
         )
         success = False
         with get_db_connection() as conn:
@@ -114,6 +239,7 @@ class LoggerService:
                     )
                     self.category_map[program_name] = category
                     self.CATEGORIES.add(category)
+                    self._bump_data_version()
                     success = True
                 except sqlite3.Error:
                     app_logger.error(
@@ -131,16 +257,136 @@ class LoggerService:
                 saved += 1
         return saved
 
+    def get_program_categories_version(self) -> int:
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    row = conn.execute(
+                        "SELECT COALESCE(MAX(version), 0) FROM program_category_changes"
+                    ).fetchone()
+                    return int(row[0])
+                except sqlite3.Error:
+                    app_logger.error(
+                        "Failed to read program category version", exc_info=True
+                    )
+        return 0
+
+    def get_program_category_changes(
+        self, since_version: int
+    ) -> tuple[dict[str, str | None], int]:
+        """Latest mapping per program changed after ``since_version``.
+
+        A ``None`` category means the mapping was deleted.
+        """
+        changes: dict[str, str | None] = {}
+        version = int(since_version)
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    cursor = conn.execute(
+                        "SELECT version, program_name, category "
+                        "FROM program_category_changes WHERE version > ? "
+                        "ORDER BY version ASC",
+                        (int(since_version),),
+                    )
+                    for row in cursor:
+                        changes[row["program_name"]] = row["category"]
+                        version = int(row["version"])
+                except sqlite3.Error:
+                    app_logger.error(
+                        "Failed to read program category changes", exc_info=True
+                    )
+        return changes, version
+
+    def list_program_categories(
+        self,
+        prefix: str = "",
+        category: str | None = None,
+        sort: str = "name",
+        descending: bool = False,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> dict:
+        """One page of program mappings, filtered and sorted in SQL."""
+        order_by = PROGRAM_LIST_SORTS.get(sort, PROGRAM_LIST_SORTS["name"])
+        if descending:
+            order_by = ", ".join(f"{part} DESC" for part in order_by.split(", "))
+        limit = max(1, min(int(limit), PROGRAM_LIST_MAX_LIMIT))
+        offset = max(0, int(offset))
+
+        conditions: list[str] = []
+        params: list[str] = []
+        if prefix:
+            escaped = (
+                prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            conditions.append("pc.program_name LIKE ? ESCAPE '\\'")
+            params.append(escaped + "%")
+        if category:
+            conditions.append("pc.category = ?")
+            params.append(category)
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+
+        if sort == "total_time":
+            source = (
+                "program_categories pc LEFT JOIN ("
+                "SELECT program_name, SUM(total_minutes) AS total_minutes "
+                "FROM daily_rollup GROUP BY program_name"
+                ") t ON t.program_name = pc.program_name"
+            )
+            total_expr = "COALESCE(t.total_minutes, 0)"
+        else:
+            source = "program_categories pc"
+            total_expr = (
+                "(SELECT COALESCE(SUM(r.total_minutes), 0) FROM daily_rollup r "
+                "WHERE r.program_name = pc.program_name)"
+            )
+        page_sql = (
+            f"SELECT pc.program_name, pc.category, {total_expr} AS total_minutes "
+            f"FROM {source}{where} ORDER BY {order_by} LIMIT ? OFFSET ?"
+        )
+        count_sql = f"SELECT COUNT(*) FROM program_categories pc{where}"
+
+        items: list[dict] = []
+        total = 0
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    total = int(conn.execute(count_sql, params).fetchone()[0])
+                    for row in conn.execute(page_sql, [*params, limit, offset]):
+                        items.append(
+                            {
+                                "program_name": row["program_name"],
+                                "category": row["category"],
+                                "total_minutes": round(float(row["total_minutes"]), 2),
+                            }
+                        )
+                except sqlite3.Error:
+                    app_logger.error("Failed to list program categories", exc_info=True)
+        return {"items": items, "total": total, "offset": offset, "limit": limit}
+
     def update_categories_in_log_entries(
         self, program_name: str, new_category: str
     ) -> None:
-        sql = "UPDATE time_entries SET category = ? WHERE program_name = ?"
+        sql = (
+            "UPDATE time_entries SET category = ? "
+            "WHERE program_name = ? AND category IS NOT ?"
+        )
         with get_db_connection() as conn:
             if conn:
                 try:
                     cursor = conn.cursor()
-                    cursor.execute(sql, (new_category, program_name))
+                    cursor.execute(sql, (new_category, program_name, new_category))
+                    if cursor.rowcount:
+                        # Incremental exports replay this onto sessions they already wrote.
+                        conn.execute(
+                            "INSERT INTO entry_corrections (program_name, category, max_entry_id) "
+                            "SELECT ?, ?, MAX(id) FROM time_entries",
+                            (program_name, new_category),
+                        )
                     conn.commit()
+                    self._bump_data_version(history=True)
+                    self.today_totals.invalidate()
                     app_logger.info(
                         f"Updated category to '{new_category}' for '{program_name}'. "
                         f"Rows: {cursor.rowcount}"
@@ -150,67 +396,375 @@ class LoggerService:
                         "Failed to update categories in time_entries", exc_info=True
                     )
 
+    def get_entry_corrections(self, since_seq: int = 0) -> list[dict]:
+        """Recategorizations recorded after ``since_seq``, oldest first."""
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    rows = conn.execute(
+                        "SELECT seq, program_name, category, max_entry_id "
+                        "FROM entry_corrections WHERE seq > ? ORDER BY seq",
+                        (int(since_seq),),
+                    ).fetchall()
+                    return [dict(row) for row in rows]
+                except sqlite3.Error:
+                    app_logger.error("Failed to read entry corrections", exc_info=True)
+        return []
+
+    def get_export_watermark(self, target: str) -> dict:
+        """Last session id and correction seq written to ``target`` (zeros if new)."""
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    row = conn.execute(
+                        "SELECT last_entry_id, last_correction_seq, last_end_epoch "
+                        "FROM export_watermarks WHERE target = ?",
+                        (target,),
+                    ).fetchone()
+                    if row:
+                        return dict(row)
+                except sqlite3.Error:
+                    app_logger.error("Failed to read export watermark", exc_info=True)
+        return {"last_entry_id": 0, "last_correction_seq": 0, "last_end_epoch": None}
+
+    def set_export_watermark(
+        self,
+        target: str,
+        last_entry_id: int,
+        last_correction_seq: int,
+        last_end_epoch: float | None,
+    ) -> None:
+        sql = (
+            "INSERT INTO export_watermarks "
+            "(target, last_entry_id, last_correction_seq, last_end_epoch, updated_at) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT(target) DO UPDATE SET "
+            "last_entry_id = excluded.last_entry_id, "
+            "last_correction_seq = excluded.last_correction_seq, "
+            "last_end_epoch = excluded.last_end_epoch, updated_at = excluded.updated_at"
+        )
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    conn.execute(
+                        sql,
+                        (target, last_entry_id, last_correction_seq, last_end_epoch, time.time()),
+                    )
+                    conn.commit()
+                except sqlite3.Error:
+                    app_logger.error("Failed to save export watermark", exc_info=True)
+                    raise
+
+    @staticmethod
+    def _bound_epoch(value: DateBound, is_end: bool) -> float | None:
+        """Epoch for a range bound; whole days extend an end bound to midnight.
+
+        Real numbers, numpy scalars included, are taken as epochs, datetimes
+        as instants, and dates or ``DD/MM/YYYY``/ISO strings as whole local
+        days. Invalid strings are logged and ignored.
+        """
+        if value is None or value == "":
+            return None
+        if isinstance(value, numbers.Real) and not isinstance(value, bool):
+            return float(value)
+        if isinstance(value, datetime):
+            return value.timestamp()
+        try:
+            day = stats_queries.parse_day(value)
+        except ValueError:
+            app_logger.warning(f"Invalid date bound: {value}")
+            return None
+        if is_end:
+            day += timedelta(days=1)
+        return datetime.combine(day, datetime.min.time()).timestamp()
+
+    @classmethod
+    def _date_range_epochs(
+        cls, start: DateBound, end: DateBound
+    ) -> tuple[float | None, float | None]:
+        """``[start, end)`` start-epoch bounds; ``None`` leaves a side open."""
+        return cls._bound_epoch(start, False), cls._bound_epoch(end, True)
+
+    @classmethod
+    def _date_range_conditions(
+        cls, start: DateBound, end: DateBound
+    ) -> tuple[list[str], list[float]]:
+        """WHERE clauses on the start epoch for a date range."""
+        return cls._epoch_conditions(*cls._date_range_epochs(start, end))
+
+    @staticmethod
+    def _epoch_conditions(
+        start_epoch: float | None, end_epoch: float | None
+    ) -> tuple[list[str], list[float]]:
+        params: list[float] = []
+        conditions: list[str] = []
+        if start_epoch is not None:
+            conditions.append("start_timestamp_epoch >= ?")
+            params.append(start_epoch)
+        if end_epoch is not None:
+            conditions.append("start_timestamp_epoch < ?")
+            params.append(end_epoch)
+        return conditions, params
+
+    @staticmethod
+    def _as_filter(values: str | Iterable[str] | None) -> tuple[str, ...] | None:
+        if values is None:
+            return None
+        return (values,) if isinstance(values, str) else tuple(values)
+
     def get_all_logged_data(
-        self, start_date_str: str | None = None, end_date_str: str | None = None
+        self,
+        start: DateBound = None,
+        end: DateBound = None,
+        columns: Iterable[str] | None = None,
+        category: str | Iterable[str] | None = None,
+        program: str | Iterable[str] | None = None,
+        limit: int | None = None,
     ) -> pd.DataFrame:
-        app_logger.info(
-            f"Fetching logged data. Start: {start_date_str}, End: {end_date_str}"
+        """Sessions whose start epoch lies in ``[start, end)``, filtered and projected in SQL.
+
+        Bounds may be epochs, datetimes, dates or date strings. Epochs and
+        datetimes are used as given, so ``end`` itself is excluded; a date
+        ``end`` becomes the following midnight, which includes that whole
+        day. Program, category and date text come back as categoricals and
+        ``total_time_minutes`` as float32.
+        """
+        app_logger.debug("Fetching logged data. Start: %s, End: %s", start, end)
+        selected = self._select_columns(columns)
+        categories = self._as_filter(category)
+        programs = self._as_filter(program)
+        start_epoch, end_epoch = self._date_range_epochs(start, end)
+        query, params = self._entries_query(
+            selected, start_epoch, end_epoch, categories, programs, limit
         )
-        query = (
-            "SELECT id, date_text, program_name, window_title, category, "
-            "start_time_text, end_time_text, total_time_minutes, "
-            "start_timestamp_epoch, end_timestamp_epoch, percent_text "
-            "FROM time_entries"
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    with tracing.span("read_sql_query", "sql") as span:
+                        raw = pd.read_sql_query(query, conn, params=params)
+                        span.set(rows=len(raw))
+                    with tracing.span("compact", "pandas"):
+                        df = self._compact(raw)
+                    app_logger.debug("Fetched %d log entries.", len(df))
+                    return df
+                except Exception:
+                    app_logger.error("Failed to fetch logged data", exc_info=True)
+        return pd.DataFrame(columns=list(selected))
+
+    def iter_entries(
+        self,
+        start: DateBound = None,
+        end: DateBound = None,
+        batch_size: int = config.ENTRY_BATCH_SIZE,
+        columns: Iterable[str] | None = None,
+        category: str | Iterable[str] | None = None,
+        program: str | Iterable[str] | None = None,
+        after_id: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield sessions in start order as DataFrames of at most ``batch_size`` rows.
+
+        Rows are pulled from an open cursor with ``fetchmany``, so memory use
+        depends on the batch size rather than on the size of the range.
+        Takes the same bounds and filters as ``get_all_logged_data``, plus
+        ``after_id`` to skip sessions already seen by an incremental reader.
+        """
+        selected = self._select_columns(columns)
+        batch_size = max(1, int(batch_size))
+        query, params = self._entries_query(
+            selected,
+            *self._date_range_epochs(start, end),
+            self._as_filter(category),
+            self._as_filter(program),
+            after_id=after_id,
         )
-        params: list[float] = []
-        conditions: list[str] = []
-        if start_date_str:
-            try:
-                start_epoch = datetime.strptime(
-                    start_date_str + " 00:00:00", "%d/%m/%Y %H:%M:%S"
-                ).timestamp()
-                conditions.append("start_timestamp_epoch >= ?")
-                params.append(start_epoch)
-            except ValueError:
-                app_logger.warning(f"Invalid start_date_str: {start_date_str}")
-        if end_date_str:
-            try:
-                end_epoch = datetime.strptime(
-                    end_date_str + " 23:59:59", "%d/%m/%Y %H:%M:%S"
-                ).timestamp()
-                conditions.append("start_timestamp_epoch <= ?")
-                params.append(end_epoch)
-            except ValueError:
-                app_logger.warning(f"Invalid end_date_str: {end_date_str}")
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    cursor = conn.cursor()
+                    cursor.row_factory = None
+                    cursor.execute(query, params)
+                    while rows := cursor.fetchmany(batch_size):
+                        yield self._compact(pd.DataFrame.from_records(rows, columns=selected))
+                except sqlite3.Error:
+                    app_logger.error("Failed to stream time entries", exc_info=True)
+
+    @staticmethod
+    def _select_columns(columns: Iterable[str] | None) -> tuple[str, ...]:
+        selected = tuple(columns) if columns is not None else ALL_LOGGED_COLUMNS
+        unknown = set(selected) - set(ALL_LOGGED_COLUMNS)
+        if unknown or not selected:
+            raise ValueError(f"Unknown columns: {sorted(unknown) or 'none selected'}")
+        return selected
+
+    @classmethod
+    def _entries_query(
+        cls,
+        selected: tuple[str, ...],
+        start_epoch: float | None,
+        end_epoch: float | None,
+        categories: tuple[str, ...] | None = None,
+        programs: tuple[str, ...] | None = None,
+        limit: int | None = None,
+        after_id: int | None = None,
+    ) -> tuple[str, tuple]:
+        conditions, params = cls._epoch_conditions(start_epoch, end_epoch)
+        if after_id is not None:
+            conditions.append("id > ?")
+            params.append(int(after_id))
+        for column, values in (("category", categories), ("program_name", programs)):
+            if values is not None:
+                conditions.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
 
+        query = f"SELECT {', '.join(selected)} FROM time_entries"
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY start_timestamp_epoch ASC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(max(0, int(limit)))
+        return query, tuple(params)
 
+    @staticmethod
+    def _compact(df: pd.DataFrame) -> pd.DataFrame:
+        return df.astype(
+            {column: dtype for column, dtype in COMPACT_DTYPES.items() if column in df.columns}
+        )
+
+    def get_sessions_between(self, start_epoch: float, end_epoch: float) -> pd.DataFrame:
+        """Sessions overlapping ``[start_epoch, end_epoch)``, ordered by start.
+
+        Sessions that started before ``start_epoch`` are found by looking back
+        as far as the longest recorded session (``session_stats``), so the
+        start-epoch index still bounds the scan.
+        """
+        query = (
+            "SELECT program_name, category, start_timestamp_epoch, end_timestamp_epoch "
+            "FROM time_entries WHERE start_timestamp_epoch >= ? - "
+            "(SELECT max_session_seconds FROM session_stats WHERE id = 1) "
+            "AND start_timestamp_epoch < ? AND end_timestamp_epoch > ? "
+            "ORDER BY start_timestamp_epoch ASC"
+        )
+        params = (start_epoch, end_epoch, start_epoch)
         with get_db_connection() as conn:
             if conn:
                 try:
-                    df = pd.read_sql_query(query, conn, params=tuple(params))
-                    app_logger.info(f"Fetched {len(df)} log entries.")
-                    return df
-                except (sqlite3.Error, Exception):
-                    app_logger.error("Failed to fetch logged data", exc_info=True)
-        return pd.DataFrame()
+                    return pd.read_sql_query(query, conn, params=params)
+                except Exception:
+                    app_logger.error("Failed to fetch sessions", exc_info=True)
+        return pd.DataFrame(
+            columns=[
+                "program_name",
+                "category",
+                "start_timestamp_epoch",
+                "end_timestamp_epoch",
+            ]
+        )
+
+    def get_today_totals(self, today: date | None = None) -> dict[tuple[str, str], float]:
+        """Today's ``{(category, program): minutes}`` for closed sessions.
+
+        Served from the in-memory aggregator; the database is only read to
+        seed it at startup or after a recategorization.
+        """
+        today = today or date.today()
+        if not self.today_totals.is_valid(today):
+            day_start = datetime.combine(today, datetime.min.time()).timestamp()
+            day_end = datetime.combine(
+                today + timedelta(days=1), datetime.min.time()
+            ).timestamp()
+            df = self.get_sessions_between(day_start, day_end)
+            self.today_totals.seed(
+                today,
+                df[
+                    [
+                        "program_name",
+                        "category",
+                        "start_timestamp_epoch",
+                        "end_timestamp_epoch",
+                    ]
+                ].itertuples(index=False, name=None),
+            )
+        return self.today_totals.snapshot(today)
+
+    def get_day_bounds(self) -> tuple[date, date] | None:
+        """First and last day with logged time, from the daily rollup."""
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    return stats_queries.day_bounds(conn)
+                except sqlite3.Error:
+                    app_logger.error("Failed to read day bounds", exc_info=True)
+        return None
+
+    def get_daily_totals(
+        self,
+        start: date,
+        end: date,
+        category: str | None = None,
+        exclude_categories: Iterable[str] = (),
+    ) -> list[tuple[str, float]]:
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    return stats_queries.daily_totals(
+                        conn, start, end, category, exclude_categories
+                    )
+                except sqlite3.Error:
+                    app_logger.error("Failed to read daily totals", exc_info=True)
+        return []
+
+    def get_top_programs(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        category: str | None = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> list[tuple[str, str, float, int]]:
+        limit = max(1, min(int(limit), PROGRAM_LIST_MAX_LIMIT))
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    return stats_queries.top_programs(
+                        conn, start, end, category, limit=limit, offset=max(0, int(offset))
+                    )
+                except sqlite3.Error:
+                    app_logger.error("Failed to rank programs", exc_info=True)
+        return []
 
     def get_category_summary(self) -> list[dict]:
-        df = self.get_all_logged_data()
-        if df.empty or "category" not in df.columns:
-            return []
-        category_counts = df["category"].value_counts()
-        total = len(df)
-        return [
+        """Entry count per category, recomputed only when ``data_version`` moves."""
+        version = self.data_version
+        cached = self._category_summary_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        sql = (
+            "SELECT category, COUNT(*) AS entry_count FROM time_entries "
+            "GROUP BY category ORDER BY entry_count DESC, category ASC"
+        )
+        rows: list[tuple[str, int]] = []
+        with get_db_connection() as conn:
+            if conn:
+                try:
+                    rows = [
+                        (row["category"], int(row["entry_count"]))
+                        for row in conn.execute(sql)
+                    ]
+                except sqlite3.Error:
+                    app_logger.error("Failed to summarize categories", exc_info=True)
+                    return []
+        total = sum(count for _, count in rows)
+        summary = [
             {
                 "category": name,
-                "count": int(count),
+                "count": count,
                 "percentage": round((count / total) * 100, 1) if total else 0.0,
             }
-            for name, count in category_counts.items()
+            for name, count in rows
         ]
+        self._category_summary_cache = (version, summary)
+        return summary
 
     def export_to_csv(
         self,
@@ -218,53 +772,37 @@ class LoggerService:
         export_type: str = "all",
         start_date_str: str | None = None,
         end_date_str: str | None = None,
-    ) -> None:
+        max_workers: int = config.REPORT_MAX_WORKERS,
+        progress: report_engine.ProgressCallback | None = None,
+    ) -> int:
+        """Write minutes per (date, category) and return the row count.
+
+        Large ranges aggregate in parallel.
+        """
         app_logger.info(
             f"Exporting report to {file_path}. Type: {export_type}, "
             f"Start: {start_date_str}, End: {end_date_str}"
         )
+        start = end = None
         if export_type == "range":
-            data_for_report_df = self.get_all_logged_data(start_date_str, end_date_str)
-        else:
-            data_for_report_df = self.get_all_logged_data()
+            start = stats_queries.parse_day(start_date_str)
+            end = stats_queries.parse_day(end_date_str)
 
-        if data_for_report_df.empty:
+        rows = report_engine.daily_category_report(
+            db_utils.DATABASE_PATH, start, end, max_workers=max_workers, progress=progress
+        )
+        if not rows:
             raise ValueError("No data available for the selected criteria.")
 
-        summary_report_df = data_for_report_df.groupby(
-            ["date_text", "category"], as_index=False
-        )["total_time_minutes"].sum()
-        summary_report_df.to_csv(file_path, index=False)
+        pd.DataFrame(
+            rows, columns=["date_text", "category", "total_time_minutes"]
+        ).to_csv(file_path, index=False)
         app_logger.info(f"Report exported to {file_path}")
-
-    def calculate_session_percentages(self, df_input: pd.DataFrame) -> pd.DataFrame:
-        df = df_input.copy()
-        if df.empty or "total_time_minutes" not in df.columns:
-            df["percent_text"] = "0.00%"
-            return df
-        if "date_text" not in df.columns:
-            df["percent_text"] = "0.00%"
-            return df
-
-        df["session_total_time_minutes"] = df.groupby("date_text")[
-            "total_time_minutes"
-        ].transform("sum")
-        df["percent_calc_val"] = 0.0
-        non_zero = df["session_total_time_minutes"] != 0
-        df.loc[non_zero, "percent_calc_val"] = (
-            df.loc[non_zero, "total_time_minutes"]
-            / df.loc[non_zero, "session_total_time_minutes"]
-        ) * 100
-        df["percent_text"] = df["percent_calc_val"].round(2).astype(str) + "%"
-        df.drop(
-            columns=["session_total_time_minutes", "percent_calc_val"],
-            inplace=True,
-            errors="ignore",
-        )
-        return df
+        return len(rows)
 
     def reload_categories(self) -> None:
         self.category_map = self._load_program_categories_from_db()
         self.CATEGORIES = {
             v for v in self.category_map.values() if isinstance(v, str) and v.strip()
         }
+        self._bump_data_version()
@@ -0,0 +1,143 @@
+"""Month-partitioned report aggregation, optionally spread over worker processes.
+
+Workers open their own read-only SQLite connections and only import the
+standard library, so spawning them stays cheap and never touches the app log.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable
+
+# (date_text, category, total minutes)
+ReportRow = tuple[str, str, float]
+# Called with (partitions done, partitions total).
+ProgressCallback = Callable[[int, int], None]
+
+# Below this many sessions, process start-up costs more than it saves.
+PARALLEL_MIN_ROWS = 200_000
+
+
+@dataclass(frozen=True)
+class Partition:
+    label: str
+    start_epoch: float
+    end_epoch: float
+
+
+def _midnight(day: date) -> float:
+    return datetime(day.year, day.month, day.day).timestamp()
+
+
+def month_partitions(start: date, end: date) -> list[Partition]:
+    """Local calendar months covering ``[start, end]``, clipped to the range."""
+    partitions = []
+    range_end = _midnight(date.fromordinal(end.toordinal() + 1))
+    month = date(start.year, start.month, 1)
+    while month <= end:
+        next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        partitions.append(
+            Partition(
+                label=month.strftime("%Y-%m"),
+                start_epoch=_midnight(max(month, start)),
+                end_epoch=min(_midnight(next_month), range_end),
+            )
+        )
+        month = next_month
+    return partitions
+
+
+def _connect_read_only(db_path: str | Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+
+
+def aggregate_partition(db_path: str, partition: Partition) -> list[ReportRow]:
+    """Minutes per (date_text, category) for sessions starting in ``partition``."""
+    conn = _connect_read_only(db_path)
+    try:
+        cursor = conn.execute(
+            "SELECT date_text, category, SUM(total_time_minutes) FROM time_entries "
+            "WHERE start_timestamp_epoch >= ? AND start_timestamp_epoch < ? "
+            "GROUP BY date_text, category",
+            (partition.start_epoch, partition.end_epoch),
+        )
+        return [(row[0], row[1], float(row[2] or 0.0)) for row in cursor]
+    finally:
+        conn.close()
+
+
+def _data_bounds(
+    conn: sqlite3.Connection, start: date | None, end: date | None
+) -> tuple[date, date] | None:
+    if start is None or end is None:
+        row = conn.execute(
+            "SELECT MIN(start_timestamp_epoch), MAX(start_timestamp_epoch) FROM time_entries"
+        ).fetchone()
+        if row[0] is None:
+            return None
+        start = start or datetime.fromtimestamp(row[0]).date()
+        end = end or datetime.fromtimestamp(row[1]).date()
+    return start, end
+
+
+def daily_category_report(
+    db_path: str | Path,
+    start: date | None = None,
+    end: date | None = None,
+    max_workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> list[ReportRow]:
+    """Minutes per (date_text, category) over ``[start, end]`` (open ends = all data).
+
+    The range is split into month partitions; large ranges are aggregated in
+    up to ``max_workers`` processes and the partial results merged. Rows are
+    ordered by ``(date_text, category)``.
+    """
+    db_path = str(db_path)
+    conn = _connect_read_only(db_path)
+    try:
+        bounds = _data_bounds(conn, start, end)
+        if bounds is None or bounds[0] > bounds[1]:
+            return []
+        partitions = month_partitions(*bounds)
+        row_count = conn.execute(
+            "SELECT COUNT(*) FROM time_entries "
+            "WHERE start_timestamp_epoch >= ? AND start_timestamp_epoch < ?",
+            (partitions[0].start_epoch, partitions[-1].end_epoch),
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+    workers = min(max_workers or os.cpu_count() or 1, len(partitions))
+    totals: dict[tuple[str, str], float] = {}
+
+    def merge(rows: list[ReportRow], done: int) -> None:
+        for date_text, category, minutes in rows:
+            totals[(date_text, category)] = totals.get((date_text, category), 0.0) + minutes
+        if progress:
+            progress(done, len(partitions))
+
+    if workers <= 1 or row_count < PARALLEL_MIN_ROWS:
+        for done, partition in enumerate(partitions, start=1):
+            merge(aggregate_partition(db_path, partition), done)
+    else:
+        # Spawn rather than fork: the GUI process runs tracker threads.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(aggregate_partition, db_path, partition)
+                for partition in partitions
+            ]
+            for done, future in enumerate(as_completed(futures), start=1):
+                merge(future.result(), done)
+
+    return [
+        (date_text, category, minutes)
+        for (date_text, category), minutes in sorted(totals.items())
+    ]
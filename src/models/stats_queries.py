@@ -0,0 +1,213 @@
+"""Aggregate queries answered from the ``daily_rollup`` table (no pandas)."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date, datetime
+from typing import Iterable
+
+DAY_KEY_FORMAT = "%Y-%m-%d"
+
+# SQL expressions grouping ``daily_rollup.day`` into timeline periods. A week
+# is keyed by its Monday, so weeks spanning New Year stay in one group.
+PERIOD_KEYS = {
+    "day": "day",
+    "week": "date(day, 'weekday 0', '-6 days')",
+    "month": "substr(day, 1, 7)",
+}
+
+
+def parse_day(value: date | datetime | str | None) -> date | None:
+    """Accept a ``date``, ISO ``YYYY-MM-DD`` or ``DD/MM/YYYY`` string."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    for fmt in (DAY_KEY_FORMAT, "%d/%m/%Y"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date: {value!r}")
+
+
+def day_key(value: date) -> str:
+    return value.strftime(DAY_KEY_FORMAT)
+
+
+def _category_clause(
+    category: str | None, exclude_categories: Iterable[str]
+) -> tuple[str, list[str]]:
+    if category:
+        return " AND category = ?", [category]
+    excluded = list(exclude_categories)
+    if excluded:
+        marks = ", ".join("?" for _ in excluded)
+        return f" AND category NOT IN ({marks})", excluded
+    return "", []
+
+
+def _day_range(start: date | None, end: date | None) -> list[str]:
+    return [
+        day_key(start) if start else "0000-00-00",
+        day_key(end) if end else "9999-99-99",
+    ]
+
+
+def day_bounds(conn: sqlite3.Connection) -> tuple[date, date] | None:
+    row = conn.execute("SELECT MIN(day), MAX(day) FROM daily_rollup").fetchone()
+    if not row or row[0] is None:
+        return None
+    return parse_day(row[0]), parse_day(row[1])
+
+
+def daily_totals(
+    conn: sqlite3.Connection,
+    start: date,
+    end: date,
+    category: str | None = None,
+    exclude_categories: Iterable[str] = (),
+) -> list[tuple[str, float]]:
+    """``(YYYY-MM-DD, minutes)`` for days in ``[start, end]`` that have data."""
+    clause, params = _category_clause(category, exclude_categories)
+    cursor = conn.execute(
+        "SELECT day, SUM(total_minutes) FROM daily_rollup "
+        f"WHERE day BETWEEN ? AND ?{clause} GROUP BY day ORDER BY day",
+        [day_key(start), day_key(end), *params],
+    )
+    return [(row[0], float(row[1] or 0.0)) for row in cursor]
+
+
+def top_programs(
+    conn: sqlite3.Connection,
+    start: date | None = None,
+    end: date | None = None,
+    category: str | None = None,
+    exclude_categories: Iterable[str] = (),
+    limit: int = 10,
+    offset: int = 0,
+) -> list[tuple[str, str, float, int]]:
+    """``(program, category, minutes, sessions)`` ranked by minutes, one page.
+
+    Without a date range the ranking is read from the ``program_totals``
+    index; a range aggregates only the rollup rows of the days it covers.
+    """
+    clause, params = _category_clause(category, exclude_categories)
+    order = " ORDER BY 3 DESC, program_name, category LIMIT ? OFFSET ?"
+    if start is None and end is None:
+        sql = (
+            "SELECT program_name, category, total_minutes, session_count "
+            f"FROM program_totals WHERE total_minutes > 0{clause}{order}"
+        )
+    else:
+        sql = (
+            "SELECT program_name, category, SUM(total_minutes), SUM(session_count) "
+            f"FROM daily_rollup WHERE day BETWEEN ? AND ?{clause} "
+            f"GROUP BY program_name, category HAVING SUM(total_minutes) > 0{order}"
+        )
+        params = [*_day_range(start, end), *params]
+    cursor = conn.execute(sql, [*params, int(limit), int(offset)])
+    return [(row[0], row[1], float(row[2] or 0.0), int(row[3] or 0)) for row in cursor]
+
+
+def overview(
+    conn: sqlite3.Connection,
+    start: date | None = None,
+    end: date | None = None,
+    category: str | None = None,
+    exclude_categories: Iterable[str] = (),
+) -> dict[str, float | int | str | None]:
+    """Minutes, sessions and active days in ``[start, end]`` (open ends = all data).
+
+    Rows are grouped per day first so SQLite walks the ``(day, ...)`` key in
+    order instead of building a temporary b-tree for ``COUNT(DISTINCT day)``;
+    an open range takes its sums from ``program_totals``.
+    """
+    clause, params = _category_clause(category, exclude_categories)
+    range_params = [*_day_range(start, end), *params]
+    per_day = f"FROM daily_rollup WHERE day BETWEEN ? AND ?{clause} GROUP BY day"
+    if start is None and end is None:
+        sums = conn.execute(
+            "SELECT SUM(total_minutes), SUM(session_count) "
+            f"FROM program_totals WHERE 1{clause}",
+            params,
+        ).fetchone()
+        spread = conn.execute(
+            f"SELECT COUNT(*), MIN(day), MAX(day) FROM (SELECT day {per_day})",
+            range_params,
+        ).fetchone()
+        row = (*sums, *spread)
+    else:
+        row = conn.execute(
+            "SELECT SUM(minutes), SUM(sessions), COUNT(*), MIN(day), MAX(day) FROM ("
+            f"SELECT day, SUM(total_minutes) AS minutes, SUM(session_count) AS sessions "
+            f"{per_day})",
+            range_params,
+        ).fetchone()
+    minutes = float(row[0] or 0.0)
+    days = int(row[2] or 0)
+    return {
+        "total_minutes": minutes,
+        "sessions": int(row[1] or 0),
+        "active_days": days,
+        "minutes_per_active_day": minutes / days if days else 0.0,
+        "first_day": row[3],
+        "last_day": row[4],
+    }
+
+
+def category_totals(
+    conn: sqlite3.Connection,
+    start: date | None = None,
+    end: date | None = None,
+    exclude_categories: Iterable[str] = (),
+) -> list[tuple[str, float, int]]:
+    """``(category, minutes, sessions)`` ordered by minutes.
+
+    Like ``top_programs``, an open range reads the smaller ``program_totals``.
+    """
+    clause, params = _category_clause(None, exclude_categories)
+    if start is None and end is None:
+        sql = (
+            "SELECT category, SUM(total_minutes), SUM(session_count) "
+            f"FROM program_totals WHERE 1{clause}"
+        )
+    else:
+        sql = (
+            "SELECT category, SUM(total_minutes), SUM(session_count) FROM daily_rollup "
+            f"WHERE day BETWEEN ? AND ?{clause}"
+        )
+        params = [*_day_range(start, end), *params]
+    cursor = conn.execute(
+        f"{sql} GROUP BY category HAVING SUM(total_minutes) > 0 ORDER BY 2 DESC, category",
+        params,
+    )
+    return [(row[0], float(row[1] or 0.0), int(row[2] or 0)) for row in cursor]
+
+
+def period_totals(
+    conn: sqlite3.Connection,
+    start: date | None = None,
+    end: date | None = None,
+    period: str = "day",
+    category: str | None = None,
+    exclude_categories: Iterable[str] = (),
+) -> list[tuple[str, float, int]]:
+    """``(period key, minutes, sessions)`` per day, week or month.
+
+    Keys are ``YYYY-MM-DD`` days, the ``YYYY-MM-DD`` Monday starting each
+    week, or ``YYYY-MM`` months.
+    """
+    if period not in PERIOD_KEYS:
+        raise ValueError(f"Unknown period: {period}")
+    clause, params = _category_clause(category, exclude_categories)
+    key = PERIOD_KEYS[period]
+    cursor = conn.execute(
+        f"SELECT {key} AS period, SUM(total_minutes), SUM(session_count) FROM daily_rollup "
+        f"WHERE day BETWEEN ? AND ?{clause} GROUP BY period ORDER BY period",
+        [*_day_range(start, end), *params],
+    )
+    return [(row[0], float(row[1] or 0.0), int(row[2] or 0)) for row in cursor]
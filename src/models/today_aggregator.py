@@ -0,0 +1,83 @@
+"""In-memory running totals for the current local day."""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+
+def _midnight(day: date) -> float:
+    return datetime(day.year, day.month, day.day).timestamp()
+
+
+class TodayAggregator:
+    """Minutes per (category, program) for today, fed one session at a time.
+
+    Sessions are clipped to the current day, so one that crosses midnight
+    only contributes its post-midnight part. The first session ending on a
+    new day rolls the totals over; ``is_valid`` stays False until the
+    aggregator has been seeded or has rolled over into a fresh day.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._day = date.today()
+        self._minutes: dict[tuple[str, str], float] = {}
+        self._valid = False
+
+    @property
+    def day(self) -> date:
+        return self._day
+
+    def is_valid(self, today: date | None = None) -> bool:
+        with self._lock:
+            return self._valid and self._day == (today or date.today())
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._valid = False
+
+    def _roll_locked(self, day: date) -> None:
+        if day > self._day:
+            self._day = day
+            self._minutes = {}
+            self._valid = True
+
+    def seed(
+        self,
+        day: date,
+        sessions: Iterable[tuple[str, str, float, float]],
+    ) -> None:
+        """Replace totals with ``(program, category, start, end)`` sessions of ``day``."""
+        start_bound = _midnight(day)
+        end_bound = _midnight(day + timedelta(days=1))
+        minutes: dict[tuple[str, str], float] = {}
+        for program, category, start, end in sessions:
+            seconds = min(end, end_bound) - max(start, start_bound)
+            if seconds > 0:
+                key = (category, program)
+                minutes[key] = minutes.get(key, 0.0) + seconds / 60
+        with self._lock:
+            self._day = day
+            self._minutes = minutes
+            self._valid = True
+
+    def add_session(
+        self, program: str, category: str, start_epoch: float, end_epoch: float
+    ) -> None:
+        end_day = datetime.fromtimestamp(end_epoch).date()
+        with self._lock:
+            self._roll_locked(end_day)
+            if end_day != self._day:
+                return
+            seconds = end_epoch - max(start_epoch, _midnight(self._day))
+            if seconds > 0:
+                key = (category, program)
+                self._minutes[key] = self._minutes.get(key, 0.0) + seconds / 60
+
+    def snapshot(self, today: date | None = None) -> dict[tuple[str, str], float]:
+        """Copy of today's ``{(category, program): minutes}``, rolling over if needed."""
+        with self._lock:
+            self._roll_locked(today or date.today())
+            return dict(self._minutes)
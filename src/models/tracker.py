@@ -8,7 +8,7 @@ from typing import Callable
 
 import psutil
 
-from utils import config
+from utils import config, tracing
 from utils.app_logger import app_logger
 
 
@@ -24,11 +24,13 @@ class WindowTracker:
         category_map: dict,
         break_time_seconds: int | None = None,
         category_callback: Callable[[str], str] | None = None,
+        poll_seconds: float = 1.0,
     ) -> None:
         self.logger_instance = logger_instance
         self.log_activity = log_activity_callback
         self.category_map = category_map
         self.category_callback = category_callback
+        self.poll_seconds = max(0.1, float(poll_seconds))
         self.running = True
         self.active_window_exe: str | None = None
         self.active_window_title: str | None = None
@@ -144,54 +146,57 @@ class WindowTracker:
     def track_windows(self) -> None:
         app_logger.info("Window tracking thread started.")
         while self.running:
-            current_time_epoch = time.time()
-            if self.run_break_time:
-                self._break_time_counter_seconds = self._break_time - (
-                    current_time_epoch - self._break_timer_absolute_start_epoch
-                )
+            with tracing.span("tracker.tick", "tracker"):
+                self._tick()
+            time.sleep(self.poll_seconds)
+
+        if self.active_window_exe:
+            self.log_activity_for_current_window(self.active_window_title or "")
+        app_logger.info("Window tracking thread stopped.")
 
-            current_exe, current_title = self.get_active_window_info()
+    def _tick(self) -> None:
+        """One poll of the foreground window: update timers, log on a switch."""
+        current_time_epoch = time.time()
+        if self.run_break_time:
+            self._break_time_counter_seconds = self._break_time - (
+                current_time_epoch - self._break_timer_absolute_start_epoch
+            )
 
-            if current_exe in config.IGNORED_TRACKING_PROGRAMS:
-                time.sleep(1)
-                continue
+        current_exe, current_title = self.get_active_window_info()
 
-            if current_exe and current_exe != self.active_window_exe:
-                app_logger.debug(
-                    f"Window changed from '{self.active_window_exe}' to '{current_exe}'."
-                )
-                if self.active_window_exe:
-                    self.log_activity_for_current_window(self.active_window_title or "")
-
-                self.previous_window_exe = self.active_window_exe
-                self.active_window_exe = current_exe
-                self.active_window_title = current_title
-                self.current_session_start_time_epoch = current_time_epoch
-                self.current_session_total_time_seconds = 0
-
-                if (
-                    current_exe not in self.category_map
-                    and current_exe not in ("Unknown", "Idle")
-                ):
-                    app_logger.info(
-                        f"Program '{current_exe}' not in category map. Requesting category."
-                    )
-                    category = self._request_category(current_exe)
-                    self.category_map[current_exe] = category
-                    app_logger.info(
-                        f"Program '{current_exe}' assigned to '{category}'."
-                    )
+        if current_exe in config.IGNORED_TRACKING_PROGRAMS:
+            return
 
+        if current_exe and current_exe != self.active_window_exe:
+            app_logger.debug(
+                "Window changed from '%s' to '%s'.", self.active_window_exe, current_exe
+            )
             if self.active_window_exe:
-                self.current_session_total_time_seconds = (
-                    current_time_epoch - self.current_session_start_time_epoch
+                self.log_activity_for_current_window(self.active_window_title or "")
+
+            self.previous_window_exe = self.active_window_exe
+            self.active_window_exe = current_exe
+            self.active_window_title = current_title
+            self.current_session_start_time_epoch = current_time_epoch
+            self.current_session_total_time_seconds = 0
+
+            if (
+                current_exe not in self.category_map
+                and current_exe not in ("Unknown", "Idle")
+            ):
+                app_logger.info(
+                    f"Program '{current_exe}' not in category map. Requesting category."
+                )
+                category = self._request_category(current_exe)
+                self.category_map[current_exe] = category
+                app_logger.info(
+                    f"Program '{current_exe}' assigned to '{category}'."
                 )
-
-            time.sleep(1)
 
         if self.active_window_exe:
-            self.log_activity_for_current_window(self.active_window_title or "")
-        app_logger.info("Window tracking thread stopped.")
+            self.current_session_total_time_seconds = (
+                current_time_epoch - self.current_session_start_time_epoch
+            )
 
     def _request_category(self, program_name: str) -> str:
         if self.category_callback:
@@ -205,7 +210,7 @@ class WindowTracker:
         duration_seconds = end_time_epoch - self.current_session_start_time_epoch
         if duration_seconds < 0.5:
             app_logger.debug(
-                f"Skipping log for '{self.active_window_exe}': duration too short."
+                "Skipping log for '%s': duration too short.", self.active_window_exe
             )
             return
         self.log_activity(
@@ -234,7 +239,15 @@ class WindowTracker:
                 app_logger.warning("Tracking thread did not finish in time.")
         self.thread = None
 
-    def get_dashboard_state(self) -> dict:
+    def get_live_session(self) -> tuple[str, float] | None:
+        """Program and start epoch of the session not yet logged, if any."""
+        program = self.active_window_exe
+        if not self.running or not program or program in ("Unknown", "Idle"):
+            return None
+        return program, self.current_session_start_time_epoch
+
+    def get_dashboard_state(self, consume_reminder: bool = True) -> dict:
+        """Display fields; ``consume_reminder=False`` reports a due break without acknowledging it."""
         active_exe = self.active_window_exe or "None"
         active_title = self.active_window_title or ""
         if len(active_title) > 60:
@@ -249,5 +262,7 @@ class WindowTracker:
             "break_interval_display": self.break_time_setting_display,
             "break_countdown_display": self.break_time_counter_display,
             "break_timer_running": self.run_break_time,
-            "break_reminder": self.consume_break_reminder(),
+            "break_reminder": (
+                self.consume_break_reminder() if consume_reminder else self.should_take_break()
+            ),
         }
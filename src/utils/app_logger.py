@@ -1,19 +1,82 @@
-"""Application-wide logging."""
+"""Application-wide logging.
+
+Records are handed to a bounded queue and written to stdout and the rotating
+log file by a single listener thread, so a slow disk never stalls the tracker
+loop or a bridge call. When the queue is full new records are dropped and
+counted instead of blocking the caller.
+"""
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+from utils import config
 from utils.core_functions import get_data_path
 
+_listener: QueueListener | None = None
+
+
+class DroppingQueueHandler(QueueHandler):
+    """``QueueHandler`` that never blocks: records that do not fit are counted and dropped.
+
+    Records are queued unformatted, so message interpolation and traceback
+    rendering happen on the listener thread rather than in the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self._lock = threading.Lock()
+        self.dropped: dict[str, int] = {}
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The base class formats here, on the logging thread; a shallow copy
+        # keeps msg, args and exc_info for the listener's handlers instead.
+        return copy.copy(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
 
-def setup_logger() -> logging.Logger:
+
+def _level(name: str) -> int:
+    level = logging.getLevelName(str(name).upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _stop_listener() -> None:
+    """Flush queued records on exit and note how many were dropped."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    dropped = get_log_stats()["dropped"]
+    if dropped:
+        sys.stderr.write(f"TimeTrackerApp: {sum(dropped.values())} log records dropped {dropped}\n")
+
+
+def setup_logger(
+    level: str = config.LOG_LEVEL, log_file_path: Path | None = None
+) -> logging.Logger:
+    """(Re)configure ``TimeTrackerApp``; the log file defaults to the user data folder."""
+    global _listener
     logger = logging.getLogger("TimeTrackerApp")
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(_level(level))
+    logger.propagate = False
 
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     if logger.hasHandlers():
         logger.handlers.clear()
 
@@ -24,21 +87,40 @@ def setup_logger() -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
-    log_file_path = get_data_path() / "time_tracker_app.log"
+    log_file_path = Path(log_file_path or get_data_path() / "time_tracker_app.log")
+    file_error = None
     try:
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = RotatingFileHandler(
-            log_file_path, maxBytes=1024 * 1024 * 5, backupCount=2
+            log_file_path, maxBytes=1024 * 1024 * 5, backupCount=2, delay=True
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as exc:
-        logger.error(f"Failed to set up file handler for logging: {exc}", exc_info=True)
+        file_error = exc
 
+    logger.addHandler(DroppingQueueHandler(queue.Queue(maxsize=config.LOG_QUEUE_SIZE)))
+    _listener = QueueListener(logger.handlers[0].queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    if file_error:
+        logger.error("Failed to set up file handler for logging: %s", file_error)
     return logger
 
 
+def get_log_stats() -> dict:
+    """Records waiting for the writer thread and records dropped per level."""
+    for handler in logging.getLogger("TimeTrackerApp").handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            return {
+                "queued": handler.queue.qsize(),
+                "capacity": handler.queue.maxsize,
+                "dropped": dict(handler.dropped),
+            }
+    return {"queued": 0, "capacity": 0, "dropped": {}}
+
+
 app_logger = setup_logger()
+atexit.register(_stop_listener)
@@ -0,0 +1,108 @@
+"""Rotating online backups of the activity database."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from utils import config, db_utils
+from utils.app_logger import app_logger
+
+BACKUP_PREFIX = "time_tracker_"
+BACKUP_SUFFIX = ".sqlite"
+
+
+def list_backups(backup_dir: Path = config.BACKUP_DIR_PATH) -> list[Path]:
+    """Completed backups, oldest first."""
+    if not backup_dir.is_dir():
+        return []
+    return sorted(backup_dir.glob(f"{BACKUP_PREFIX}*{BACKUP_SUFFIX}"))
+
+
+def prune_backups(
+    backup_dir: Path = config.BACKUP_DIR_PATH, keep: int = config.BACKUP_RETENTION
+) -> list[Path]:
+    """Delete all but the newest ``keep`` backups (and leftover partial copies)."""
+    removed = []
+    stale = list(backup_dir.glob(f"{BACKUP_PREFIX}*.partial")) if backup_dir.is_dir() else []
+    for path in list_backups(backup_dir)[: -max(1, keep)] + stale:
+        try:
+            path.unlink()
+            removed.append(path)
+        except OSError:
+            app_logger.warning(f"Could not remove old backup {path}", exc_info=True)
+    return removed
+
+
+def create_backup(
+    backup_dir: Path = config.BACKUP_DIR_PATH,
+    keep: int = config.BACKUP_RETENTION,
+    pages: int = config.BACKUP_PAGES_PER_STEP,
+    pause: float = config.BACKUP_STEP_PAUSE_SECONDS,
+) -> Path:
+    """Snapshot the database into ``backup_dir`` and apply retention.
+
+    The copy is written under a ``.partial`` name and renamed when complete,
+    so an interrupted backup never looks like a usable snapshot.
+    """
+    backup_dir = Path(backup_dir)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    final_path = backup_dir / f"{BACKUP_PREFIX}{stamp}{BACKUP_SUFFIX}"
+    partial_path = final_path.with_name(final_path.name + ".partial")
+    started = datetime.now()
+    try:
+        db_utils.backup_database(partial_path, pages=pages, pause=pause)
+        partial_path.replace(final_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    seconds = (datetime.now() - started).total_seconds()
+    app_logger.info(f"Backup written to {final_path} in {seconds:.1f}s")
+    prune_backups(backup_dir, keep)
+    return final_path
+
+
+class BackupScheduler:
+    """Background thread that keeps the newest backup at most ``interval`` old."""
+
+    def __init__(
+        self,
+        interval_seconds: float = config.BACKUP_INTERVAL_HOURS * 3600,
+        backup_dir: Path = config.BACKUP_DIR_PATH,
+        keep: int = config.BACKUP_RETENTION,
+    ) -> None:
+        self.interval_seconds = max(60.0, float(interval_seconds))
+        self.backup_dir = Path(backup_dir)
+        self.keep = keep
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _seconds_until_due(self) -> float:
+        backups = list_backups(self.backup_dir)
+        if not backups:
+            return 0.0
+        age = datetime.now().timestamp() - backups[-1].stat().st_mtime
+        return max(0.0, self.interval_seconds - age)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._seconds_until_due()):
+            try:
+                create_backup(self.backup_dir, self.keep)
+            except Exception:
+                app_logger.error("Scheduled backup failed", exc_info=True)
+                self._stop.wait(min(self.interval_seconds, 3600))
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="backup", daemon=True)
+        self._thread.start()
+        app_logger.info(f"Backup scheduler started (every {self.interval_seconds / 3600:g}h)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self._thread = None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -25,6 +26,9 @@ PROJECT_LIB = PROJECT_ROOT / "prod" / "lib"
 
 LOG_BASE_DIR_NAME = "timeLog"
 REPORTS_DIR_NAME = "report"
+BACKUP_DIR_NAME = "backups"
+MAINTENANCE_REPORT_NAME = "maintenance.json"
+TRACE_DIR_NAME = "traces"
 DATABASE_FILE_NAME = "time_tracker_data.sqlite"
 
 LEGACY_LOG_BASE_DIR = PROJECT_LIB / LOG_BASE_DIR_NAME
@@ -35,6 +39,9 @@ DATA_DIR = get_data_path()
 LOG_BASE_DIR = DATA_DIR / LOG_BASE_DIR_NAME
 DATABASE_FILE_PATH = LOG_BASE_DIR / DATABASE_FILE_NAME
 REPORTS_DIR_PATH = LOG_BASE_DIR / REPORTS_DIR_NAME
+BACKUP_DIR_PATH = LOG_BASE_DIR / BACKUP_DIR_NAME
+MAINTENANCE_REPORT_PATH = LOG_BASE_DIR / MAINTENANCE_REPORT_NAME
+TRACE_DIR_PATH = LOG_BASE_DIR / TRACE_DIR_NAME
 
 ICON_DIR_NAME = "icons"
 ICON_DIR_PATH = PROJECT_LIB / ICON_DIR_NAME
@@ -51,6 +58,60 @@ PAUSE_IMAGE_PATH = ICON_DIR_PATH / PAUSE_IMAGE_NAME
 DEFAULT_BREAK_TIME_SECONDS = 3000
 MIN_BREAK_TIME_SECONDS = 600
 
+# Graph payloads kept per (filter category, day, data version).
+GRAPH_CACHE_MAX_ENTRIES = 32
+# Upper bound on points returned by GraphService.get_time_series.
+TIME_SERIES_MAX_POINTS = 120
+TOP_PROGRAMS_PAGE_SIZE = 10
+# Rows per batch yielded by LoggerService.iter_entries.
+ENTRY_BATCH_SIZE = 10_000
+# Upper bound on worker processes used to aggregate large report ranges.
+REPORT_MAX_WORKERS = 4
+# Bulk imports: rows parsed and inserted per transaction, and input files read
+# concurrently (a single connection does all the writing).
+IMPORT_CHUNK_ROWS = 50_000
+IMPORT_MAX_WORKERS = 4
+
+# Online backups: pages copied per step and the pause between steps keep the
+# tracker's inserts from waiting on the copy.
+BACKUP_ENABLED = True
+BACKUP_INTERVAL_HOURS = 24
+BACKUP_RETENTION = 7
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_PAUSE_SECONDS = 0.01
+
+# Database maintenance (optimize, incremental vacuum, checkpoint, quick_check).
+# The background run waits until no session has been written for the idle
+# period and stops starting new work once the time budget is spent.
+MAINTENANCE_ENABLED = True
+MAINTENANCE_INTERVAL_HOURS = 24
+MAINTENANCE_IDLE_MINUTES = 10
+MAINTENANCE_BUDGET_SECONDS = 30.0
+MAINTENANCE_VACUUM_PAGES_PER_STEP = 1024
+# Conservative full-VACUUM rewrite speed; the one-time switch to incremental
+# vacuum (cli.py maintain only) is skipped if the budget cannot cover it.
+MAINTENANCE_REWRITE_BYTES_PER_SECOND = 20 * 1024 * 1024
+# Rows sampled per index by ANALYZE; keeps it fast on large tables.
+MAINTENANCE_ANALYSIS_LIMIT = 1000
+
+# app_config.json writes are batched: saved this long after the last change.
+USER_CONFIG_SAVE_DELAY_SECONDS = 1.0
+# A failed save is retried after a doubling delay, capped here.
+USER_CONFIG_RETRY_MAX_SECONDS = 300.0
+
+# Logging: TIME_TRACKER_LOG_LEVEL=DEBUG restores the per-connection and
+# per-session debug lines. Records beyond the queue size are dropped, not waited on.
+LOG_LEVEL = os.environ.get("TIME_TRACKER_LOG_LEVEL", "INFO")
+LOG_QUEUE_SIZE = 10_000
+# Span tracing (utils/tracing.py): TIME_TRACKER_TRACE=1 records from startup;
+# the ring buffer keeps the newest spans.
+TRACE_ENABLED = os.environ.get("TIME_TRACKER_TRACE", "") not in ("", "0")
+TRACE_BUFFER_EVENTS = 100_000
+
+# cli.py serve: local HTTP JSON API (loopback only by default).
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8765
+
 # Foreground processes that belong to this app; never track or categorize them.
 IGNORED_TRACKING_PROGRAMS = frozenset(
     {
@@ -66,6 +127,7 @@ def ensure_directories_exist() -> None:
     dirs_to_create = [
         LOG_BASE_DIR,
         REPORTS_DIR_PATH,
+        BACKUP_DIR_PATH,
         ICON_DIR_PATH,
     ]
     for dir_path in dirs_to_create:
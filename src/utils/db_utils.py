@@ -3,35 +3,104 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable
 
-from utils import config
+from utils import config, tracing
 from utils.app_logger import app_logger
 
 DATABASE_PATH = config.DATABASE_FILE_PATH
 
+# time_entries.date_text is DD/MM/YYYY; rollups key days as sortable YYYY-MM-DD.
+_NEW_DAY_KEY = (
+    "substr(NEW.date_text, 7, 4) || '-' || substr(NEW.date_text, 4, 2) "
+    "|| '-' || substr(NEW.date_text, 1, 2)"
+)
+_OLD_DAY_KEY = _NEW_DAY_KEY.replace("NEW.", "OLD.")
+DAY_KEY_SQL = _NEW_DAY_KEY.replace("NEW.", "")
+
 
 @contextmanager
 def get_db_connection():
     conn = None
+    # One span per connection covers the SQL its caller runs.
+    with tracing.span("db.connection", "sql"):
+        try:
+            DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(DATABASE_PATH)
+            conn.row_factory = sqlite3.Row
+            app_logger.debug("Database connection established to %s", DATABASE_PATH)
+            yield conn
+            conn.commit()
+        except sqlite3.Error:
+            if conn:
+                conn.rollback()
+            app_logger.error(
+                f"Error in database connection {DATABASE_PATH}", exc_info=True
+            )
+            raise
+        finally:
+            if conn:
+                conn.close()
+                app_logger.debug("Database connection closed: %s", DATABASE_PATH)
+
+
+class _BackupRestarted(Exception):
+    """Raised from the progress hook once step-wise copying keeps restarting."""
+
+
+def backup_database(
+    dest_path: str | Path,
+    pages: int = 1024,
+    pause: float = 0.0,
+    max_restarts: int = 3,
+    progress: Callable[[int, int, int], object] | None = None,
+) -> None:
+    """Copy the live database to ``dest_path`` with the online backup API.
+
+    Copies ``pages`` pages per step and sleeps ``pause`` seconds between
+    steps so tracker writes interleave with the copy. A write through another
+    connection restarts the copy; after ``max_restarts`` restarts the rest is
+    copied in one step, which in WAL mode only holds a read snapshot and so
+    still never blocks writers. ``progress(status, remaining, total)`` is
+    called after each step. The copy is left in rollback-journal mode so it
+    is a single self-contained file.
+    """
+    dest_path = Path(dest_path)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    restarts = 0
+    last_remaining: int | None = None
+
+    def on_step(status: int, remaining: int, total: int) -> None:
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            restarts += 1
+            if restarts > max_restarts:
+                raise _BackupRestarted
+        last_remaining = remaining
+        if progress:
+            progress(status, remaining, total)
+        if pause and remaining:
+            time.sleep(pause)
+
+    source = sqlite3.connect(DATABASE_PATH)
     try:
-        DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(DATABASE_PATH)
-        conn.row_factory = sqlite3.Row
-        app_logger.debug(f"Database connection established to {DATABASE_PATH}")
-        yield conn
-        conn.commit()
-    except sqlite3.Error:
-        if conn:
-            conn.rollback()
-        app_logger.error(
-            f"Error in database connection {DATABASE_PATH}", exc_info=True
-        )
-        raise
+        dest = sqlite3.connect(dest_path)
+        try:
+            try:
+                source.backup(dest, pages=pages, progress=on_step)
+            except _BackupRestarted:
+                app_logger.info(
+                    f"Backup restarted {restarts} times; copying the rest in one step"
+                )
+                source.backup(dest, pages=-1)
+            dest.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dest.close()
     finally:
-        if conn:
-            conn.close()
-            app_logger.debug(f"Database connection closed: {DATABASE_PATH}")
+        source.close()
 
 
 def create_tables(conn: sqlite3.Connection) -> None:
@@ -49,8 +118,7 @@ def create_tables(conn: sqlite3.Connection) -> None:
                 end_time_text TEXT NOT NULL,
                 total_time_minutes REAL NOT NULL,
                 start_timestamp_epoch REAL NOT NULL,
-                end_timestamp_epoch REAL NOT NULL,
-                percent_text TEXT DEFAULT '0%'
+                end_timestamp_epoch REAL NOT NULL
             );
             """
         )
@@ -74,13 +142,398 @@ def create_tables(conn: sqlite3.Connection) -> None:
             );
             """
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_program_categories_name_nocase "
+            "ON program_categories (program_name COLLATE NOCASE);"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_program_categories_category "
+            "ON program_categories (category, program_name);"
+        )
+        # Change log for delta sync: every mapping change gets a new version;
+        # a NULL category records a deleted mapping.
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS program_category_changes (
+                version INTEGER PRIMARY KEY AUTOINCREMENT,
+                program_name TEXT NOT NULL,
+                category TEXT
+            );
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_program_categories_insert
+            AFTER INSERT ON program_categories
+            BEGIN
+                INSERT INTO program_category_changes (program_name, category)
+                VALUES (NEW.program_name, NEW.category);
+            END;
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_program_categories_update
+            AFTER UPDATE OF category ON program_categories
+            WHEN OLD.category IS NOT NEW.category
+            BEGIN
+                INSERT INTO program_category_changes (program_name, category)
+                VALUES (NEW.program_name, NEW.category);
+            END;
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_program_categories_delete
+            AFTER DELETE ON program_categories
+            BEGIN
+                INSERT INTO program_category_changes (program_name, category)
+                VALUES (OLD.program_name, NULL);
+            END;
+            """
+        )
+        # Recategorizations of existing sessions, replayed by incremental exports
+        # onto sessions with id <= max_entry_id.
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entry_corrections (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                program_name TEXT NOT NULL,
+                category TEXT NOT NULL,
+                max_entry_id INTEGER NOT NULL
+            );
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS export_watermarks (
+                target TEXT PRIMARY KEY,
+                last_entry_id INTEGER NOT NULL DEFAULT 0,
+                last_correction_seq INTEGER NOT NULL DEFAULT 0,
+                last_end_epoch REAL,
+                updated_at REAL
+            );
+            """
+        )
+        _create_daily_rollup(cursor)
+        _create_program_totals(cursor)
+        _create_session_stats(cursor)
         conn.commit()
         app_logger.info("Database tables ensured to exist.")
     finally:
         cursor.close()
 
 
+_ROLLUP_ADD_NEW = f"""
+    INSERT INTO daily_rollup (day, category, program_name, total_minutes, session_count)
+    VALUES ({_NEW_DAY_KEY}, NEW.category, NEW.program_name, NEW.total_time_minutes, 1)
+    ON CONFLICT (day, category, program_name) DO UPDATE SET
+        total_minutes = total_minutes + excluded.total_minutes,
+        session_count = session_count + 1;
+"""
+
+
+def _create_rollup_insert_trigger(cursor: sqlite3.Cursor | sqlite3.Connection) -> None:
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_insert
+        AFTER INSERT ON time_entries
+        BEGIN {_ROLLUP_ADD_NEW} END;
+        """
+    )
+
+
+@contextmanager
+def deferred_rollup(conn: sqlite3.Connection):
+    """Write transaction whose inserted sessions reach ``daily_rollup`` in one pass.
+
+    The per-row insert trigger is dropped for the duration and the new rows
+    are folded into the rollup with a single grouped upsert before commit.
+    Both happen inside the same ``BEGIN IMMEDIATE`` transaction, so other
+    connections never see the trigger missing. Updates and deletes made
+    inside the block must not touch the new rows.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM time_entries").fetchone()[0]
+        conn.execute("DROP TRIGGER IF EXISTS trg_time_entries_rollup_insert")
+        yield conn
+        conn.execute(
+            f"""
+            INSERT INTO daily_rollup (day, category, program_name, total_minutes, session_count)
+            SELECT {DAY_KEY_SQL}, category, program_name, SUM(total_time_minutes), COUNT(*)
+            FROM time_entries WHERE id > ?
+            GROUP BY 1, 2, 3
+            ON CONFLICT (day, category, program_name) DO UPDATE SET
+                total_minutes = total_minutes + excluded.total_minutes,
+                session_count = session_count + excluded.session_count
+            """,
+            (last_id,),
+        )
+        _create_rollup_insert_trigger(conn)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def _create_daily_rollup(cursor: sqlite3.Cursor) -> None:
+    """Minutes and session counts per (day, category, program), kept by triggers."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS daily_rollup (
+            day TEXT NOT NULL,
+            category TEXT NOT NULL,
+            program_name TEXT NOT NULL,
+            total_minutes REAL NOT NULL DEFAULT 0,
+            session_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, category, program_name)
+        ) WITHOUT ROWID;
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_daily_rollup_category_day "
+        "ON daily_rollup (category, day);"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_daily_rollup_program "
+        "ON daily_rollup (program_name, day);"
+    )
+    remove_old = f"""
+        UPDATE daily_rollup
+        SET total_minutes = total_minutes - OLD.total_time_minutes,
+            session_count = session_count - 1
+        WHERE day = {_OLD_DAY_KEY} AND category = OLD.category
+          AND program_name = OLD.program_name;
+        DELETE FROM daily_rollup
+        WHERE day = {_OLD_DAY_KEY} AND category = OLD.category
+          AND program_name = OLD.program_name AND session_count <= 0;
+    """
+    _create_rollup_insert_trigger(cursor)
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_delete
+        AFTER DELETE ON time_entries
+        BEGIN {remove_old} END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_update
+        AFTER UPDATE OF date_text, category, program_name, total_time_minutes
+        ON time_entries
+        BEGIN {remove_old} {_ROLLUP_ADD_NEW} END;
+        """
+    )
+
+
+def _create_program_totals(cursor: sqlite3.Cursor) -> None:
+    """All-time minutes per (category, program), kept from ``daily_rollup`` by triggers.
+
+    Lets all-time rankings read the top rows of an index instead of
+    aggregating every day of history.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS program_totals (
+            category TEXT NOT NULL,
+            program_name TEXT NOT NULL,
+            total_minutes REAL NOT NULL DEFAULT 0,
+            session_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (category, program_name)
+        ) WITHOUT ROWID;
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_program_totals_minutes "
+        "ON program_totals (total_minutes DESC);"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_program_totals_category_minutes "
+        "ON program_totals (category, total_minutes DESC);"
+    )
+    apply_delta = """
+        INSERT INTO program_totals (category, program_name, total_minutes, session_count)
+        VALUES ({row}.category, {row}.program_name, {sign}{row}.total_minutes,
+                {sign}{row}.session_count)
+        ON CONFLICT (category, program_name) DO UPDATE SET
+            total_minutes = total_minutes + excluded.total_minutes,
+            session_count = session_count + excluded.session_count;
+    """
+    drop_empty = """
+        DELETE FROM program_totals
+        WHERE category = OLD.category AND program_name = OLD.program_name
+          AND session_count <= 0;
+    """
+    add_new = apply_delta.format(row="NEW", sign="")
+    remove_old = apply_delta.format(row="OLD", sign="-") + drop_empty
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_rollup_totals_insert
+        AFTER INSERT ON daily_rollup
+        BEGIN {add_new} END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_rollup_totals_delete
+        AFTER DELETE ON daily_rollup
+        BEGIN {remove_old} END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_rollup_totals_update
+        AFTER UPDATE ON daily_rollup
+        BEGIN {add_new} {remove_old} END;
+        """
+    )
+
+
+def _create_session_stats(cursor: sqlite3.Cursor) -> None:
+    """Longest session length in seconds, raised by triggers as sessions are written.
+
+    Range reads look back this far before their start so sessions that began
+    earlier but overlap the range are found through the start-epoch index.
+    Deletes never lower it; a stale, larger bound only widens the lookback.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS session_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            max_session_seconds REAL NOT NULL DEFAULT 0
+        );
+        """
+    )
+    cursor.execute("INSERT OR IGNORE INTO session_stats (id) VALUES (1)")
+    raise_max = """
+        UPDATE session_stats
+        SET max_session_seconds = NEW.end_timestamp_epoch - NEW.start_timestamp_epoch
+        WHERE id = 1
+          AND NEW.end_timestamp_epoch - NEW.start_timestamp_epoch > max_session_seconds;
+    """
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_stats_insert
+        AFTER INSERT ON time_entries
+        BEGIN {raise_max} END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_stats_update
+        AFTER UPDATE OF start_timestamp_epoch, end_timestamp_epoch ON time_entries
+        BEGIN {raise_max} END;
+        """
+    )
+
+
+def rebuild_program_totals(conn: sqlite3.Connection) -> None:
+    """Recompute ``program_totals`` from ``daily_rollup``."""
+    conn.execute("DELETE FROM program_totals")
+    conn.execute(
+        """
+        INSERT INTO program_totals (category, program_name, total_minutes, session_count)
+        SELECT category, program_name, SUM(total_minutes), SUM(session_count)
+        FROM daily_rollup
+        GROUP BY category, program_name
+        """
+    )
+
+
+def rebuild_daily_rollup(conn: sqlite3.Connection) -> None:
+    """Recompute ``daily_rollup`` from scratch (backfill, bulk loads)."""
+    conn.execute("DELETE FROM daily_rollup")
+    conn.execute(
+        f"""
+        INSERT INTO daily_rollup (day, category, program_name, total_minutes, session_count)
+        SELECT {DAY_KEY_SQL}, category, program_name,
+               SUM(total_time_minutes), COUNT(*)
+        FROM time_entries
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def rebuild_session_stats(conn: sqlite3.Connection) -> None:
+    """Recompute the longest session length from ``time_entries``."""
+    conn.execute(
+        """
+        UPDATE session_stats SET max_session_seconds = (
+            SELECT COALESCE(MAX(end_timestamp_epoch - start_timestamp_epoch), 0)
+            FROM time_entries
+        )
+        WHERE id = 1
+        """
+    )
+
+
+def keep_percent_text(conn: sqlite3.Connection) -> None:
+    """Leave the unused ``percent_text`` column of old databases in place.
+
+    Dropping it rewrites the whole of ``time_entries``, too slow for startup
+    on a long history. The column has a default and nothing reads or writes
+    it, so it costs only its stored bytes. The migration slot stays so later
+    migration numbers do not shift.
+    """
+
+
+def enable_incremental_vacuum(conn: sqlite3.Connection) -> None:
+    """Switch to ``auto_vacuum=INCREMENTAL`` so maintenance can hand free pages back.
+
+    Changing the mode of an existing database takes one full ``VACUUM``,
+    which rewrites the whole file and must run outside a transaction; only
+    an explicit ``cli.py maintain`` does it, never startup or the scheduler.
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return
+    conn.commit()
+    started = time.perf_counter()
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("VACUUM")
+    app_logger.info(
+        f"Enabled incremental vacuum in {time.perf_counter() - started:.1f}s"
+    )
+
+
+def check_auto_vacuum(conn: sqlite3.Connection) -> None:
+    """Note databases created before incremental vacuum; ``cli.py maintain`` converts them."""
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    app_logger.warning(
+        f"Database ({page_count * page_size / 1024 / 1024:.1f} MB) does not use "
+        "incremental vacuum; run `cli.py maintain` once to rewrite it"
+    )
+
+
+# Ordered one-shot upgrades; PRAGMA user_version records how many have run.
+SCHEMA_MIGRATIONS = [
+    rebuild_daily_rollup,
+    keep_percent_text,
+    rebuild_program_totals,
+    check_auto_vacuum,
+    rebuild_session_stats,
+]
+
+
+def apply_migrations(conn: sqlite3.Connection) -> None:
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+    for index, migration in enumerate(SCHEMA_MIGRATIONS[current:], start=current + 1):
+        app_logger.info(f"Applying schema migration {index}: {migration.__name__}")
+        migration(conn)
+        conn.execute(f"PRAGMA user_version = {index}")
+        conn.commit()
+
+
 def initialize_database() -> None:
     app_logger.info(f"Initializing database at: {DATABASE_PATH}")
     with get_db_connection() as conn:
+        # Only takes effect on a new, empty file; older databases are
+        # converted by maintenance (see enable_incremental_vacuum).
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        # WAL lets readers (reports, backups) run alongside the tracker's writes.
+        conn.execute("PRAGMA journal_mode=WAL")
         create_tables(conn)
+        apply_migrations(conn)
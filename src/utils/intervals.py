@@ -0,0 +1,98 @@
+"""Vectorized helpers for splitting sessions into local-time buckets."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+
+def local_hour_edges(first_day: date, day_count: int) -> np.ndarray:
+    """Epoch of every local hour boundary from ``first_day`` 00:00 onwards.
+
+    Returns ``day_count * 24 + 1`` edges. Boundaries come from local
+    wall-clock times, so DST days keep 24 bins (one may be empty or wider).
+    """
+    edges = np.empty(day_count * 24 + 1, dtype=np.float64)
+    for offset in range(day_count):
+        day = first_day + timedelta(days=offset)
+        base = offset * 24
+        for hour in range(24):
+            edges[base + hour] = datetime(day.year, day.month, day.day, hour).timestamp()
+    last = first_day + timedelta(days=day_count)
+    edges[-1] = datetime(last.year, last.month, last.day).timestamp()
+    return edges
+
+
+def split_into_bins(
+    starts: np.ndarray, ends: np.ndarray, edges: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split ``[start, end)`` intervals at every bin edge.
+
+    Returns ``(session_index, bin_index, seconds)`` with one entry per piece.
+    Intervals are clipped to ``[edges[0], edges[-1])``; pieces of zero length
+    are dropped.
+    """
+    starts = np.clip(np.asarray(starts, dtype=np.float64), edges[0], edges[-1])
+    ends = np.clip(np.asarray(ends, dtype=np.float64), edges[0], edges[-1])
+    valid = ends > starts
+    session_ids = np.nonzero(valid)[0]
+    starts, ends = starts[valid], ends[valid]
+    if not len(starts):
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+
+    last_bin = len(edges) - 2
+    first = np.clip(np.searchsorted(edges, starts, side="right") - 1, 0, last_bin)
+    last = np.clip(np.searchsorted(edges, ends, side="left") - 1, 0, last_bin)
+    counts = last - first + 1
+
+    piece_session = np.repeat(np.arange(len(starts)), counts)
+    group_start = np.repeat(np.cumsum(counts) - counts, counts)
+    piece_bin = first[piece_session] + (np.arange(counts.sum()) - group_start)
+    lo = np.maximum(starts[piece_session], edges[piece_bin])
+    hi = np.minimum(ends[piece_session], edges[piece_bin + 1])
+    seconds = hi - lo
+    keep = seconds > 0
+    return session_ids[piece_session[keep]], piece_bin[keep], seconds[keep]
+
+
+def run_starts(values: np.ndarray, *breaks: np.ndarray) -> np.ndarray:
+    """Run-length boundaries: True where ``values`` (or any ``breaks`` key) changes."""
+    values = np.asarray(values)
+    starts = np.ones(len(values), dtype=bool)
+    if len(values) > 1:
+        starts[1:] = values[1:] != values[:-1]
+        for key in breaks:
+            key = np.asarray(key)
+            starts[1:] |= key[1:] != key[:-1]
+    return starts
+
+
+def merge_intervals(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    max_gap: float,
+    groups: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Merge sorted intervals whose gap is at most ``max_gap`` seconds.
+
+    Intervals never merge across a change in ``groups`` (e.g. a day index).
+    Returns ``(first_index, block_start, block_end, covered_seconds)``, one
+    entry per merged block.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if not len(starts):
+        empty = np.empty(0, dtype=np.float64)
+        return np.empty(0, dtype=np.int64), empty, empty, empty
+
+    reach = np.maximum.accumulate(ends)
+    new_block = np.ones(len(starts), dtype=bool)
+    new_block[1:] = starts[1:] - reach[:-1] > max_gap
+    if groups is not None:
+        new_block |= run_starts(groups)
+    first_index = np.nonzero(new_block)[0]
+    block_end = np.maximum.reduceat(ends, first_index)
+    covered = np.add.reduceat(ends - starts, first_index)
+    return first_index, starts[first_index], block_end, covered
@@ -0,0 +1,288 @@
+"""Time-boxed database maintenance: statistics, free-page reclaim, checkpoint, checks."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from utils import config, db_utils
+from utils.app_logger import app_logger
+
+# Representative dashboard queries, timed before and after maintenance.
+PROBE_QUERIES = {
+    "recent_sessions": (
+        "SELECT COUNT(*), SUM(total_time_minutes) FROM time_entries "
+        "WHERE start_timestamp_epoch >= strftime('%s', 'now', '-30 days')"
+    ),
+    "daily_totals": (
+        "SELECT day, SUM(total_minutes) FROM daily_rollup "
+        "WHERE day >= date('now', '-30 days') GROUP BY day"
+    ),
+    "category_totals": (
+        "SELECT category, SUM(total_minutes) FROM program_totals GROUP BY category"
+    ),
+}
+PROBE_REPEATS = 3
+# SQLite VM instructions between budget checks.
+_BUDGET_CHECK_OPS = 10_000
+
+
+def _disk_bytes(db_path: Path) -> int:
+    """Database plus WAL size on disk."""
+    total = 0
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            total += path.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _time_probes(conn: sqlite3.Connection) -> dict[str, float]:
+    """Best-of-``PROBE_REPEATS`` milliseconds for each probe query."""
+    timings = {}
+    for name, sql in PROBE_QUERIES.items():
+        best = float("inf")
+        for _ in range(PROBE_REPEATS):
+            started = time.perf_counter()
+            conn.execute(sql).fetchall()
+            best = min(best, time.perf_counter() - started)
+        timings[name] = round(best * 1000, 3)
+    return timings
+
+
+def _analyze(conn: sqlite3.Connection) -> dict[str, Any]:
+    conn.execute(f"PRAGMA analysis_limit = {int(config.MAINTENANCE_ANALYSIS_LIMIT)}")
+    has_stats = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+    ).fetchone()
+    # PRAGMA optimize only refreshes statistics that already exist.
+    if not has_stats:
+        conn.execute("ANALYZE")
+    conn.execute("PRAGMA optimize")
+    return {"full_analyze": not has_stats}
+
+
+def _enable_incremental_vacuum(conn: sqlite3.Connection, deadline: float) -> dict[str, Any]:
+    """One full ``VACUUM`` for databases created before incremental vacuum.
+
+    The rewrite holds the write lock throughout, so it is skipped when the
+    remaining budget clearly cannot cover the file.
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return {"status": "skipped", "reason": "already INCREMENTAL"}
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    needed = page_count * page_size / config.MAINTENANCE_REWRITE_BYTES_PER_SECOND
+    remaining = deadline - time.monotonic()
+    if needed > remaining:
+        return {
+            "status": "skipped",
+            "reason": f"rewrite needs about {needed:.0f}s, {remaining:.0f}s left; "
+            "run cli.py maintain with a larger --budget",
+        }
+    app_logger.warning(
+        f"Rewriting the {page_count * page_size / 1024 / 1024:.1f} MB database "
+        "once to enable incremental vacuum"
+    )
+    db_utils.enable_incremental_vacuum(conn)
+    return {"bytes_rewritten": page_count * page_size}
+
+
+def _incremental_vacuum(
+    conn: sqlite3.Connection, deadline: float, pages_per_step: int
+) -> dict[str, Any]:
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        return {"status": "skipped", "reason": "auto_vacuum is not INCREMENTAL"}
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    free = free_before
+    while free and time.monotonic() < deadline:
+        # executescript steps the pragma to completion; execute() frees one page.
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages_per_step)})")
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return {
+        "pages_freed": free_before - free,
+        "pages_left": free,
+        "bytes_freed": (free_before - free) * page_size,
+    }
+
+
+def _checkpoint(conn: sqlite3.Connection) -> dict[str, Any]:
+    busy, wal_pages, copied = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    if busy:
+        # A reader holds the WAL; copy what we can without truncating.
+        busy, wal_pages, copied = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+    return {"busy": bool(busy), "wal_pages": wal_pages, "checkpointed": copied}
+
+
+def _quick_check(conn: sqlite3.Connection) -> dict[str, Any]:
+    problems = [row[0] for row in conn.execute("PRAGMA quick_check(10)")]
+    return {"ok": problems == ["ok"], "problems": [] if problems == ["ok"] else problems}
+
+
+def run_maintenance(
+    budget_seconds: float = config.MAINTENANCE_BUDGET_SECONDS,
+    vacuum: bool = True,
+    check: bool = True,
+    report_path: Path | None = None,
+    convert: bool = False,
+) -> dict[str, Any]:
+    """Run each maintenance step while the time budget lasts; returns a report.
+
+    Steps run in order (analyze/optimize, with ``convert`` a one-time switch
+    to incremental vacuum for older databases, incremental vacuum, WAL
+    checkpoint, quick_check). A step still running when the budget is spent is
+    interrupted and the remaining ones are skipped, so a run never holds
+    the database much longer than ``budget_seconds``. The report carries
+    per-step results and timings, bytes reclaimed on disk and probe query
+    timings from before and after; it is also written to ``report_path``.
+    """
+    db_path = Path(db_utils.DATABASE_PATH)
+    started_at = datetime.now()
+    started = time.monotonic()
+    deadline = started + max(0.0, budget_seconds)
+    bytes_before = _disk_bytes(db_path)
+    steps: dict[str, dict[str, Any]] = {}
+    plan: list[tuple[str, Callable[[sqlite3.Connection], dict[str, Any]]]] = [
+        ("analyze", _analyze)
+    ]
+    if vacuum and convert:
+        plan.append(
+            (
+                "enable_incremental_vacuum",
+                lambda conn: _enable_incremental_vacuum(conn, deadline),
+            )
+        )
+    if vacuum:
+        plan.append(
+            (
+                "incremental_vacuum",
+                lambda conn: _incremental_vacuum(
+                    conn, deadline, config.MAINTENANCE_VACUUM_PAGES_PER_STEP
+                ),
+            )
+        )
+    plan.append(("checkpoint", _checkpoint))
+    if check:
+        plan.append(("quick_check", _quick_check))
+
+    conn = sqlite3.connect(db_path, isolation_level=None, timeout=5.0)
+    try:
+        timings_before = _time_probes(conn)
+        conn.set_progress_handler(lambda: time.monotonic() > deadline, _BUDGET_CHECK_OPS)
+        for name, step in plan:
+            if time.monotonic() >= deadline:
+                steps[name] = {"status": "skipped", "reason": "time budget spent"}
+                continue
+            step_started = time.perf_counter()
+            try:
+                result = {"status": "ok", **step(conn)}
+            except sqlite3.OperationalError as exc:
+                if conn.in_transaction:
+                    conn.rollback()
+                status = "interrupted" if time.monotonic() >= deadline else "error"
+                result = {"status": status, "reason": str(exc)}
+                if status == "error":
+                    app_logger.error(f"Maintenance step {name} failed", exc_info=True)
+            result["seconds"] = round(time.perf_counter() - step_started, 3)
+            steps[name] = result
+        conn.set_progress_handler(None, 0)
+        timings_after = _time_probes(conn)
+    finally:
+        conn.close()
+
+    bytes_after = _disk_bytes(db_path)
+    report = {
+        "started": started_at.isoformat(timespec="seconds"),
+        "seconds": round(time.monotonic() - started, 3),
+        "budget_seconds": budget_seconds,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_reclaimed": bytes_before - bytes_after,
+        "steps": steps,
+        "timings_before_ms": timings_before,
+        "timings_after_ms": timings_after,
+    }
+    app_logger.info(
+        f"Maintenance finished in {report['seconds']}s: reclaimed "
+        f"{report['bytes_reclaimed']} bytes; "
+        + ", ".join(f"{name} {result['status']}" for name, result in steps.items())
+    )
+    if report_path:
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = report_path.with_name(report_path.name + ".partial")
+        partial.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        partial.replace(report_path)
+    return report
+
+
+def last_report(report_path: Path = config.MAINTENANCE_REPORT_PATH) -> dict[str, Any] | None:
+    try:
+        return json.loads(Path(report_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class MaintenanceScheduler:
+    """Background thread that runs maintenance once per interval while the app is idle.
+
+    ``is_idle`` is polled every ``poll_seconds`` once a run is due; the
+    last run is known from the report file's age, so restarts do not reset
+    the interval.
+    """
+
+    def __init__(
+        self,
+        is_idle: Callable[[], bool],
+        interval_seconds: float = config.MAINTENANCE_INTERVAL_HOURS * 3600,
+        budget_seconds: float = config.MAINTENANCE_BUDGET_SECONDS,
+        report_path: Path = config.MAINTENANCE_REPORT_PATH,
+        poll_seconds: float = 60.0,
+    ) -> None:
+        self.is_idle = is_idle
+        self.interval_seconds = max(60.0, float(interval_seconds))
+        self.budget_seconds = budget_seconds
+        self.report_path = Path(report_path)
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _seconds_until_due(self) -> float:
+        try:
+            age = time.time() - self.report_path.stat().st_mtime
+        except OSError:
+            return 0.0
+        return max(0.0, self.interval_seconds - age)
+
+    def _run(self) -> None:
+        while not self._stop.wait(max(self._seconds_until_due(), self.poll_seconds)):
+            if self._seconds_until_due() or not self.is_idle():
+                continue
+            try:
+                run_maintenance(self.budget_seconds, report_path=self.report_path)
+            except Exception:
+                app_logger.error("Scheduled maintenance failed", exc_info=True)
+                self._stop.wait(min(self.interval_seconds, 3600))
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="maintenance", daemon=True)
+        self._thread.start()
+        app_logger.info(
+            f"Maintenance scheduler started (every {self.interval_seconds / 3600:g}h when idle)"
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self._thread = None
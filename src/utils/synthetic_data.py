@@ -0,0 +1,247 @@
+"""Seeded synthetic ``time_entries`` for benchmarks and load tests."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from utils import db_utils
+from utils.app_logger import app_logger
+
+# Sessions inserted per executemany call and per transaction.
+GENERATOR_BATCH_SIZE = 100_000
+
+# (program, category, weight in working hours, weight otherwise, title templates).
+# ``{n}`` in a title is replaced by a document number that drifts upwards day
+# by day, so the set of distinct window titles keeps growing like real use.
+PROGRAM_CATALOG: list[tuple[str, str, float, float, tuple[str, ...]]] = [
+    ("Code.exe", "Work", 18.0, 3.0, ("module_{n}.py - project - Visual Studio Code",)),
+    (
+        "chrome.exe",
+        "Browsing",
+        14.0,
+        16.0,
+        ("Issue #{n} · GitHub - Google Chrome", "Search: {n} - Google", "YouTube - Google Chrome"),
+    ),
+    ("Slack.exe", "Communication", 9.0, 1.5, ("#team-{n} | Slack", "Direct messages | Slack")),
+    ("OUTLOOK.EXE", "Communication", 7.0, 0.5, ("Inbox ({n}) - Outlook",)),
+    ("WINWORD.EXE", "Work", 5.0, 0.8, ("report_{n}.docx - Word",)),
+    ("EXCEL.EXE", "Work", 4.0, 0.3, ("budget_{n}.xlsx - Excel",)),
+    ("WindowsTerminal.exe", "Work", 6.0, 1.0, ("PowerShell", "ssh build-{n}")),
+    ("Teams.exe", "Communication", 4.0, 0.2, ("Meeting {n} | Microsoft Teams",)),
+    ("explorer.exe", "Misc", 3.0, 2.0, ("Downloads", "Project {n}")),
+    ("Spotify.exe", "Entertainment", 1.0, 5.0, ("Spotify Premium",)),
+    ("steam.exe", "Entertainment", 0.2, 6.0, ("Steam", "Game {n}")),
+    ("vlc.exe", "Entertainment", 0.1, 3.0, ("episode_{n}.mkv - VLC media player",)),
+    ("LockApp.exe", "Break", 2.0, 2.0, ("Windows Default Lock Screen",)),
+]
+LONG_TAIL_CATEGORY = "Misc"
+
+# Relative share of activity starting in each local hour (weekdays, weekends).
+WEEKDAY_HOURS = np.array(
+    [0.4, 0.2, 0.1, 0.05, 0.05, 0.1, 0.4, 1.5, 4, 7, 8, 8, 5, 6, 8, 8, 7, 5, 3, 2.5, 3, 3, 2, 1]
+)
+WEEKEND_HOURS = np.array(
+    [1.5, 1, 0.5, 0.2, 0.1, 0.1, 0.1, 0.3, 1, 2, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 4, 2.5]
+)
+WEEKEND_ACTIVITY = 0.45
+WORK_HOURS = range(9, 18)
+
+# Session lengths are log-normal around a ~1.5 minute median, capped at 4 hours.
+MEDIAN_SESSION_SECONDS = 90.0
+SESSION_SIGMA = 1.3
+MAX_SESSION_SECONDS = 4 * 3600.0
+
+ProgressCallback = Callable[[int, int], None]
+
+_INSERT_SQL = (
+    "INSERT INTO time_entries (date_text, program_name, window_title, category, "
+    "start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, "
+    "end_timestamp_epoch) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# Dropped for the duration of a bulk load and recreated by create_tables.
+_BULK_DROPPED = [
+    "DROP TRIGGER IF EXISTS trg_time_entries_rollup_insert",
+    "DROP TRIGGER IF EXISTS trg_time_entries_stats_insert",
+    "DROP INDEX IF EXISTS idx_time_entries_date",
+    "DROP INDEX IF EXISTS idx_time_entries_start_epoch",
+    "DROP INDEX IF EXISTS idx_time_entries_program",
+    "DROP INDEX IF EXISTS idx_time_entries_category",
+]
+
+
+def _catalog(programs: int) -> tuple[list[str], list[str], np.ndarray, np.ndarray, list]:
+    """The fixed catalog plus a Zipf-weighted long tail up to ``programs`` entries."""
+    entries = PROGRAM_CATALOG[: max(1, programs)]
+    names = [entry[0] for entry in entries]
+    categories = [entry[1] for entry in entries]
+    work = [entry[2] for entry in entries]
+    leisure = [entry[3] for entry in entries]
+    titles = [entry[4] for entry in entries]
+    for rank in range(1, programs - len(entries) + 1):
+        names.append(f"tool_{rank:03d}.exe")
+        categories.append(LONG_TAIL_CATEGORY)
+        work.append(2.0 / rank)
+        leisure.append(1.0 / rank)
+        titles.append((f"Tool {rank} - item {{n}}",))
+    return (
+        names,
+        categories,
+        np.array(work) / sum(work),
+        np.array(leisure) / sum(leisure),
+        titles,
+    )
+
+
+def _sessions_per_day(rng: np.random.Generator, sessions: int, days: list[date]) -> np.ndarray:
+    activity = np.where([day.weekday() >= 5 for day in days], WEEKEND_ACTIVITY, 1.0)
+    activity = activity * rng.lognormal(0.0, 0.35, len(days))
+    return rng.multinomial(sessions, activity / activity.sum())
+
+
+def _clock_labels() -> np.ndarray:
+    return np.array(
+        [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)],
+        dtype=object,
+    )
+
+
+def _day_rows(
+    rng: np.random.Generator,
+    day: date,
+    day_number: int,
+    count: int,
+    catalog: tuple,
+    clock: np.ndarray,
+) -> list[tuple]:
+    """``count`` non-overlapping sessions within one local day."""
+    names, categories, work, leisure, titles = catalog
+    weekend = day.weekday() >= 5
+    profile = WEEKEND_HOURS if weekend else WEEKDAY_HOURS
+    hours = rng.choice(24, size=count, p=profile / profile.sum())
+    offsets = np.sort(hours * 3600 + rng.uniform(0, 3600, count))
+    lengths = np.minimum(
+        rng.lognormal(np.log(MEDIAN_SESSION_SECONDS), SESSION_SIGMA, count),
+        MAX_SESSION_SECONDS,
+    )
+    next_offsets = np.append(offsets[1:], 86399.0)
+    ends = np.minimum(offsets + lengths, next_offsets)
+
+    in_work_hours = (offsets >= WORK_HOURS.start * 3600) & (offsets < WORK_HOURS.stop * 3600)
+    if weekend:
+        in_work_hours[:] = False
+    program_ids = np.where(
+        in_work_hours,
+        rng.choice(len(names), size=count, p=work),
+        rng.choice(len(names), size=count, p=leisure),
+    )
+    # Document numbers drift upwards over time; most sessions reuse recent ones.
+    documents = day_number // 3 + rng.geometric(0.3, count)
+    template_picks = rng.integers(0, 1 << 16, count)
+
+    midnight = time.mktime(day.timetuple())
+    date_text = day.strftime("%d/%m/%Y")
+    rows = []
+    for offset, end, program_id, document, pick in zip(
+        offsets.tolist(),
+        ends.tolist(),
+        program_ids.tolist(),
+        documents.tolist(),
+        template_picks.tolist(),
+    ):
+        seconds = end - offset
+        if seconds < 1.0:
+            continue
+        program_titles = titles[program_id]
+        title = program_titles[pick % len(program_titles)].format(n=document)
+        rows.append(
+            (
+                date_text,
+                names[program_id],
+                title,
+                categories[program_id],
+                clock[int(offset)],
+                clock[int(end)],
+                round(seconds / 60, 2),
+                midnight + offset,
+                midnight + end,
+            )
+        )
+    return rows
+
+
+def generate_entries(
+    db_path: str | Path | None = None,
+    sessions: int = 100_000,
+    days: int = 365,
+    seed: int = 0,
+    end_day: date | None = None,
+    programs: int = len(PROGRAM_CATALOG),
+    progress: ProgressCallback | None = None,
+) -> int:
+    """Insert about ``sessions`` synthetic sessions over ``days`` days ending ``end_day``.
+
+    The same arguments always produce the same rows. The load runs with
+    ``synchronous=OFF`` and without the time_entries indexes or the rollup
+    insert trigger; both are restored and the rollups rebuilt at the end.
+    Returns the number of rows written (sessions shorter than a second
+    after overlap trimming are skipped).
+    """
+    if sessions <= 0 or days <= 0:
+        raise ValueError("sessions and days must be positive")
+    db_path = Path(db_path or db_utils.DATABASE_PATH)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    end_day = end_day or date.today() - timedelta(days=1)
+    day_list = [end_day - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+    per_day = _sessions_per_day(rng, sessions, day_list)
+    catalog = _catalog(programs)
+    clock = _clock_labels()
+
+    started = time.perf_counter()
+    written = 0
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        db_utils.create_tables(conn)
+        db_utils.apply_migrations(conn)
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA cache_size=-262144")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.executemany(
+            "INSERT OR IGNORE INTO program_categories (program_name, category) VALUES (?, ?)",
+            zip(catalog[0], catalog[1]),
+        )
+        for statement in _BULK_DROPPED:
+            conn.execute(statement)
+        conn.commit()
+        try:
+            pending: list[tuple] = []
+            for day_number, (day, count) in enumerate(zip(day_list, per_day.tolist())):
+                if count:
+                    pending.extend(_day_rows(rng, day, day_number, count, catalog, clock))
+                if len(pending) >= GENERATOR_BATCH_SIZE or day_number == days - 1:
+                    with conn:
+                        conn.executemany(_INSERT_SQL, pending)
+                    written += len(pending)
+                    pending = []
+                    if progress:
+                        progress(written, sessions)
+        finally:
+            db_utils.create_tables(conn)
+            db_utils.rebuild_daily_rollup(conn)
+            db_utils.rebuild_program_totals(conn)
+            db_utils.rebuild_session_stats(conn)
+            conn.commit()
+    finally:
+        conn.close()
+    app_logger.info(
+        f"Generated {written} synthetic sessions over {days} days in "
+        f"{time.perf_counter() - started:.1f}s ({db_path})"
+    )
+    return written
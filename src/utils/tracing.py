@@ -0,0 +1,183 @@
+"""In-memory span tracing with Chrome trace export.
+
+Spans are recorded only while tracing is enabled; otherwise ``span()``
+returns a shared no-op object and ``@traced`` wrappers cost one flag check.
+Finished spans go into a bounded ring buffer (oldest dropped first) and can
+be written as Chrome trace JSON, viewable in ``chrome://tracing`` or Perfetto.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from utils import config
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# (name, category, start ns, duration ns, thread id, thread name, args)
+_events: deque[tuple] = deque(maxlen=config.TRACE_BUFFER_EVENTS)
+_enabled = False
+_lock = threading.Lock()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "category", "args", "_start")
+
+    def __init__(self, name: str, category: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start = 0
+
+    def __enter__(self) -> _Span:
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        thread = threading.current_thread()
+        _events.append(
+            (
+                self.name,
+                self.category,
+                self._start,
+                end - self._start,
+                thread.ident,
+                thread.name,
+                self.args,
+            )
+        )
+
+    def set(self, **args: Any) -> None:
+        """Attach values known only inside the span (row counts, sizes)."""
+        self.args.update(args)
+
+
+def span(name: str, category: str = "app", **args: Any) -> _Span | _NullSpan:
+    """Context manager timing the enclosed block as one trace event."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def traced(category: str, name: str | None = None) -> Callable[[F], F]:
+    """Decorator recording each call of the function as a span."""
+
+    def decorate(func: F) -> F:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(label, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(capacity: int | None = None) -> None:
+    """Start recording; ``capacity`` resizes (and clears) the ring buffer."""
+    global _events, _enabled
+    with _lock:
+        if capacity and capacity != _events.maxlen:
+            _events = deque(maxlen=max(1, int(capacity)))
+        _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def clear() -> None:
+    _events.clear()
+
+
+def snapshot() -> list[tuple]:
+    """Copy of the buffered events, oldest first."""
+    while True:
+        try:
+            return list(_events)
+        except RuntimeError:
+            # Another thread appended mid-copy; the buffer is small, retry.
+            continue
+
+
+def chrome_trace(events: list[tuple] | None = None) -> dict[str, Any]:
+    """Events as a Chrome trace document (complete ``X`` events, microseconds)."""
+    events = snapshot() if events is None else events
+    pid = os.getpid()
+    origin = min((event[2] for event in events), default=0)
+    trace_events: list[dict[str, Any]] = []
+    thread_names: dict[int, str] = {}
+    for name, category, start, duration, tid, thread_name, args in events:
+        thread_names[tid] = thread_name
+        trace_events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+        )
+    trace_events.extend(
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": label}}
+        for tid, label in thread_names.items()
+    )
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def dump_chrome_trace(path: str | Path | None = None) -> tuple[Path, int]:
+    """Write the buffer as Chrome trace JSON; returns ``(path, span count)``.
+
+    Without ``path`` the file goes to ``TRACE_DIR_PATH`` with a timestamped name.
+    """
+    events = snapshot()
+    if path is None:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = config.TRACE_DIR_PATH / f"trace_{stamp}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(chrome_trace(events), default=str), encoding="utf-8")
+    return path, len(events)
+
+
+if config.TRACE_ENABLED:
+    enable()
@@ -1,24 +1,187 @@
-"""Minimal JSON user preferences (update snooze, etc.)."""
+"""JSON user preferences (update snooze, tunables) with a cached, debounced store."""
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
-from typing import Any
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
 
+from utils import config
+from utils.app_logger import app_logger
 from utils.core_functions import get_data_path
 
 CONFIG_FILE = get_data_path() / "app_config.json"
 
+# User-adjustable tunables kept under "settings"; the types here are enforced on read.
+SETTINGS_DEFAULTS: dict[str, Any] = {
+    "break_interval_minutes": config.DEFAULT_BREAK_TIME_SECONDS // 60,
+    "tracker_poll_seconds": 1.0,
+    "graph_cache_entries": config.GRAPH_CACHE_MAX_ENTRIES,
+}
+
+
+class ConfigStore:
+    """``app_config.json`` read once and served from memory.
+
+    Changes mark the store dirty and (re)arm a timer; when it fires the whole
+    document is written to a temporary file, fsynced and renamed over the
+    original, so a crash mid-write leaves either the old or the new file.
+    A failed write keeps the store dirty and re-arms the timer with a
+    doubling delay, so the change is saved once the disk recovers.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = CONFIG_FILE,
+        save_delay_seconds: float = config.USER_CONFIG_SAVE_DELAY_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.save_delay_seconds = save_delay_seconds
+        self._lock = threading.RLock()
+        self._data: dict[str, Any] | None = None
+        self._dirty = False
+        self._timer: threading.Timer | None = None
+        self._failures = 0
+
+    def _loaded(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    def _read(self) -> dict[str, Any]:
+        if not self.path.is_file():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            app_logger.warning(f"Ignoring unreadable config file {self.path}", exc_info=True)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _split(key: str) -> tuple[list[str], str]:
+        *sections, name = key.split(".")
+        return sections, name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value at a dotted ``key`` such as ``"updates.update_snooze_until"``."""
+        sections, name = self._split(key)
+        with self._lock:
+            node: Any = self._loaded()
+            for section in sections:
+                node = node.get(section) if isinstance(node, dict) else None
+            if not isinstance(node, dict) or name not in node:
+                return default
+            return copy.deepcopy(node[name])
+
+    def set(self, key: str, value: Any) -> None:
+        sections, name = self._split(key)
+        with self._lock:
+            node = self._loaded()
+            for section in sections:
+                child = node.get(section)
+                if not isinstance(child, dict):
+                    child = node[section] = {}
+                node = child
+            if name in node and node[name] == value:
+                return
+            node[name] = copy.deepcopy(value)
+            self._mark_dirty()
+
+    def update(self, mutate: Callable[[dict[str, Any]], Any]) -> None:
+        """Apply ``mutate`` to the document in place, under the store lock."""
+        with self._lock:
+            before = copy.deepcopy(self._loaded())
+            mutate(self._data)
+            if self._data != before:
+                self._mark_dirty()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return copy.deepcopy(self._loaded())
+
+    def replace(self, data: dict[str, Any]) -> None:
+        with self._lock:
+            if data != self._loaded():
+                self._data = copy.deepcopy(data)
+                self._mark_dirty()
+
+    def setting(self, name: str) -> Any:
+        """A ``SETTINGS_DEFAULTS`` tunable, falling back to the default if unset or invalid."""
+        default = SETTINGS_DEFAULTS[name]
+        value = self.get(f"settings.{name}", default)
+        try:
+            return type(default)(value)
+        except (TypeError, ValueError):
+            return default
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        self._arm(self.save_delay_seconds)
+
+    def _arm(self, delay: float) -> None:
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes now; returns False if the write failed."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return True
+            text = json.dumps(self._data, indent=2) + "\n"
+            partial = self.path.with_name(self.path.name + ".tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(partial, "w", encoding="utf-8") as handle:
+                    handle.write(text)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                os.replace(partial, self.path)
+            except OSError:
+                self._failures += 1
+                delay = min(
+                    self.save_delay_seconds * 2**self._failures,
+                    config.USER_CONFIG_RETRY_MAX_SECONDS,
+                )
+                app_logger.error(
+                    f"Failed to save config to {self.path}; retrying in {delay:g}s",
+                    exc_info=True,
+                )
+                partial.unlink(missing_ok=True)
+                self._arm(delay)
+                return False
+            self._dirty = False
+            self._failures = 0
+            return True
+
+
+_store: ConfigStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ConfigStore:
+    """The process-wide store for ``CONFIG_FILE``, flushed at exit."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ConfigStore()
+            atexit.register(_store.flush)
+        return _store
+
 
 def load_config() -> dict[str, Any]:
-    if not CONFIG_FILE.is_file():
-        return {}
-    try:
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return get_store().snapshot()
 
 
 def save_config(config: dict[str, Any]) -> None:
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    get_store().replace(config)
@@ -1,9 +1,16 @@
 (function () {
   'use strict';
 
+  const PAGE_SIZE = 100;
+
   let categoryNames = [];
-  let programCategories = {};
+  let categoriesVersion = null;
   let editDraft = {};
+  let listQuery = defaultListQuery();
+  let listPage = { items: [], total: 0, offset: 0, limit: PAGE_SIZE };
+  let pageCache = {};
+  let pageCacheDataVersion = null;
+  let prefixTimer = null;
   let promptOpen = false;
   let editStep = 'table';
   let editRowContext = { program: '', current: '' };
@@ -13,6 +20,58 @@
     return window.pywebview.api;
   }
 
+  function defaultListQuery() {
+    return { prefix: '', category: '', sort: 'name', descending: false, offset: 0, limit: PAGE_SIZE };
+  }
+
+  function formatMinutes(minutes) {
+    const m = Number(minutes) || 0;
+    if (m < 60) return m.toFixed(1) + ' min';
+    return (m / 60).toFixed(2) + ' h';
+  }
+
+  function categoryOptionsHtml(selected, includeAll) {
+    const head = includeAll ? '<option value="">All categories</option>' : '';
+    return (
+      head +
+      categoryNames
+        .map(function (c) {
+          const sel = c === selected ? ' selected' : '';
+          return '<option value="' + escapeHtml(c) + '"' + sel + '>' + escapeHtml(c) + '</option>';
+        })
+        .join('')
+    );
+  }
+
+  // Pages carry per-program totals, so they are dropped when either the
+  // category version or the logged-data version moves.
+  function syncPageCache(dataVersion) {
+    if (dataVersion == null || dataVersion === pageCacheDataVersion) return;
+    pageCache = {};
+    pageCacheDataVersion = dataVersion;
+  }
+
+  async function loadPage() {
+    const key = JSON.stringify(listQuery);
+    if (pageCache[key]) {
+      listPage = pageCache[key];
+      return true;
+    }
+    const r = await api().list_program_categories(listQuery);
+    if (!r || r.status !== 'success') {
+      showAlert((r && r.message) || 'Failed to load programs', 'error');
+      return false;
+    }
+    syncPageCache(r.data_version);
+    listPage = { items: r.items || [], total: r.total || 0, offset: r.offset || 0, limit: r.limit || PAGE_SIZE };
+    pageCache[key] = listPage;
+    return true;
+  }
+
+  async function reloadProgramList() {
+    if (await loadPage()) refreshProgramList();
+  }
+
   function showCategoryPrompt(data) {
     if (!data || !data.program || promptOpen) return;
     if (window.isModalOpen && window.isModalOpen()) return;
@@ -79,44 +138,105 @@
     });
   }
 
-  function renderProgramTable() {
-    const programs = Object.keys(editDraft).sort();
-    let rows = programs
-      .map(function (name) {
-        const cat = editDraft[name] || 'Misc';
+  function renderProgramRows() {
+    const rows = listPage.items
+      .map(function (item) {
+        const name = item.program_name;
+        const pending = Object.prototype.hasOwnProperty.call(editDraft, name);
+        const cat = pending ? editDraft[name] : item.category || 'Misc';
         return (
           '<tr data-program="' +
           escapeHtml(name) +
+          '" data-category="' +
+          escapeHtml(cat) +
           '"><td>' +
           escapeHtml(name) +
           '</td><td class="cat-cell">' +
           escapeHtml(cat) +
+          (pending ? ' <em>(pending)</em>' : '') +
+          '</td><td>' +
+          escapeHtml(formatMinutes(item.total_minutes)) +
           '</td><td><button type="button" class="btn btn-edit-row">Edit</button></td></tr>'
         );
       })
       .join('');
+    return rows || '<tr><td colspan="4">No programs in list.</td></tr>';
+  }
 
-    if (!rows) {
-      rows = '<tr><td colspan="3">No programs in list.</td></tr>';
-    }
+  function pageInfoText() {
+    if (!listPage.total) return '0 programs';
+    const first = listPage.offset + 1;
+    const last = Math.min(listPage.offset + listPage.items.length, listPage.total);
+    return first + '–' + last + ' of ' + listPage.total;
+  }
+
+  function pendingText() {
+    const count = Object.keys(editDraft).length;
+    return count ? count + ' pending change(s) not yet saved.' : '';
+  }
+
+  function refreshProgramList() {
+    const body = document.getElementById('program-table-body');
+    if (body) body.innerHTML = renderProgramRows();
+    const info = document.getElementById('program-page-info');
+    if (info) info.textContent = pageInfoText();
+    const prev = document.getElementById('program-prev');
+    if (prev) prev.disabled = listPage.offset <= 0;
+    const next = document.getElementById('program-next');
+    if (next) next.disabled = listPage.offset + listPage.items.length >= listPage.total;
+    const pending = document.getElementById('program-pending');
+    if (pending) pending.textContent = pendingText();
+    bindRowEditButtons();
+  }
+
+  function renderProgramTable() {
+    const sorts = [
+      ['name', 'Name'],
+      ['category', 'Category'],
+      ['total_time', 'Total time'],
+    ];
+    const sortOptions = sorts
+      .map(function (s) {
+        const sel = s[0] === listQuery.sort ? ' selected' : '';
+        return '<option value="' + s[0] + '"' + sel + '>' + s[1] + '</option>';
+      })
+      .join('');
 
     return (
+      '<div class="program-filters">' +
+      '<div class="form-row"><label for="program-filter-prefix">Name starts with</label>' +
+      '<input type="text" id="program-filter-prefix" value="' +
+      escapeHtml(listQuery.prefix) +
+      '"></div>' +
+      '<div class="form-row"><label for="program-filter-category">Category</label>' +
+      '<select id="program-filter-category">' +
+      categoryOptionsHtml(listQuery.category, true) +
+      '</select></div>' +
+      '<div class="form-row"><label for="program-sort">Sort by</label>' +
+      '<select id="program-sort">' +
+      sortOptions +
+      '</select></div></div>' +
       '<div class="program-table-wrap"><table class="program-table">' +
-      '<thead><tr><th>Program</th><th>Category</th><th>Action</th></tr></thead>' +
+      '<thead><tr><th>Program</th><th>Category</th><th>Total</th><th>Action</th></tr></thead>' +
       '<tbody id="program-table-body">' +
-      rows +
+      renderProgramRows() +
       '</tbody></table></div>' +
+      '<div class="pager">' +
+      '<button type="button" class="btn" id="program-prev">Previous</button>' +
+      '<span id="program-page-info" aria-live="polite">' +
+      escapeHtml(pageInfoText()) +
+      '</span>' +
+      '<button type="button" class="btn" id="program-next">Next</button></div>' +
+      '<p class="hint" id="program-pending">' +
+      escapeHtml(pendingText()) +
+      '</p>' +
       '<hr class="modal-divider">' +
       '<p><em>Add or update program in list</em></p>' +
       '<div class="form-row"><label for="new-program-name">Program name</label>' +
       '<input type="text" id="new-program-name"></div>' +
       '<div class="form-row"><label for="new-program-category">Category</label>' +
       '<select id="new-program-category">' +
-      categoryNames
-        .map(function (c) {
-          return '<option value="' + escapeHtml(c) + '">' + escapeHtml(c) + '</option>';
-        })
-        .join('') +
+      categoryOptionsHtml('', false) +
       '</select></div>' +
       '<button type="button" class="btn" id="btn-add-program">Add/Update in List</button>'
     );
@@ -215,15 +335,65 @@
     renderEditStep();
   }
 
-  function bindEditModalEvents() {
+  function bindRowEditButtons() {
     document.querySelectorAll('.btn-edit-row').forEach(function (btn) {
       btn.onclick = function () {
         const tr = btn.closest('tr');
-        const program = tr.getAttribute('data-program');
-        const cat = editDraft[program] || 'Misc';
-        showEditRowView(program, cat);
+        showEditRowView(tr.getAttribute('data-program'), tr.getAttribute('data-category') || 'Misc');
       };
     });
+  }
+
+  function bindEditModalEvents() {
+    bindRowEditButtons();
+    refreshProgramList();
+
+    const prefixInput = document.getElementById('program-filter-prefix');
+    if (prefixInput) {
+      prefixInput.oninput = function () {
+        clearTimeout(prefixTimer);
+        prefixTimer = setTimeout(function () {
+          listQuery.prefix = prefixInput.value.trim();
+          listQuery.offset = 0;
+          reloadProgramList();
+        }, 250);
+      };
+    }
+
+    const categoryFilter = document.getElementById('program-filter-category');
+    if (categoryFilter) {
+      categoryFilter.onchange = function () {
+        listQuery.category = categoryFilter.value;
+        listQuery.offset = 0;
+        reloadProgramList();
+      };
+    }
+
+    const sortSelect = document.getElementById('program-sort');
+    if (sortSelect) {
+      sortSelect.onchange = function () {
+        listQuery.sort = sortSelect.value;
+        listQuery.descending = sortSelect.value === 'total_time';
+        listQuery.offset = 0;
+        reloadProgramList();
+      };
+    }
+
+    const prevBtn = document.getElementById('program-prev');
+    if (prevBtn) {
+      prevBtn.onclick = function () {
+        listQuery.offset = Math.max(0, listQuery.offset - PAGE_SIZE);
+        reloadProgramList();
+      };
+    }
+
+    const nextBtn = document.getElementById('program-next');
+    if (nextBtn) {
+      nextBtn.onclick = function () {
+        listQuery.offset += PAGE_SIZE;
+        reloadProgramList();
+      };
+    }
 
     const addBtn = document.getElementById('btn-add-program');
     if (addBtn) {
@@ -237,11 +407,7 @@
         editDraft[name] = cat;
         if (categoryNames.indexOf(cat) === -1) categoryNames.push(cat);
         document.getElementById('new-program-name').value = '';
-        const bodyEl = document.getElementById('modal-body');
-        if (bodyEl) {
-          bodyEl.innerHTML = renderProgramTable();
-          bindEditModalEvents();
-        }
+        refreshProgramList();
       };
     }
   }
@@ -301,7 +467,8 @@
       }
       if (r.status === 'success') {
         showAlert('Program categories saved.', 'success');
-        programCategories = Object.assign({}, editDraft);
+        editDraft = {};
+        pageCache = {};
         hideModal(true);
       } else {
         showAlert(r.message || 'Save failed', 'error');
@@ -313,20 +480,29 @@
   window.CategoriesUI = {
     init: function (initialData) {
       categoryNames = initialData.category_names || [];
-      programCategories = initialData.program_categories || {};
+      if (initialData.program_categories_version != null) {
+        categoriesVersion = initialData.program_categories_version;
+      }
     },
 
     showCategoryPrompt: showCategoryPrompt,
 
     openEditModal: async function () {
-      const r = await api().get_program_categories();
+      const r = await api().get_program_categories(categoriesVersion);
       if (r.status !== 'success') {
         showAlert(r.message || 'Failed to load categories', 'error');
         return;
       }
       categoryNames = r.category_names || [];
-      editDraft = Object.assign({}, r.program_categories || {});
+      if (r.full || Object.keys(r.changes || {}).length) {
+        pageCache = {};
+      }
+      syncPageCache(r.data_version);
+      categoriesVersion = r.version;
+      editDraft = {};
       editStep = 'table';
+      listQuery = defaultListQuery();
+      if (!(await loadPage())) return;
 
       const footerHtml =
         '<button type="button" class="btn" id="edit-cancel">Cancel</button>' +
@@ -348,6 +524,7 @@
         },
       }).then(function () {
         editStep = 'table';
+        clearTimeout(prefixTimer);
       });
     },
   };
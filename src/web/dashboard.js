@@ -6,6 +6,8 @@
   let playIconUri = '';
   let pauseIconUri = '';
   let pollFailCount = 0;
+  let stateVersion = null;
+  let dashboardState = {};
 
   function api() {
     return window.pywebview.api;
@@ -55,9 +57,30 @@
     if (el) el.textContent = value;
   }
 
+  // Delta responses carry only fields changed since stateVersion; "full" resets the snapshot.
+  function applyStateDelta(r) {
+    if (r.full) dashboardState = {};
+    const textFields = {
+      current_app_time: ['current-app-time-value', '00:00:00'],
+      active_window: ['active-window-value', 'None'],
+      previous_window: ['previous-window-value', 'None'],
+      break_interval_display: ['break-interval-value', '--'],
+      break_countdown_display: ['break-countdown-value', '--'],
+    };
+    Object.keys(textFields).forEach(function (key) {
+      if (key in r) setText(textFields[key][0], r[key] || textFields[key][1]);
+    });
+    if ('break_timer_running' in r) {
+      breakTimerRunning = !!r.break_timer_running;
+      updateBreakIcon();
+    }
+    if ('categories_summary' in r) renderCategories(r.categories_summary);
+    if ('category_prompt' in r) dashboardState.category_prompt = r.category_prompt;
+  }
+
   async function pollDashboard() {
     try {
-      const r = await api().get_dashboard_state();
+      const r = await api().get_dashboard_state(stateVersion);
       if (r.status !== 'success') {
         pollFailCount += 1;
         if (pollFailCount >= 3) {
@@ -68,24 +91,20 @@
       }
 
       pollFailCount = 0;
-      setText('current-app-time-value', r.current_app_time || '00:00:00');
-      setText('active-window-value', r.active_window || 'None');
-      setText('previous-window-value', r.previous_window || 'None');
-      setText('break-interval-value', r.break_interval_display || '--');
-      setText('break-countdown-value', r.break_countdown_display || '--');
-
-      breakTimerRunning = !!r.break_timer_running;
-      updateBreakIcon();
-      renderCategories(r.categories_summary);
+      stateVersion = r.version;
+      if (!r.unchanged) {
+        applyStateDelta(r);
+      }
       if (r.break_reminder) {
         showAlert("It's time to take a break.", 'warn');
         if (window.DashboardUI && window.DashboardUI.onBreakReminder) {
           window.DashboardUI.onBreakReminder();
         }
       }
-      if (r.category_prompt && window.CategoriesUI && window.CategoriesUI.showCategoryPrompt) {
+      const prompt = dashboardState.category_prompt;
+      if (prompt && window.CategoriesUI && window.CategoriesUI.showCategoryPrompt) {
         setTimeout(function () {
-          window.CategoriesUI.showCategoryPrompt(r.category_prompt);
+          window.CategoriesUI.showCategoryPrompt(prompt);
         }, 0);
       }
     } catch (e) {
@@ -21,6 +21,16 @@
     return dd + '/' + mm + '/' + yyyy;
   }
 
+  const PROGRESS_POLL_MS = 300;
+
+  async function showExportProgress() {
+    const p = await api().get_export_progress();
+    const el = document.getElementById('loading-message');
+    if (el && p && p.running && p.total > 1) {
+      el.textContent = 'Exporting report... ' + p.done + '/' + p.total + ' months';
+    }
+  }
+
   window.ExportUI = {
     init: function () {},
 
@@ -32,6 +42,13 @@
         '<label><input type="radio" name="export-type" value="all" checked> All Data</label>' +
         '<label><input type="radio" name="export-type" value="range"> Date Range</label>' +
         '</div></fieldset>' +
+        '<div class="form-row"><label for="export-format">Format</label>' +
+        '<select id="export-format">' +
+        '<option value="csv">CSV summary (.csv)</option>' +
+        '<option value="jsonl">Raw sessions, JSON Lines (.jsonl)</option>' +
+        '<option value="npz">Raw sessions, NumPy columns (.npz)</option>' +
+        '<option value="sqlite">Database snapshot (.sqlite)</option>' +
+        '</select></div>' +
         '<div id="date-fields" class="date-fields disabled">' +
         '<div class="form-row"><label for="export-start">Start (DD/MM/YYYY)</label>' +
         '<input type="text" id="export-start" value="' +
@@ -80,7 +97,8 @@
               }
             }
 
-            const pick = await api().pick_save_path('', 'activity_report.csv');
+            const format = document.getElementById('export-format').value;
+            const pick = await api().pick_save_path('', 'activity_report.' + format);
             if (pick.status !== 'success') {
               showAlert(pick.message || 'File picker failed', 'error');
               return;
@@ -91,15 +109,18 @@
             }
 
             showLoading(true, 'Exporting report...');
+            const progressTimer = setInterval(showExportProgress, PROGRESS_POLL_MS);
             let r;
             try {
               r = await api().export_report({
                 path: pick.path,
                 export_type: exportType,
+                format: format,
                 start_date: startDate,
                 end_date: endDate,
               });
             } finally {
+              clearInterval(progressTimer);
               showLoading(false);
             }
 
@@ -2,6 +2,10 @@
   'use strict';
 
   let chartInstance = null;
+  let trendChartInstance = null;
+  let topOffset = 0;
+  let topHasMore = false;
+  const TOP_PAGE_SIZE = 10;
 
   function api() {
     return window.pywebview.api;
@@ -25,6 +29,128 @@
     }
   }
 
+  function destroyTrendChart() {
+    if (trendChartInstance) {
+      trendChartInstance.destroy();
+      trendChartInstance = null;
+    }
+  }
+
+  function drawTrendChart(series) {
+    destroyTrendChart();
+    const canvas = document.getElementById('trend-chart');
+    if (!canvas || !series) return;
+
+    const colors = chartColors();
+    const unit = series.bucket || 'day';
+    const suffix = series.downsample_factor > 1 ? ' (avg of ' + series.downsample_factor + ' ' + unit + 's)' : '';
+    canvas.setAttribute('role', 'img');
+    canvas.setAttribute(
+      'aria-label',
+      'Minutes per ' + unit + ' for ' + series.display_name + ' from ' + series.start + ' to ' + series.end
+    );
+    trendChartInstance = new Chart(canvas.getContext('2d'), {
+      type: 'line',
+      data: {
+        labels: series.labels || [],
+        datasets: [
+          {
+            label: series.display_name + ' minutes per ' + unit + suffix,
+            data: series.values || [],
+            borderColor: colors.overall,
+            backgroundColor: colors.today,
+            pointRadius: 0,
+            tension: 0.2,
+          },
+        ],
+      },
+      options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        animation: false,
+        plugins: {
+          legend: { labels: { color: colors.text } },
+          title: { display: true, text: 'Trend', color: colors.text },
+        },
+        scales: {
+          x: { ticks: { color: colors.text, maxTicksLimit: 12 }, grid: { color: colors.grid } },
+          y: {
+            beginAtZero: true,
+            ticks: { color: colors.text },
+            grid: { color: colors.grid },
+            title: { display: true, text: 'Minutes', color: colors.text },
+          },
+        },
+      },
+    });
+  }
+
+  function renderHeatmap(heatmap) {
+    if (!heatmap || !heatmap.minutes) {
+      return '<p>No activity heatmap available.</p>';
+    }
+    const max = heatmap.max_minutes || 0;
+    const head = heatmap.hours
+      .map(function (h) {
+        return '<th scope="col">' + escapeHtml(String(h)) + '</th>';
+      })
+      .join('');
+    const body = heatmap.weekdays
+      .map(function (day, i) {
+        const cells = heatmap.minutes[i]
+          .map(function (value, h) {
+            const alpha = max > 0 ? (value / max).toFixed(2) : 0;
+            return (
+              '<td style="--heat:' +
+              alpha +
+              '" title="' +
+              escapeHtml(day + ' ' + h + ':00 — ' + value + ' min') +
+              '"><span class="visually-hidden">' +
+              escapeHtml(String(value)) +
+              ' minutes</span></td>'
+            );
+          })
+          .join('');
+        return '<tr><th scope="row">' + escapeHtml(day) + '</th>' + cells + '</tr>';
+      })
+      .join('');
+    return (
+      '<table class="heatmap-table">' +
+      '<caption>' +
+      escapeHtml(heatmap.display_name + ' minutes by weekday and hour (' + heatmap.start + ' to ' + heatmap.end + ')') +
+      '</caption>' +
+      '<thead><tr><th scope="col">Day</th>' +
+      head +
+      '</tr></thead><tbody>' +
+      body +
+      '</tbody></table>'
+    );
+  }
+
+  async function refreshHeatmap() {
+    const wrap = document.getElementById('heatmap-wrap');
+    if (!wrap) return;
+    const categoryEl = document.getElementById('graph-category-filter');
+    const r = await api().graph_get_heatmap({
+      category: categoryEl ? categoryEl.value : 'All Categories',
+    });
+    wrap.innerHTML = r && r.status === 'success' ? renderHeatmap(r) : renderHeatmap(null);
+  }
+
+  async function refreshTrend() {
+    const categoryEl = document.getElementById('graph-category-filter');
+    const bucketEl = document.getElementById('trend-bucket');
+    const r = await api().graph_get_time_series({
+      category: categoryEl ? categoryEl.value : 'All Categories',
+      bucket: bucketEl ? bucketEl.value : 'week',
+    });
+    if (!r || r.status !== 'success') {
+      destroyTrendChart();
+      return;
+    }
+    drawTrendChart(r);
+  }
+
   function renderStats(stats) {
     if (!stats) return 'No stats available.';
     return (
@@ -56,6 +182,8 @@
       .map(function (row) {
         return (
           '<tr><td>' +
+          escapeHtml(String(row.rank || '')) +
+          '</td><td>' +
           escapeHtml(row.program_name) +
           '</td><td>' +
           escapeHtml(row.category) +
@@ -66,12 +194,36 @@
       })
       .join('');
     return (
-      '<table class="top-programs-table"><thead><tr><th>Program</th><th>Category</th><th>Time</th></tr></thead><tbody>' +
+      '<table class="top-programs-table"><thead><tr><th>#</th><th>Program</th><th>Category</th><th>Time</th></tr></thead><tbody>' +
       body +
       '</tbody></table>'
     );
   }
 
+  function updateTopPager() {
+    const prev = document.getElementById('top-prev');
+    const next = document.getElementById('top-next');
+    if (prev) prev.disabled = topOffset === 0;
+    if (next) next.disabled = !topHasMore;
+  }
+
+  async function showTopPage(offset) {
+    const categoryEl = document.getElementById('graph-category-filter');
+    const r = await api().graph_get_top_programs({
+      category: categoryEl ? categoryEl.value : 'All Categories',
+      offset: offset,
+      limit: TOP_PAGE_SIZE,
+    });
+    if (!r || r.status !== 'success') {
+      showGraphLoadError(r);
+      return;
+    }
+    topOffset = r.offset;
+    topHasMore = !!r.has_more;
+    document.getElementById('top-programs').innerHTML = renderTopPrograms(r.items);
+    updateTopPager();
+  }
+
   function renderChartSummaryTable(chartData) {
     const labels = (chartData && chartData.labels) || [];
     const today = (chartData && chartData.today_values) || [];
@@ -176,6 +328,9 @@
       summaryEl.innerHTML = renderChartSummaryTable(data.chart);
     }
     document.getElementById('top-programs').innerHTML = renderTopPrograms(data.top_programs);
+    topOffset = 0;
+    topHasMore = !!data.top_programs_has_more;
+    updateTopPager();
     drawChart('usage-chart', data.chart);
   }
 
@@ -224,9 +379,21 @@
         '</div>' +
         '<div class="graph-layout">' +
         '<div class="chart-container"><canvas id="usage-chart"></canvas></div>' +
-        '<div id="top-programs">' +
+        '<div><div id="top-programs">' +
         renderTopPrograms(data.top_programs) +
-        '</div></div>';
+        '</div>' +
+        '<div class="pager">' +
+        '<button type="button" class="btn" id="top-prev">Previous 10</button>' +
+        '<button type="button" class="btn" id="top-next">Next 10</button></div>' +
+        '</div></div>' +
+        '<div class="form-row"><label for="trend-bucket">Trend by</label>' +
+        '<select id="trend-bucket">' +
+        '<option value="day">Day</option>' +
+        '<option value="week" selected>Week</option>' +
+        '<option value="month">Month</option>' +
+        '</select></div>' +
+        '<div class="chart-container trend-container"><canvas id="trend-chart"></canvas></div>' +
+        '<div id="heatmap-wrap" class="heatmap-wrap"></div>';
 
       const footerHtml = '<button type="button" class="btn" id="graph-close">Close Graph</button>';
 
@@ -237,9 +404,20 @@
         wide: true,
         onOpen: function () {
           refreshGraphView(data);
+          refreshTrend();
+          refreshHeatmap();
           document.getElementById('graph-close').onclick = function () {
             hideModal(true);
           };
+          document.getElementById('top-prev').onclick = function () {
+            showTopPage(Math.max(0, topOffset - TOP_PAGE_SIZE));
+          };
+          document.getElementById('top-next').onclick = function () {
+            showTopPage(topOffset + TOP_PAGE_SIZE);
+          };
+          document.getElementById('trend-bucket').onchange = function () {
+            refreshTrend();
+          };
           document.getElementById('graph-category-filter').onchange = async function (e) {
             showLoading(true, 'Refreshing graph...');
             let refreshed;
@@ -253,10 +431,13 @@
               return;
             }
             refreshGraphView(refreshed);
+            refreshTrend();
+            refreshHeatmap();
           };
         },
       }).then(function () {
         destroyChart();
+        destroyTrendChart();
       });
     },
   };
@@ -44,4 +44,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Report workers are spawned processes; frozen builds must hand them off here.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
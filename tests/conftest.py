@@ -6,3 +6,39 @@ import pytest
 SRC = Path(__file__).resolve().parent.parent / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="Also run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; pass --runslow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def temp_log(tmp_path_factory):
+    """Write the app log under a temporary folder instead of ``user_data``."""
+    from utils import app_logger
+
+    log_path = tmp_path_factory.mktemp("logs") / "time_tracker_app.log"
+    app_logger.setup_logger(log_file_path=log_path)
+    return log_path
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point the SQLite helpers at a fresh database under ``tmp_path``."""
+    from utils import db_utils
+
+    db_path = tmp_path / "time_tracker_data.sqlite"
+    monkeypatch.setattr(db_utils, "DATABASE_PATH", db_path)
+    db_utils.initialize_database()
+    return db_path
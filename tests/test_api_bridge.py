@@ -1,6 +1,7 @@
 """Tests for bridge API without real webview."""
 
 from bridge.api_bridge import TimeTrackerApi
+from bridge.dashboard_state import DashboardStateDelta
 
 
 class FakeWindow:
@@ -31,3 +32,86 @@ def test_emit_event_with_window():
     api.set_window(window)
     api._emit_event("on_test", {"a": 1})
     assert "on_test" in window.last_js
+
+
+def test_dashboard_delta_returns_only_changed_fields():
+    delta = DashboardStateDelta()
+    v1 = delta.update({"current_app_time": "00:00:01", "categories_summary": []})
+    full = delta.diff(None)
+    assert full["full"] and full["categories_summary"] == []
+
+    v2 = delta.update({"current_app_time": "00:00:02", "categories_summary": []})
+    changed = delta.diff(v1)
+    assert changed["version"] == v2
+    assert changed["current_app_time"] == "00:00:02"
+    assert "categories_summary" not in changed
+
+    assert delta.update({"current_app_time": "00:00:02"}) == v2
+    assert delta.diff(v2) == {"version": v2, "unchanged": True}
+    assert delta.diff(v2 + 10)["full"]
+
+
+def test_get_dashboard_state_sends_unchanged_marker():
+    class Tracker:
+        def get_dashboard_state(self, consume_reminder=True):
+            return {"current_app_time": "00:00:05", "break_reminder": False}
+
+    class Logger:
+        def refresh_from_database(self):
+            return False
+
+        def get_category_summary(self):
+            return [{"category": "Dev", "count": 1, "percentage": 100.0}]
+
+        def get_CATEGORIES(self):
+            return ["Dev"]
+
+    api = TimeTrackerApi()
+    api._tracker = Tracker()
+    api._logger = Logger()
+    first = api.get_dashboard_state()
+    assert first["full"] and first["categories_summary"][0]["category"] == "Dev"
+    second = api.get_dashboard_state(first["version"])
+    assert second["status"] == "success"
+    assert second["unchanged"]
+
+
+def test_program_listing_reports_data_version(temp_db):
+    from datetime import datetime
+
+    from models.logger_service import LoggerService
+
+    api = TimeTrackerApi()
+    api._logger = LoggerService()
+    api._logger.save_program_category_to_db("code", "Dev")
+    start = datetime(2024, 3, 4, 9, 0).timestamp()
+    api._logger.log_activity("code", "a.py", start, start + 600, 600.0)
+    first = api.list_program_categories({})
+    assert first["items"][0]["total_minutes"] == 10.0
+
+    api._logger.log_activity("code", "b.py", start + 600, start + 1200, 600.0)
+    second = api.list_program_categories({})
+    assert second["data_version"] > first["data_version"]
+    assert second["items"][0]["total_minutes"] == 20.0
+    assert api.get_program_categories()["data_version"] == second["data_version"]
+
+
+def test_export_progress_is_polled_not_pushed(monkeypatch):
+    from bridge import api_bridge
+
+    api = TimeTrackerApi()
+    api._logger = object()
+    window = FakeWindow()
+    api.set_window(window)
+    seen = []
+
+    def fake_export(logger, path, fmt, export_type, start, end, progress):
+        progress(1, 3)
+        seen.append(api.get_export_progress())
+        return {"path": path, "rows": 3}
+
+    monkeypatch.setattr(api_bridge.exporters, "export_report", fake_export)
+    assert api.export_report({"path": "out.csv"})["status"] == "success"
+    assert seen == [{"status": "success", "running": True, "done": 1, "total": 3}]
+    assert api.get_export_progress() == {"status": "success", "running": False}
+    assert not hasattr(window, "last_js")
@@ -0,0 +1,75 @@
+"""Tests for queue-based application logging."""
+
+import logging
+import queue
+import sys
+import threading
+
+from utils import app_logger as app_logger_module
+from utils.app_logger import DroppingQueueHandler
+
+
+def _record(level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord("TimeTrackerApp", level, __file__, 1, msg, args, None)
+
+
+def test_full_queue_drops_and_counts_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    for _ in range(3):
+        handler.handle(_record())
+    handler.handle(_record(logging.ERROR))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == {"INFO": 1, "ERROR": 1}
+    assert handler.queue.get_nowait().getMessage() == "hello world"
+
+
+def test_records_are_queued_unformatted():
+    handler = DroppingQueueHandler(queue.Queue())
+    handler.setFormatter(logging.Formatter("formatted: %(message)s"))
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(logging.ERROR)
+        record.exc_info = sys.exc_info()
+    handler.handle(record)
+
+    queued = handler.queue.get_nowait()
+    assert queued is not record
+    assert (queued.msg, queued.args) == ("hello %s", ("world",))
+    assert queued.exc_info is record.exc_info
+    assert queued.exc_text is None
+
+
+def test_listener_writes_records_from_other_threads():
+    logger = app_logger_module.app_logger
+    captured = []
+    done = threading.Event()
+
+    class Capture(logging.Handler):
+        def emit(self, record):
+            captured.append(record.getMessage())
+            if len(captured) == 20:
+                done.set()
+
+    listener = app_logger_module._listener
+    listener.handlers = (*listener.handlers, Capture())
+    try:
+        threads = [
+            threading.Thread(target=lambda n=n: logger.warning("from thread %d", n))
+            for n in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert done.wait(5)
+    finally:
+        listener.handlers = listener.handlers[:-1]
+    assert sorted(captured) == sorted(f"from thread {n}" for n in range(20))
+    assert app_logger_module.get_log_stats()["capacity"] > 0
+
+
+def test_level_names_fall_back_to_info():
+    assert app_logger_module._level("debug") == logging.DEBUG
+    assert app_logger_module._level("nonsense") == logging.INFO
@@ -0,0 +1,100 @@
+"""Tests for online backups and their rotation."""
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from utils import backup, db_utils
+
+
+def _fill(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO time_entries (date_text, program_name, window_title, category, "
+            "start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, "
+            "end_timestamp_epoch) VALUES ('04/03/2024', ?, 'w', 'Work', '09:00', '09:01', 1, ?, ?)",
+            [(f"prog{i % 50}", 1e9 + i * 60, 1e9 + i * 60 + 60) for i in range(rows)],
+        )
+    conn.close()
+
+
+def _count(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM time_entries").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_backup_survives_concurrent_writes(temp_db, tmp_path):
+    _fill(temp_db, 3000)
+    writer = sqlite3.connect(temp_db)
+    written = []
+
+    def write_between_steps(status, remaining, total):
+        with writer:
+            writer.execute(
+                "INSERT INTO time_entries (date_text, program_name, window_title, category, "
+                "start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, "
+                "end_timestamp_epoch) VALUES ('05/03/2024', 'late', '', 'Work', '10:00', "
+                "'10:01', 1, 2e9, 2e9 + 60)"
+            )
+        written.append(remaining)
+
+    dest = tmp_path / "copy.sqlite"
+    db_utils.backup_database(dest, pages=1, max_restarts=2, progress=write_between_steps)
+    writer.close()
+
+    assert written
+    copied = _count(dest)
+    assert 3000 <= copied <= 3000 + len(written)
+    conn = sqlite3.connect(dest)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    finally:
+        conn.close()
+
+
+def test_create_backup_rotates_and_leaves_no_partials(temp_db, tmp_path):
+    _fill(temp_db, 10)
+    backup_dir = tmp_path / "backups"
+    backup_dir.mkdir()
+    for day in range(1, 5):
+        old = backup_dir / f"{backup.BACKUP_PREFIX}2024010{day}_000000{backup.BACKUP_SUFFIX}"
+        old.write_bytes(b"")
+    stale = backup_dir / f"{backup.BACKUP_PREFIX}20240105_000000.sqlite.partial"
+    stale.write_bytes(b"")
+
+    newest = backup.create_backup(backup_dir, keep=2, pages=4, pause=0)
+
+    remaining = backup.list_backups(backup_dir)
+    assert remaining[-1] == newest and len(remaining) == 2
+    assert not list(backup_dir.glob("*.partial"))
+    assert _count(newest) == 10
+
+
+def test_failed_backup_removes_partial_copy(temp_db, tmp_path, monkeypatch):
+    def fail(dest_path, **kwargs):
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        dest_path.write_bytes(b"half")
+        raise sqlite3.OperationalError("disk full")
+
+    monkeypatch.setattr(db_utils, "backup_database", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        backup.create_backup(tmp_path / "backups", keep=3)
+    assert not list((tmp_path / "backups").iterdir())
+
+
+def test_scheduler_waits_for_interval_since_newest_backup(tmp_path):
+    scheduler = backup.BackupScheduler(3600, tmp_path, keep=3)
+    assert scheduler._seconds_until_due() == 0.0
+
+    recent = tmp_path / f"{backup.BACKUP_PREFIX}20240101_000000{backup.BACKUP_SUFFIX}"
+    recent.write_bytes(b"")
+    hour_ago = time.time() - 1800
+    os.utime(recent, (hour_ago, hour_ago))
+    assert 1700 < scheduler._seconds_until_due() <= 1800
@@ -0,0 +1,92 @@
+"""Tests for the headless analytics commands."""
+
+import csv
+import io
+import json
+import sys
+from datetime import date, datetime
+
+import pytest
+
+import cli
+from models.logger_service import LoggerService
+from utils import config
+
+
+@pytest.fixture
+def run(temp_db, monkeypatch, capsys):
+    logger = LoggerService()
+    monday = datetime(2024, 3, 4, 9, 0).timestamp()
+    logger.log_activity("code", "a.py", monday, monday + 3600, 3600.0)
+    logger.log_activity("chat", None, monday + 3600, monday + 5400, 1800.0)
+    logger.log_activity("code", "b.py", monday + 86400, monday + 88200, 1800.0)
+    logger.log_activity("code", "c.py", monday + 40 * 86400, monday + 40 * 86400 + 600, 600.0)
+    logger.update_categories_in_log_entries("code", "Work")
+    monkeypatch.setattr(config, "DATABASE_FILE_PATH", temp_db)
+
+    def invoke(*argv):
+        monkeypatch.setattr(sys, "argv", ["cli.py", *argv])
+        cli.main()
+        return capsys.readouterr().out
+
+    return invoke
+
+
+def test_stats_reports_totals_and_active_days(run):
+    summary = json.loads(run("stats", "--format", "json"))
+    assert summary["total_minutes"] == 130.0
+    assert summary["sessions"] == 4
+    assert summary["active_days"] == 3
+    assert summary["first_day"] == "2024-03-04" and summary["last_day"] == "2024-04-13"
+    assert summary["top_program"] == "code"
+
+    ranged = json.loads(
+        run("stats", "--start", "2024-03-04", "--end", "05/03/2024", "--format", "json")
+    )
+    assert ranged["total_minutes"] == 120.0 and ranged["active_days"] == 2
+
+
+def test_top_pages_and_filters(run):
+    rows = json.loads(run("top", "--format", "json"))
+    assert [(r["rank"], r["program"], r["minutes"]) for r in rows] == [
+        (1, "code", 100.0),
+        (2, "chat", 30.0),
+    ]
+    assert json.loads(run("top", "--offset", "1", "--format", "json"))[0]["rank"] == 2
+    assert json.loads(run("top", "--category", "Work", "--format", "json"))[0]["hours"] == 1.67
+    assert "code" in run("top", "--days", "2", "--end", "2024-03-05")
+
+
+def test_timeline_groups_by_period(run):
+    output = run("timeline", "--start", "2024-03-01", "--end", "2024-04-30", "--format", "csv")
+    daily = list(csv.DictReader(io.StringIO(output)))
+    assert [(r["day"], r["minutes"]) for r in daily] == [
+        ("2024-03-04", "90.0"),
+        ("2024-03-05", "30.0"),
+        ("2024-04-13", "10.0"),
+    ]
+    monthly = json.loads(
+        run("timeline", "--by", "month", "--start", "2024-03-01", "--format", "json")
+    )
+    assert [(r["month"], r["sessions"]) for r in monthly] == [("2024-03", 3), ("2024-04", 1)]
+
+
+def test_timeline_weeks_span_new_year(run):
+    logger = LoggerService()
+    for day in (date(2024, 12, 29), date(2024, 12, 30), date(2025, 1, 1), date(2025, 1, 5)):
+        start = datetime.combine(day, datetime.min.time()).timestamp() + 9 * 3600
+        logger.log_activity("code", "a.py", start, start + 600, 600.0)
+
+    weekly = json.loads(
+        run("timeline", "--by", "week", "--start", "2024-12-01", "--format", "json")
+    )
+    assert [(r["week"], r["minutes"], r["sessions"]) for r in weekly] == [
+        ("2024-12-23", 10.0, 1),
+        ("2024-12-30", 30.0, 3),
+    ]
+
+
+def test_categories_share_and_empty_table(run):
+    rows = json.loads(run("categories", "--format", "json"))
+    assert {r["category"]: r["percent"] for r in rows} == {"Work": 76.9, "Misc": 23.1}
+    assert "No data" in run("categories", "--start", "2020-01-01", "--end", "2020-01-02")
@@ -0,0 +1,101 @@
+"""Tests for the export targets."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from models import exporters
+from models.logger_service import LoggerService
+
+
+@pytest.fixture
+def logger(temp_db):
+    logger = LoggerService()
+    monday = datetime(2024, 3, 4, 9, 0).timestamp()
+    logger.log_activity("code", "a.py", monday, monday + 60, 60.0)
+    logger.log_activity("chat", None, monday + 60, monday + 180, 120.0)
+    logger.log_activity("code", "b.py", monday + 86400, monday + 86460, 60.0)
+    return logger
+
+
+def test_format_for_path_prefers_flag_then_extension():
+    assert exporters.format_for_path("out.NDJSON") == "jsonl"
+    assert exporters.format_for_path("out.db") == "sqlite"
+    assert exporters.format_for_path("out.txt") == "csv"
+    assert exporters.format_for_path("out.csv", "npz") == "npz"
+    with pytest.raises(ValueError):
+        exporters.format_for_path("out.csv", "xml")
+
+
+def test_jsonl_export_streams_raw_sessions(logger, tmp_path):
+    path = tmp_path / "sessions.jsonl"
+    result = exporters.export_report(
+        logger, path, export_type="range", start_date_str="04/03/2024", end_date_str="04/03/2024"
+    )
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert result["rows"] == 2 and result["format"] == "jsonl"
+    assert [r["program_name"] for r in records] == ["code", "chat"]
+    assert records[1]["window_title"] is None
+
+
+def test_npz_export_is_columnar_and_dictionary_encoded(logger, tmp_path):
+    path = tmp_path / "sessions.npz"
+    exporters.export_report(logger, path)
+    with np.load(path) as data:
+        assert data["id"].tolist() == [1, 2, 3]
+        assert data["total_time_minutes"].dtype == np.float32
+        programs = data["program_name_categories"][data["program_name"]]
+        assert programs.tolist() == ["code", "chat", "code"]
+        assert data["window_title"].tolist()[1] == -1
+
+
+def test_sqlite_snapshot_keeps_only_range(logger, tmp_path):
+    path = tmp_path / "snapshot.sqlite"
+    result = exporters.export_report(
+        logger, path, export_type="range", start_date_str="05/03/2024", end_date_str="05/03/2024"
+    )
+    assert result["rows"] == 1
+    conn = sqlite3.connect(path)
+    rollup = conn.execute("SELECT day, total_minutes FROM daily_rollup").fetchall()
+    conn.close()
+    assert rollup == [("2024-03-05", 1.0)]
+
+
+def test_empty_export_raises(logger, tmp_path):
+    path = tmp_path / "empty.jsonl"
+    with pytest.raises(ValueError):
+        exporters.export_report(
+            logger, path, export_type="range", start_date_str="01/01/2020", end_date_str="02/01/2020"
+        )
+    assert not path.exists()
+
+
+def test_incremental_jsonl_appends_sessions_and_corrections(logger, tmp_path):
+    path = tmp_path / "nightly.jsonl"
+    first = exporters.export_jsonl_incremental(logger, path)
+    assert (first["rows"], first["corrections"], first["last_entry_id"]) == (3, 0, 3)
+
+    again = exporters.export_jsonl_incremental(logger, path)
+    assert again["rows"] == 0
+
+    logger.update_categories_in_log_entries("code", "Dev")
+    later = datetime(2024, 3, 6, 9, 0).timestamp()
+    logger.log_activity("chat", "x", later, later + 60, 60.0)
+    update = exporters.export_jsonl_incremental(logger, path)
+    assert (update["rows"], update["corrections"]) == (1, 1)
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 5
+    assert lines[3]["id"] == 4
+    assert lines[4] == {
+        "record": "correction",
+        "program_name": "code",
+        "category": "Dev",
+        "up_to_id": 3,
+    }
+
+    path.unlink()
+    assert exporters.export_jsonl_incremental(logger, path)["rows"] == 4
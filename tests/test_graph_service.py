@@ -1,28 +1,56 @@
 """Tests for graph JSON payloads."""
 
+from datetime import date, datetime
+
 import pandas as pd
 
 from models.graph_service import GraphService, format_time_display
 
 
 class StubLogger:
-    def get_all_logged_data(self):
-        return pd.DataFrame(
+    data_version = 0
+    history_version = 0
+
+    def __init__(self):
+        self.fetches = 0
+        self.category_map = {"code": "Dev"}
+        self.today = {}
+
+    def get_today_totals(self, today=None):
+        return dict(self.today)
+
+    def get_all_logged_data(self, start=None, end=None, columns=None):
+        self.fetches += 1
+        df = pd.DataFrame(
             [
                 {
                     "date_text": "01/06/2026",
                     "program_name": "code",
                     "category": "Dev",
                     "total_time_minutes": 60,
+                    "end_timestamp_epoch": datetime(2026, 6, 1, 10, 0).timestamp(),
                 },
                 {
                     "date_text": "01/06/2026",
                     "program_name": "browser",
                     "category": "Web",
                     "total_time_minutes": 30,
+                    "end_timestamp_epoch": datetime(2026, 6, 1, 10, 30).timestamp(),
                 },
             ]
         )
+        dates = pd.to_datetime(df["date_text"], format="%d/%m/%Y")
+        mask = pd.Series(True, index=df.index)
+        if start:
+            mask &= dates >= pd.Timestamp(start)
+        if end:
+            mask &= dates <= pd.Timestamp(end)
+        return df.loc[mask, list(columns or df.columns)]
+
+    def get_top_programs(self, start=None, end=None, category=None, limit=10, offset=0):
+        rows = [("code", "Dev", 60.0, 1), ("browser", "Web", 30.0, 1)]
+        rows = [row for row in rows if category in (None, row[1])]
+        return rows[offset : offset + limit]
 
     def get_CATEGORIES(self):
         return ["Dev", "Web"]
@@ -41,3 +69,175 @@ def test_get_graph_data_shape():
     assert "labels" in result["chart"]
     assert "today_values" in result["chart"]
     assert isinstance(result["top_programs"], list)
+
+
+def test_get_graph_data_is_cached_per_data_version():
+    logger = StubLogger()
+    service = GraphService(logger, cache_size=2)
+    first = service.get_graph_data("All Categories")
+    fetches = logger.fetches
+    assert service.get_graph_data("All Categories") is first
+    service.get_graph_data("Dev")
+    assert logger.fetches == fetches
+
+    logger.data_version += 1
+    refreshed = service.get_graph_data("All Categories")
+    assert refreshed is not first
+    assert logger.fetches == fetches
+    assert refreshed["chart"] == first["chart"]
+
+
+def test_get_graph_data_merges_today_and_live_session():
+    logger = StubLogger()
+    logger.today = {("Dev", "code"): 30.0}
+    live_start = datetime.now().timestamp() - 600
+    service = GraphService(logger, live_session_provider=lambda: ("code", live_start))
+    result = service.get_graph_data("Dev")
+    assert 39.9 < result["stats"]["today_minutes"] < 40.5
+    assert result["stats"]["overall_days"] == 2
+    assert result["chart"]["today_values"][result["chart"]["labels"].index("Dev")] == 100.0
+
+
+def test_live_session_does_not_defeat_payload_cache(monkeypatch):
+    logger = StubLogger()
+    logger.today = {("Dev", "code"): 30.0}
+    live = {"start": datetime.now().timestamp() - 600}
+    service = GraphService(logger, live_session_provider=lambda: ("code", live["start"]))
+    builds = []
+    build = service._build_graph_data
+    monkeypatch.setattr(
+        service, "_build_graph_data", lambda *args: builds.append(args) or build(*args)
+    )
+
+    first = service.get_graph_data("Dev")
+    live["start"] -= 600
+    second = service.get_graph_data("Dev")
+    assert len(builds) == 1
+    assert service.get_cache_stats()["payload_entries"] == 2
+    assert second["stats"]["today_minutes"] - first["stats"]["today_minutes"] > 9.9
+    assert second["top_programs"] == first["top_programs"]
+
+
+def test_session_across_midnight_is_counted_once(temp_db):
+    from models.logger_service import LoggerService
+
+    today = date.today()
+    midnight = datetime.combine(today, datetime.min.time()).timestamp()
+    logger = LoggerService()
+    logger.log_activity("code", "a.py", midnight - 600, midnight + 600, 1200.0)
+
+    result = GraphService(logger).get_graph_data("All Categories")
+    assert result["stats"]["today_minutes"] == 10.0
+    assert result["stats"]["overall"] == "20.0 minutes"
+    assert result["stats"]["overall_days"] == 2
+
+
+class RollupLogger:
+    data_version = 0
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def get_day_bounds(self):
+        return date(2024, 1, 1), date(2024, 12, 31)
+
+    def get_daily_totals(self, start, end, category=None, exclude_categories=()):
+        return [(day, minutes) for day, minutes in self.rows if start.isoformat() <= day <= end.isoformat()]
+
+
+def test_get_time_series_buckets_and_downsamples():
+    service = GraphService(RollupLogger([("2024-01-01", 30.0), ("2024-01-09", 60.0)]))
+    weekly = service.get_time_series(bucket="week", start="2024-01-01", end="2024-01-14")
+    assert weekly["labels"] == ["2024-01-01", "2024-01-08"]
+    assert weekly["values"] == [30.0, 60.0]
+
+    long_range = service.get_time_series(bucket="day", end="2024-12-31", max_points=10)
+    assert len(long_range["values"]) <= 10
+    assert long_range["downsample_factor"] == 37
+    assert service.get_time_series(bucket="hour")["status"] == "error"
+
+
+def test_activity_heatmap_splits_sessions_across_hours(temp_db):
+    from models.logger_service import LoggerService
+
+    logger = LoggerService()
+    start = datetime(2024, 3, 4, 9, 30).timestamp()  # a Monday
+    logger.log_activity("code", "a.py", start, start + 3600, 3600.0)
+    logger.log_activity("chat", "general", start + 3600, start + 4200, 600.0)
+    logger.update_categories_in_log_entries("chat", "Break")
+    service = GraphService(logger)
+
+    heatmap = service.get_activity_heatmap(start="2024-03-04", end="2024-03-10")
+    monday = heatmap["minutes"][0]
+    assert monday[9] == 30.0 and monday[10] == 30.0
+    assert sum(monday) == 60.0
+    assert service._day_caches[("hourly",)][date(2024, 3, 4)]["Break"][10] == 10.0
+
+
+def test_focus_report_merges_short_interruptions(temp_db):
+    from models.logger_service import LoggerService
+
+    logger = LoggerService()
+    start = datetime(2024, 3, 4, 9, 0).timestamp()
+    minute = 60.0
+    sessions = [
+        ("code", start, start + 20 * minute),
+        ("chat", start + 20 * minute, start + 23 * minute),  # short break
+        ("docs", start + 23 * minute, start + 40 * minute),
+        ("chat", start + 40 * minute, start + 60 * minute),  # long break
+        ("code", start + 60 * minute, start + 70 * minute),
+    ]
+    for program, begin, finish in sessions:
+        logger.log_activity(program, program, begin, finish, finish - begin)
+    logger.update_categories_in_log_entries("chat", "Break")
+    next_day = datetime(2024, 3, 5, 10, 0).timestamp()
+    logger.log_activity("code", "code", next_day, next_day + 30 * minute, 30 * minute)
+    service = GraphService(logger)
+
+    report = service.get_focus_report(start="2024-03-04", end="2024-03-06")
+    monday, tuesday, wednesday = report["days"]
+    assert monday["blocks"] == 1
+    assert monday["focus_minutes"] == 37.0
+    assert monday["longest_block_minutes"] == 40.0
+    assert monday["switches"] == 4
+    assert tuesday["blocks"] == 1 and wednesday["blocks"] == 0
+    assert report["totals"]["longest_streak_days"] == 2
+    assert report["totals"]["switches_by_hour"][9:11] == [3, 1]
+
+    strict = service.get_focus_report(
+        start="2024-03-04", end="2024-03-06", max_interruption_minutes=1
+    )
+    assert strict["days"][0]["blocks"] == 0
+    assert ("focus", "All Categories", 5.0, 25.0) in service._day_caches
+
+
+def test_top_programs_pages_over_rollup(temp_db):
+    from models.logger_service import LoggerService
+
+    logger = LoggerService()
+    start = datetime(2024, 3, 4, 9, 0).timestamp()
+    for index in range(12):
+        minutes = 12 - index
+        logger.log_activity(f"app{index:02d}", "w", start, start + minutes * 60, minutes * 60.0)
+        start += minutes * 60
+    logger.save_program_category_to_db("app00", "Dev")
+    logger.update_categories_in_log_entries("app00", "Dev")
+    service = GraphService(logger)
+
+    first = service.get_top_programs(limit=10)
+    assert first["has_more"] is True
+    assert first["items"][0] == {
+        "rank": 1,
+        "program_name": "app00",
+        "category": "Dev",
+        "total_minutes": 12.0,
+        "session_count": 1,
+        "time_display": "12.0 minutes",
+    }
+    second = service.get_top_programs(offset=10)
+    assert [item["rank"] for item in second["items"]] == [11, 12]
+    assert second["has_more"] is False
+
+    ranged = service.get_top_programs(category="Misc", start="2024-03-04", end="2024-03-04")
+    assert ranged["items"][0]["program_name"] == "app01"
+    assert service.get_top_programs(start="2024-03-05")["items"] == []
@@ -0,0 +1,161 @@
+"""Tests for the local HTTP JSON API."""
+
+import http.client
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from bridge.api_bridge import TimeTrackerApi
+from bridge.http_server import ApiServer
+from utils import config
+
+
+@pytest.fixture
+def server(temp_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DATABASE_FILE_PATH", temp_db)
+    monkeypatch.setattr(config, "LEGACY_DATABASE_FILE_PATH", tmp_path / "missing.sqlite")
+    monkeypatch.setattr(config, "BACKUP_ENABLED", True)
+    monkeypatch.setattr(config, "MAINTENANCE_ENABLED", True)
+    api = TimeTrackerApi()
+    assert api.prepare_startup(track=False, background_jobs=False)["status"] == "success"
+    start = datetime(2024, 3, 4, 9, 0).timestamp()
+    api._logger.log_activity("code", "a.py", start, start + 3600, 3600.0)
+    api._logger.log_activity("chat", "general", start + 3600, start + 4200, 600.0)
+
+    httpd = ApiServer(api, "127.0.0.1", 0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    api.exit_app()
+
+
+def _get(conn, path, headers=None):
+    conn.request("GET", path, headers=headers or {})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def test_keep_alive_and_etag_revalidation(server):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        response, body = _get(conn, "/api/top-programs?start=2024-03-04&end=2024-03-04")
+        assert response.status == 200
+        etag = response.getheader("ETag")
+        assert etag and response.getheader("Cache-Control") == "no-cache"
+        sock = conn.sock
+        programs = [row["program_name"] for row in json.loads(body)["items"]]
+        assert programs[:2] == ["code", "chat"]
+
+        response, body = _get(
+            conn, "/api/top-programs?start=2024-03-04&end=2024-03-04", {"If-None-Match": etag}
+        )
+        assert response.status == 304 and body == b""
+
+        response, body = _get(conn, "/api/dashboard-state")
+        assert response.status == 200 and response.getheader("ETag") is None
+        version = json.loads(body)["version"]
+        response, body = _get(conn, f"/api/dashboard-state?since_version={version}")
+        assert json.loads(body)["unchanged"]
+        assert conn.sock is sock
+    finally:
+        conn.close()
+
+
+def test_errors_and_export(server):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        response, body = _get(conn, "/api/nope")
+        assert response.status == 404 and json.loads(body)["status"] == "error"
+        response, body = _get(conn, "/api/top-programs?limit=many")
+        assert response.status == 400
+
+        response, body = _get(conn, "/api/export?format=jsonl")
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "application/x-ndjson"
+        rows = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+        assert sorted(row["program_name"] for row in rows) == ["chat", "code"]
+        response, body = _get(conn, "/api/export?format=xls")
+        assert response.status == 400
+    finally:
+        conn.close()
+
+
+def test_concurrent_clients(server):
+    host, port = server.server_address[:2]
+
+    def fetch(path):
+        conn = http.client.HTTPConnection(host, port, timeout=10)
+        try:
+            response, body = _get(conn, path)
+            return response.status, json.loads(body)["status"]
+        finally:
+            conn.close()
+
+    paths = ["/api/categories", "/api/graph", "/api/heatmap", "/api/perf"] * 5
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(fetch, paths))
+    assert results == [(200, "success")] * len(paths)
+
+
+def test_dashboard_get_leaves_tracker_state_alone(server):
+    tracker = server.api._tracker
+    tracker._break_time_counter_seconds = -5.0
+    tracker.run_break_time = False
+    before = (
+        tracker._break_time_counter_seconds,
+        tracker._break_timer_absolute_start_epoch,
+        tracker._break_message_pending,
+        tracker.run_break_time,
+        tracker.running,
+    )
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        for _ in range(2):
+            response, body = _get(conn, "/api/dashboard-state")
+            assert response.status == 200 and json.loads(body)["break_reminder"]
+    finally:
+        conn.close()
+    assert (
+        tracker._break_time_counter_seconds,
+        tracker._break_timer_absolute_start_epoch,
+        tracker._break_message_pending,
+        tracker.run_break_time,
+        tracker.running,
+    ) == before
+    assert server.api._backup_scheduler is None
+    assert server.api._maintenance_scheduler is None
+
+
+def test_writes_from_another_process_change_the_etag(server):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        response, body = _get(conn, "/api/top-programs")
+        etag = response.getheader("ETag")
+        assert [row["program_name"] for row in json.loads(body)["items"]] == ["code", "chat"]
+
+        start = datetime(2024, 3, 5, 9, 0).timestamp()
+        other = sqlite3.connect(config.DATABASE_FILE_PATH)
+        with other:
+            other.execute(
+                "INSERT INTO time_entries (date_text, program_name, window_title, category, "
+                "start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, "
+                "end_timestamp_epoch) VALUES ('05/03/2024', 'editor', 'b.py', 'Misc', "
+                "'09:00:00', '11:00:00', 120, ?, ?)",
+                (start, start + 7200),
+            )
+        other.close()
+
+        response, body = _get(conn, "/api/top-programs", {"If-None-Match": etag})
+        assert response.status == 200 and response.getheader("ETag") != etag
+        assert json.loads(body)["items"][0]["program_name"] == "editor"
+        response, body = _get(conn, "/api/dashboard-state")
+        summary = {row["category"]: row["count"] for row in json.loads(body)["categories_summary"]}
+        assert summary["Misc"] == 3
+    finally:
+        conn.close()
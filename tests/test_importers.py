@@ -0,0 +1,139 @@
+"""Tests for the bulk session importer."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from models import exporters, importers
+from models.logger_service import LoggerService
+from utils import db_utils
+
+LEGACY_CSV = """date,program,window,category,start_time,end_time,total_time,percent
+26/03/2024,Google Chrome,Gmail - Inbox,Web Browsing,10:00:00,10:30:00,30.0,50%
+26/03/2024,Visual Studio Code,"main.py, it's",Development,10:30:00,11:00:00,30.0,50%
+26/03/2024,Visual Studio Code,"main.py, it's",Development,10:30:00,11:00:00,30.0,50%
+26/03/2024,,untitled,Development,11:00:00,11:10:00,10.0,
+27/03/2024,Slack,,Chat,23:50:00,00:10:00,,
+not a date,Slack,,Chat,09:00:00,09:10:00,10.0,
+"""
+
+
+def _entries(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT program_name, window_title, category, total_time_minutes, "
+            "start_timestamp_epoch, end_timestamp_epoch FROM time_entries ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def _rollup_matches_entries(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        entries = conn.execute(
+            "SELECT program_name, SUM(total_time_minutes), COUNT(*) FROM time_entries "
+            "GROUP BY program_name ORDER BY program_name"
+        ).fetchall()
+        totals = conn.execute(
+            "SELECT program_name, SUM(total_minutes), SUM(session_count) FROM program_totals "
+            "GROUP BY program_name ORDER BY program_name"
+        ).fetchall()
+        return entries == totals
+    finally:
+        conn.close()
+
+
+def test_legacy_csv_import_parses_dedupes_and_rolls_up(temp_db, tmp_path):
+    path = tmp_path / "time_log.csv"
+    path.write_text(LEGACY_CSV, encoding="utf-8")
+
+    first = importers.import_files([path])
+    assert (first["read"], first["inserted"], first["duplicates"], first["invalid"]) == (6, 3, 1, 2)
+    rows = _entries(temp_db)
+    assert rows[0][4] == datetime(2024, 3, 26, 10, 0).timestamp()
+    assert rows[1][1] == "main.py, it's"
+    slack = rows[2]
+    assert slack[1] is None and slack[3] == 20.0
+    assert slack[5] == datetime(2024, 3, 28, 0, 10).timestamp()
+    assert _rollup_matches_entries(temp_db)
+
+    again = importers.import_files([tmp_path])
+    assert again["inserted"] == 0 and again["duplicates"] == 4
+    assert len(_entries(temp_db)) == 3
+
+
+def test_jsonl_round_trip_in_parallel_chunks(temp_db, tmp_path, monkeypatch):
+    logger = LoggerService()
+    start = datetime(2024, 3, 4, 9, 0).timestamp()
+    for index in range(40):
+        at = start + index * 120
+        logger.log_activity(f"app{index % 3}.exe", f"doc {index}", at, at + 90, 90.0)
+    exported = tmp_path / "sessions.jsonl"
+    exporters.export_jsonl(logger, exported)
+    with open(exported, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"record": "correction", "program_name": "app0.exe"}) + "\n")
+    original = _entries(temp_db)
+
+    target = tmp_path / "fresh.sqlite"
+    monkeypatch.setattr(db_utils, "DATABASE_PATH", target)
+    db_utils.initialize_database()
+    halves = [tmp_path / "a.csv", tmp_path / "b.jsonl"]
+    frame = pd.read_json(exported, lines=True).dropna(subset=["id"])
+    frame.iloc[:20].to_csv(halves[0], index=False)
+    halves[1].write_text(exported.read_text(encoding="utf-8"), encoding="utf-8")
+
+    result = importers.import_files(halves, max_workers=2, chunk_rows=7)
+    assert result["inserted"] == 40 and result["duplicates"] == 20 and not result["errors"]
+    assert sorted(_entries(target), key=lambda row: row[4]) == original
+    assert _rollup_matches_entries(target)
+
+
+def test_unreadable_file_is_reported_and_others_import(temp_db, tmp_path):
+    good = tmp_path / "good.csv"
+    good.write_text(LEGACY_CSV, encoding="utf-8")
+    bad = tmp_path / "bad.jsonl"
+    bad.write_text("{not json\n", encoding="utf-8")
+
+    result = importers.import_files([bad, good])
+    assert str(bad) in result["errors"]
+    assert result["inserted"] == 3
+
+    with pytest.raises(ValueError):
+        importers.import_files([tmp_path / "notes.txt"])
+
+
+def test_deferred_rollup_rolls_back_with_trigger_intact(temp_db):
+    conn = sqlite3.connect(temp_db)
+    try:
+        with pytest.raises(RuntimeError):
+            with db_utils.deferred_rollup(conn):
+                conn.execute(
+                    "INSERT INTO time_entries (date_text, program_name, category, "
+                    "start_time_text, end_time_text, total_time_minutes, "
+                    "start_timestamp_epoch, end_timestamp_epoch) "
+                    "VALUES ('04/03/2024', 'x', 'Misc', '09:00:00', '09:01:00', 1, 1, 61)"
+                )
+                raise RuntimeError("abort")
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert "trg_time_entries_rollup_insert" in names
+        assert conn.execute("SELECT COUNT(*) FROM time_entries").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_running_app_sees_imported_sessions(temp_db, tmp_path):
+    app = LoggerService()
+    assert app.get_category_summary() == []
+    history = app.history_version
+    path = tmp_path / "time_log.csv"
+    path.write_text(LEGACY_CSV, encoding="utf-8")
+    importers.import_files([path])
+
+    assert app.refresh_from_database()
+    assert app.history_version > history
+    assert {row["category"] for row in app.get_category_summary()} >= {"Development"}
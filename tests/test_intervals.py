@@ -0,0 +1,47 @@
+"""Tests for vectorized interval splitting."""
+
+from datetime import date, datetime
+
+import numpy as np
+
+from utils.intervals import (
+    local_hour_edges,
+    merge_intervals,
+    run_starts,
+    split_into_bins,
+)
+
+
+def test_local_hour_edges_cover_whole_days():
+    edges = local_hour_edges(date(2024, 3, 5), 2)
+    assert len(edges) == 49
+    assert edges[0] == datetime(2024, 3, 5).timestamp()
+    assert edges[-1] == datetime(2024, 3, 7).timestamp()
+
+
+def test_split_into_bins_cuts_at_edges_and_clips():
+    edges = np.array([0.0, 3600.0, 7200.0, 10800.0])
+    starts = np.array([1800.0, 100.0, -500.0, 5000.0])
+    ends = np.array([9000.0, 200.0, 600.0, 5000.0])
+    sessions, bins, seconds = split_into_bins(starts, ends, edges)
+    assert sessions.tolist() == [0, 0, 0, 1, 2]
+    assert bins.tolist() == [0, 1, 2, 0, 0]
+    assert seconds.tolist() == [1800.0, 3600.0, 1800.0, 100.0, 600.0]
+
+
+def test_merge_intervals_respects_gap_and_groups():
+    starts = np.array([0.0, 100.0, 400.0, 1000.0, 1050.0])
+    ends = np.array([90.0, 300.0, 500.0, 1040.0, 1100.0])
+    groups = np.array([0, 0, 0, 0, 1])
+    first, block_start, block_end, covered = merge_intervals(starts, ends, 100, groups)
+    assert first.tolist() == [0, 3, 4]
+    assert block_start.tolist() == [0.0, 1000.0, 1050.0]
+    assert block_end.tolist() == [500.0, 1040.0, 1100.0]
+    assert covered.tolist() == [390.0, 40.0, 50.0]
+
+
+def test_run_starts_breaks_on_any_key():
+    values = np.array([1, 1, 2, 2, 2])
+    days = np.array([0, 0, 0, 1, 1])
+    assert run_starts(values).tolist() == [True, False, True, False, False]
+    assert run_starts(values, days).tolist() == [True, False, True, True, False]
@@ -0,0 +1,106 @@
+"""Streaming reads over a large synthetic history."""
+
+import sqlite3
+import tracemalloc
+
+import pytest
+
+from models.logger_service import LoggerService
+
+ROWS = 200_000
+SLOW_ROWS = 2_000_000
+BATCH_SIZE = 5_000
+
+
+def _build_history(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        f"""
+        CREATE TABLE time_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date_text TEXT NOT NULL,
+            program_name TEXT NOT NULL,
+            window_title TEXT,
+            category TEXT NOT NULL,
+            start_time_text TEXT NOT NULL,
+            end_time_text TEXT NOT NULL,
+            total_time_minutes REAL NOT NULL,
+            start_timestamp_epoch REAL NOT NULL,
+            end_timestamp_epoch REAL NOT NULL
+        );
+        CREATE TABLE program_categories (program_name TEXT PRIMARY KEY, category TEXT);
+        WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < {rows - 1})
+        INSERT INTO time_entries
+            (date_text, program_name, window_title, category, start_time_text,
+             end_time_text, total_time_minutes, start_timestamp_epoch, end_timestamp_epoch)
+        SELECT '01/01/2024', 'program-' || (i % 50), 'window title number ' || i,
+               'Work', '00:00:00', '00:00:30', 0.5,
+               1704067200 + i * 30, 1704067200 + i * 30 + 30
+        FROM n;
+        CREATE INDEX idx_time_entries_start_epoch ON time_entries (start_timestamp_epoch);
+        """
+    )
+    conn.close()
+    return db_path
+
+
+@pytest.fixture(scope="module")
+def large_db_path(tmp_path_factory):
+    return _build_history(tmp_path_factory.mktemp("large") / "large.sqlite", ROWS)
+
+
+@pytest.fixture
+def large_db(large_db_path, monkeypatch):
+    from utils import db_utils
+
+    monkeypatch.setattr(db_utils, "DATABASE_PATH", large_db_path)
+    return large_db_path
+
+
+def _assert_streams_in_constant_memory(expected_rows):
+    logger = LoggerService()
+    rows = 0
+    minutes = 0.0
+    batch_bytes = 0
+    tracemalloc.start()
+    try:
+        for batch in logger.iter_entries(
+            batch_size=BATCH_SIZE, columns=["window_title", "total_time_minutes"]
+        ):
+            assert len(batch) <= BATCH_SIZE
+            rows += len(batch)
+            minutes += float(batch["total_time_minutes"].sum())
+            batch_bytes = max(batch_bytes, int(batch.memory_usage(deep=True).sum()))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert rows == expected_rows
+    assert minutes == expected_rows * 0.5
+    # Peak memory follows the batch size, not the table: materializing every
+    # row would take expected_rows / BATCH_SIZE (40 or 400) batches' worth.
+    assert peak < 8 * batch_bytes
+
+
+def test_iter_entries_streams_in_constant_memory(large_db):
+    _assert_streams_in_constant_memory(ROWS)
+
+
+@pytest.mark.slow
+def test_iter_entries_streams_millions_of_rows(tmp_path, monkeypatch):
+    from utils import db_utils
+
+    db_path = _build_history(tmp_path / "huge.sqlite", SLOW_ROWS)
+    monkeypatch.setattr(db_utils, "DATABASE_PATH", db_path)
+    _assert_streams_in_constant_memory(SLOW_ROWS)
+
+
+def test_iter_entries_applies_bounds_and_projection(large_db):
+    logger = LoggerService()
+    batches = list(
+        logger.iter_entries(
+            start=1704067200, end=1704067200 + 300, batch_size=4, columns=["id"]
+        )
+    )
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert list(batches[0].columns) == ["id"]
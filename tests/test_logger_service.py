@@ -0,0 +1,155 @@
+"""Tests for the SQLite-backed logger service."""
+
+from datetime import date, datetime
+
+import numpy as np
+
+from models.logger_service import LoggerService
+
+
+def test_category_summary_tracks_data_version(temp_db):
+    logger = LoggerService()
+    logger.save_program_category_to_db("code", "Dev")
+    logger.log_activity("code", "main.py", 1000.0, 1060.0, 60.0)
+    first = logger.get_category_summary()
+    assert first == [{"category": "Dev", "count": 1, "percentage": 100.0}]
+    assert logger.get_category_summary() is first
+
+    logger.log_activity("browser", "docs", 1060.0, 1120.0, 60.0)
+    second = logger.get_category_summary()
+    assert {row["category"] for row in second} == {"Dev", "Misc"}
+    assert all(row["percentage"] == 50.0 for row in second)
+
+
+def test_program_category_changes_since_version(temp_db):
+    logger = LoggerService()
+    logger.save_program_category_to_db("code", "Dev")
+    version = logger.get_program_categories_version()
+    assert logger.get_program_category_changes(version) == ({}, version)
+
+    logger.save_program_category_to_db("code", "Dev")
+    assert logger.get_program_categories_version() == version
+    logger.save_program_category_to_db("code", "Work")
+    logger.save_program_category_to_db("slack", "Chat")
+    changes, new_version = logger.get_program_category_changes(version)
+    assert changes == {"code": "Work", "slack": "Chat"}
+    assert new_version == logger.get_program_categories_version()
+
+
+def test_list_program_categories_filters_sorts_and_pages(temp_db):
+    logger = LoggerService()
+    for name, category in [("Chrome", "Web"), ("chat_app", "Chat"), ("code", "Dev")]:
+        logger.save_program_category_to_db(name, category)
+    logger.log_activity("code", "main.py", 1000.0, 1600.0, 600.0)
+    logger.log_activity("Chrome", "docs", 1600.0, 1660.0, 60.0)
+
+    page = logger.list_program_categories(prefix="ch")
+    assert [item["program_name"] for item in page["items"]] == ["chat_app", "Chrome"]
+    assert logger.list_program_categories(prefix="chat_")["total"] == 1
+
+    by_time = logger.list_program_categories(sort="total_time", descending=True, limit=1)
+    assert by_time["total"] == 3
+    assert by_time["items"] == [{"program_name": "code", "category": "Dev", "total_minutes": 10.0}]
+    assert logger.list_program_categories(category="Web")["items"][0]["total_minutes"] == 1.0
+
+
+def test_daily_rollup_follows_inserts_and_recategorization(temp_db):
+    logger = LoggerService()
+    day_start = datetime(2024, 3, 5, 9, 0).timestamp()
+    logger.log_activity("code", "a.py", day_start, day_start + 600, 600.0)
+    logger.log_activity("code", "b.py", day_start + 600, day_start + 900, 300.0)
+    logger.log_activity("chat", "general", day_start + 900, day_start + 960, 60.0)
+    day = date(2024, 3, 5)
+    assert logger.get_daily_totals(day, day) == [("2024-03-05", 16.0)]
+    assert logger.get_daily_totals(day, day, category="Misc") == [("2024-03-05", 16.0)]
+
+    logger.update_categories_in_log_entries("code", "Dev")
+    assert logger.get_daily_totals(day, day, category="Dev") == [("2024-03-05", 15.0)]
+    assert logger.get_daily_totals(day, day, exclude_categories=("Dev",)) == [("2024-03-05", 1.0)]
+    assert logger.get_day_bounds() == (day, day)
+
+
+def test_old_databases_keep_percent_text_column(tmp_path, monkeypatch):
+    import sqlite3
+
+    from utils import db_utils
+
+    db_path = tmp_path / "old.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE time_entries (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "date_text TEXT NOT NULL, program_name TEXT NOT NULL, window_title TEXT, "
+        "category TEXT NOT NULL, start_time_text TEXT NOT NULL, "
+        "end_time_text TEXT NOT NULL, total_time_minutes REAL NOT NULL, "
+        "start_timestamp_epoch REAL NOT NULL, end_timestamp_epoch REAL NOT NULL, "
+        "percent_text TEXT DEFAULT '0%')"
+    )
+    conn.close()
+    monkeypatch.setattr(db_utils, "DATABASE_PATH", db_path)
+    db_utils.initialize_database()
+
+    conn = sqlite3.connect(db_path)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(time_entries)")}
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.close()
+    assert version == len(db_utils.SCHEMA_MIGRATIONS)
+    assert "percent_text" in columns
+
+    logger = LoggerService()
+    monday = datetime(2024, 3, 4, 9, 0).timestamp()
+    logger.log_activity("code", "a.py", monday, monday + 60, 60.0)
+    assert "percent_text" not in logger.get_all_logged_data().columns
+    assert len(logger.get_all_logged_data()) == 1
+
+
+def test_logged_data_projection_and_filters(temp_db):
+    logger = LoggerService()
+    monday = datetime(2024, 3, 4, 9, 0).timestamp()
+    logger.log_activity("code", "a.py", monday, monday + 60, 60.0)
+    logger.log_activity("chat", "general", monday + 60, monday + 180, 120.0)
+    logger.log_activity("code", "b.py", monday + 86400, monday + 86460, 60.0)
+
+    df = logger.get_all_logged_data(
+        date(2024, 3, 4), "04/03/2024", columns=["program_name", "total_time_minutes"]
+    )
+    assert list(df.columns) == ["program_name", "total_time_minutes"]
+    assert df["program_name"].dtype == "category"
+    assert df["total_time_minutes"].dtype == "float32"
+    assert df["program_name"].tolist() == ["code", "chat"]
+
+    only_code = logger.get_all_logged_data(monday, None, program="code", limit=1)
+    assert only_code["window_title"].tolist() == ["a.py"]
+    assert logger.get_all_logged_data(category=["Misc"])["id"].tolist() == [1, 2, 3]
+    assert logger.get_all_logged_data(monday + 1, monday + 86400)["id"].tolist() == [2]
+    numpy_bounds = logger.get_all_logged_data(np.int64(monday + 1), np.int64(monday + 86400))
+    assert numpy_bounds["id"].tolist() == [2]
+
+
+def test_sessions_between_finds_sessions_longer_than_a_day(temp_db):
+    logger = LoggerService()
+    day_start = datetime(2024, 3, 6).timestamp()
+    logger.log_activity("render", "", day_start - 30 * 3600, day_start + 3600, 31 * 3600.0)
+    logger.log_activity("code", "a.py", day_start + 7200, day_start + 7260, 60.0)
+    logger.log_activity("chat", "", day_start - 7200, day_start - 3600, 3600.0)
+
+    sessions = logger.get_sessions_between(day_start, day_start + 86400)
+    assert sessions["program_name"].tolist() == ["render", "code"]
+
+
+def test_refresh_picks_up_writes_from_another_instance(temp_db):
+    app = LoggerService()
+    now = datetime.now().timestamp()
+    app.log_activity("code", "a.py", now - 120, now - 60, 60.0)
+    assert not app.refresh_from_database()
+
+    history = app.history_version
+    importer = LoggerService()
+    monday = datetime(2024, 3, 4, 9, 0).timestamp()
+    importer.log_activity("chat", "general", monday, monday + 60, 60.0)
+    importer.save_program_category_to_db("chat", "Talk")
+
+    assert app.refresh_from_database()
+    assert app.history_version > history
+    assert app.category_map["chat"] == "Talk"
+    assert len(app.get_all_logged_data()) == 2
+    assert not app.refresh_from_database()
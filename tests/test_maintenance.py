@@ -0,0 +1,109 @@
+"""Tests for time-boxed database maintenance."""
+
+import sqlite3
+import time
+
+from utils import db_utils, maintenance
+
+
+def _fill_and_delete(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO time_entries (date_text, program_name, window_title, category, "
+            "start_time_text, end_time_text, total_time_minutes, start_timestamp_epoch, "
+            "end_timestamp_epoch) VALUES ('04/03/2024', ?, ?, 'Work', '09:00', '09:01', 1, ?, ?)",
+            [
+                (f"prog{i % 50}", "title " * 40, 1e9 + i * 60, 1e9 + i * 60 + 60)
+                for i in range(rows)
+            ],
+        )
+    with conn:
+        conn.execute("DELETE FROM time_entries WHERE id % 4 != 0")
+    conn.close()
+
+
+def test_maintenance_reclaims_space_and_reports(temp_db, tmp_path):
+    conn = sqlite3.connect(temp_db)
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    conn.close()
+    _fill_and_delete(temp_db, 4000)
+
+    report_path = tmp_path / "maintenance.json"
+    report = maintenance.run_maintenance(budget_seconds=60, report_path=report_path)
+
+    steps = report["steps"]
+    assert [result["status"] for result in steps.values()] == ["ok"] * 4
+    assert steps["incremental_vacuum"]["pages_freed"] > 0
+    assert steps["incremental_vacuum"]["pages_left"] == 0
+    assert steps["quick_check"]["ok"]
+    assert report["bytes_reclaimed"] > 0
+    assert set(report["timings_after_ms"]) == set(maintenance.PROBE_QUERIES)
+    conn = sqlite3.connect(temp_db)
+    try:
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+    finally:
+        conn.close()
+    assert maintenance.last_report(report_path)["steps"] == steps
+
+
+def test_spent_budget_skips_steps(temp_db):
+    report = maintenance.run_maintenance(budget_seconds=0)
+    assert {result["status"] for result in report["steps"].values()} == {"skipped"}
+
+
+def test_existing_database_is_switched_only_by_explicit_maintenance(tmp_path, monkeypatch):
+    db_path = tmp_path / "old.sqlite"
+    conn = sqlite3.connect(db_path)
+    db_utils.create_tables(conn)
+    conn.execute(f"PRAGMA user_version = {len(db_utils.SCHEMA_MIGRATIONS) - 1}")
+    conn.commit()
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    conn.close()
+
+    monkeypatch.setattr(db_utils, "DATABASE_PATH", db_path)
+    db_utils.initialize_database()
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == len(
+            db_utils.SCHEMA_MIGRATIONS
+        )
+    finally:
+        conn.close()
+
+    report = maintenance.run_maintenance(budget_seconds=60, check=False)
+    assert "enable_incremental_vacuum" not in report["steps"]
+    speed = maintenance.config.MAINTENANCE_REWRITE_BYTES_PER_SECOND
+    monkeypatch.setattr(maintenance.config, "MAINTENANCE_REWRITE_BYTES_PER_SECOND", 1)
+    report = maintenance.run_maintenance(budget_seconds=60, check=False, convert=True)
+    assert report["steps"]["enable_incremental_vacuum"]["status"] == "skipped"
+    monkeypatch.setattr(maintenance.config, "MAINTENANCE_REWRITE_BYTES_PER_SECOND", speed)
+    report = maintenance.run_maintenance(budget_seconds=60, check=False, convert=True)
+    assert report["steps"]["enable_incremental_vacuum"]["status"] == "ok"
+    assert report["steps"]["incremental_vacuum"]["status"] == "ok"
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_scheduler_waits_for_idle(temp_db, tmp_path):
+    idle = {"value": False}
+    report_path = tmp_path / "maintenance.json"
+    scheduler = maintenance.MaintenanceScheduler(
+        lambda: idle["value"], report_path=report_path, poll_seconds=0.05
+    )
+    scheduler.start()
+    try:
+        time.sleep(0.3)
+        assert not report_path.exists()
+        idle["value"] = True
+        deadline = time.monotonic() + 10
+        while not report_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert report_path.exists()
+    finally:
+        scheduler.stop()
@@ -0,0 +1,56 @@
+"""Tests for month-partitioned report aggregation."""
+
+from datetime import date, datetime
+
+from models import report_engine
+from models.logger_service import LoggerService
+
+
+def _log_day(logger, day, program, minutes):
+    start = datetime(day.year, day.month, day.day, 10).timestamp()
+    logger.log_activity(program, "w", start, start + minutes * 60, minutes * 60.0)
+
+
+def test_month_partitions_clip_to_range():
+    partitions = report_engine.month_partitions(date(2023, 12, 15), date(2024, 2, 10))
+    assert [p.label for p in partitions] == ["2023-12", "2024-01", "2024-02"]
+    assert partitions[0].start_epoch == datetime(2023, 12, 15).timestamp()
+    assert partitions[1].end_epoch == datetime(2024, 2, 1).timestamp()
+    assert partitions[-1].end_epoch == datetime(2024, 2, 11).timestamp()
+
+
+def test_parallel_report_matches_inline(temp_db, monkeypatch):
+    logger = LoggerService()
+    _log_day(logger, date(2024, 1, 31), "code", 30)
+    _log_day(logger, date(2024, 1, 31), "code", 15)
+    _log_day(logger, date(2024, 2, 1), "chat", 10)
+    _log_day(logger, date(2024, 4, 2), "code", 5)
+
+    inline = report_engine.daily_category_report(temp_db, max_workers=1)
+    assert inline == [
+        ("01/02/2024", "Misc", 10.0),
+        ("02/04/2024", "Misc", 5.0),
+        ("31/01/2024", "Misc", 45.0),
+    ]
+
+    monkeypatch.setattr(report_engine, "PARALLEL_MIN_ROWS", 0)
+    progress = []
+    parallel = report_engine.daily_category_report(
+        temp_db, max_workers=2, progress=lambda done, total: progress.append((done, total))
+    )
+    assert parallel == inline
+    assert progress[-1] == (4, 4)
+
+    ranged = report_engine.daily_category_report(temp_db, date(2024, 2, 1), date(2024, 3, 31))
+    assert ranged == [("01/02/2024", "Misc", 10.0)]
+
+
+def test_export_to_csv_writes_summary(temp_db, tmp_path):
+    logger = LoggerService()
+    _log_day(logger, date(2024, 1, 31), "code", 30)
+    path = tmp_path / "report.csv"
+    logger.export_to_csv(path, "range", "31/01/2024", "31/01/2024")
+    assert path.read_text().splitlines() == [
+        "date_text,category,total_time_minutes",
+        "31/01/2024,Misc,30.0",
+    ]
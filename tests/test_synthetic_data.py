@@ -0,0 +1,68 @@
+"""Tests for the synthetic dataset generator."""
+
+import sqlite3
+from datetime import date
+
+import pytest
+
+from utils import synthetic_data
+
+
+def _rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(
+            "SELECT date_text, program_name, window_title, category, start_timestamp_epoch, "
+            "end_timestamp_epoch FROM time_entries ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def test_same_seed_gives_same_rows(tmp_path):
+    kwargs = {"sessions": 3000, "days": 10, "seed": 7, "end_day": date(2024, 3, 10)}
+    first = synthetic_data.generate_entries(tmp_path / "a.sqlite", **kwargs)
+    synthetic_data.generate_entries(tmp_path / "b.sqlite", **kwargs)
+    synthetic_data.generate_entries(tmp_path / "c.sqlite", **{**kwargs, "seed": 8})
+
+    assert 2700 <= first <= 3000
+    assert _rows(tmp_path / "a.sqlite") == _rows(tmp_path / "b.sqlite")
+    assert _rows(tmp_path / "a.sqlite") != _rows(tmp_path / "c.sqlite")
+
+
+def test_sessions_are_ordered_within_range_and_rolled_up(tmp_path):
+    path = tmp_path / "gen.sqlite"
+    synthetic_data.generate_entries(
+        path, sessions=5000, days=14, seed=1, end_day=date(2024, 3, 17), programs=30
+    )
+    rows = _rows(path)
+    expected_days = {f"{day:02d}/03/2024" for day in range(4, 18)}
+    assert {row[0] for row in rows} <= expected_days
+    assert len({row[1] for row in rows}) > len(synthetic_data.PROGRAM_CATALOG)
+    for previous, current in zip(rows, rows[1:]):
+        assert current[4] >= previous[5] - 1e-6
+        assert current[5] > current[4]
+
+    conn = sqlite3.connect(path)
+    try:
+        entry_minutes = conn.execute("SELECT SUM(total_time_minutes) FROM time_entries")
+        rollup_minutes = conn.execute("SELECT SUM(total_minutes) FROM daily_rollup")
+        totals_minutes = conn.execute("SELECT SUM(total_minutes) FROM program_totals")
+        expected = entry_minutes.fetchone()[0]
+        assert rollup_minutes.fetchone()[0] == pytest.approx(expected)
+        assert totals_minutes.fetchone()[0] == pytest.approx(expected)
+        longest = conn.execute(
+            "SELECT MAX(end_timestamp_epoch - start_timestamp_epoch) FROM time_entries"
+        ).fetchone()[0]
+        stats = conn.execute("SELECT max_session_seconds FROM session_stats").fetchone()[0]
+        assert stats == pytest.approx(longest)
+
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert {
+            "trg_time_entries_rollup_insert",
+            "trg_time_entries_stats_insert",
+            "idx_time_entries_start_epoch",
+        } <= names
+        assert conn.execute("SELECT COUNT(*) FROM program_categories").fetchone()[0] == 30
+    finally:
+        conn.close()
@@ -0,0 +1,25 @@
+"""Tests for the in-memory today aggregator."""
+
+from datetime import date, datetime
+
+from models.today_aggregator import TodayAggregator
+
+
+def test_seed_and_add_clip_to_today():
+    aggregator = TodayAggregator()
+    day = date(2024, 3, 5)
+    midnight = datetime(2024, 3, 5).timestamp()
+    aggregator.seed(day, [("code", "Dev", midnight - 600, midnight + 600)])
+    assert aggregator.is_valid(day)
+    aggregator.add_session("code", "Dev", midnight + 600, midnight + 1200)
+    assert aggregator.snapshot(day) == {("Dev", "code"): 20.0}
+
+
+def test_session_crossing_midnight_rolls_over():
+    aggregator = TodayAggregator()
+    aggregator.seed(date(2024, 3, 5), [])
+    next_midnight = datetime(2024, 3, 6).timestamp()
+    aggregator.add_session("chat", "Misc", next_midnight - 300, next_midnight + 120)
+    assert aggregator.day == date(2024, 3, 6)
+    assert aggregator.snapshot(date(2024, 3, 6)) == {("Misc", "chat"): 2.0}
+    assert aggregator.snapshot(date(2024, 3, 7)) == {}
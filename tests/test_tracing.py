@@ -0,0 +1,76 @@
+"""Tests for span tracing and Chrome trace export."""
+
+import json
+import sys
+from datetime import datetime
+
+import pytest
+
+import cli
+from models.graph_service import GraphService
+from models.logger_service import LoggerService
+from utils import config, tracing
+
+
+@pytest.fixture
+def trace():
+    tracing.enable(1000)
+    tracing.clear()
+    yield tracing
+    tracing.disable()
+    tracing.enable(config.TRACE_BUFFER_EVENTS)
+    tracing.disable()
+    tracing.clear()
+
+
+def test_disabled_tracing_records_nothing():
+    tracing.disable()
+    tracing.clear()
+
+    @tracing.traced("test")
+    def double(value):
+        return value * 2
+
+    with tracing.span("outer") as span:
+        span.set(rows=3)
+        assert double(4) == 8
+    assert tracing.snapshot() == []
+
+
+def test_graph_call_spans_nest_in_chrome_trace(trace, temp_db, tmp_path):
+    logger = LoggerService()
+    start = datetime(2024, 3, 4, 9, 0).timestamp()
+    logger.log_activity("code", "a.py", start, start + 600, 600.0)
+    GraphService(logger).get_graph_data()
+
+    path, spans = trace.dump_chrome_trace(tmp_path / "trace.json")
+    document = json.loads(path.read_text(encoding="utf-8"))
+    events = [event for event in document["traceEvents"] if event["ph"] == "X"]
+    assert len(events) == spans
+    by_name = {event["name"]: event for event in events}
+    assert {"LoggerService.log_activity", "read_sql_query", "db.connection"} <= set(by_name)
+    outer = by_name["GraphService.get_graph_data"]
+    inner = by_name["GraphService._history_summary"]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert by_name["read_sql_query"]["args"]["rows"] == 1
+    assert any(event["ph"] == "M" for event in document["traceEvents"])
+
+
+def test_ring_buffer_keeps_newest_spans(trace):
+    trace.enable(5)
+    for index in range(8):
+        with trace.span(f"s{index}"):
+            pass
+    assert [event[0] for event in trace.snapshot()] == ["s3", "s4", "s5", "s6", "s7"]
+
+
+def test_cli_trace_flag_writes_file(trace, temp_db, tmp_path, monkeypatch, capsys):
+    trace.disable()
+    monkeypatch.setattr(config, "DATABASE_FILE_PATH", temp_db)
+    target = tmp_path / "cli_trace.json"
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--trace", str(target), "init-db"])
+    cli.main()
+    names = {event["name"] for event in json.loads(target.read_text())["traceEvents"]}
+    assert "cli.init-db" in names
+    assert "Wrote" in capsys.readouterr().err
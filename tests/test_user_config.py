@@ -0,0 +1,95 @@
+"""Tests for the cached, debounced user config store."""
+
+import json
+import os
+import time
+
+from utils import user_config
+from utils.user_config import ConfigStore
+
+
+def test_reads_are_cached_and_writes_batched(tmp_path, monkeypatch):
+    path = tmp_path / "app_config.json"
+    path.write_text(json.dumps({"updates": {"update_check_enabled": True}}), encoding="utf-8")
+    store = ConfigStore(path, save_delay_seconds=0.2)
+    assert store.get("updates.update_check_enabled") is True
+
+    path.write_text("{}", encoding="utf-8")
+    assert store.get("updates.update_check_enabled") is True
+
+    writes = []
+    real_replace = os.replace
+    monkeypatch.setattr(
+        user_config.os, "replace", lambda src, dst: (writes.append(dst), real_replace(src, dst))
+    )
+    for minutes in range(20, 30):
+        store.set("settings.break_interval_minutes", minutes)
+    store.update(lambda cfg: cfg["updates"].update(update_skip_version="9.9.9"))
+    deadline = time.monotonic() + 5
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert len(writes) == 1
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["settings"]["break_interval_minutes"] == 29
+    assert saved["updates"]["update_skip_version"] == "9.9.9"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_failed_write_keeps_old_file_and_retries(tmp_path, monkeypatch):
+    path = tmp_path / "app_config.json"
+    path.write_text(json.dumps({"updates": {"update_snooze_until": ""}}), encoding="utf-8")
+    store = ConfigStore(path, save_delay_seconds=60)
+    store.set("updates.update_snooze_until", "2030-01-01T00:00:00Z")
+
+    def crash(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(user_config.os, "replace", crash)
+    assert not store.flush()
+    assert json.loads(path.read_text(encoding="utf-8"))["updates"]["update_snooze_until"] == ""
+    assert not list(tmp_path.glob("*.tmp"))
+
+    monkeypatch.undo()
+    assert store.flush()
+    reloaded = ConfigStore(path)
+    assert reloaded.get("updates.update_snooze_until") == "2030-01-01T00:00:00Z"
+
+
+def test_failed_debounced_write_is_retried_with_backoff(tmp_path, monkeypatch):
+    path = tmp_path / "app_config.json"
+    store = ConfigStore(path, save_delay_seconds=0.1)
+    attempts = []
+    real_replace = os.replace
+
+    def flaky(src, dst):
+        attempts.append(time.monotonic())
+        if len(attempts) <= 2:
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(user_config.os, "replace", flaky)
+    store.set("settings.break_interval_minutes", 25)
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["settings"]["break_interval_minutes"] == 25
+    assert len(attempts) == 3
+    assert attempts[2] - attempts[1] > attempts[1] - attempts[0]
+
+
+def test_settings_fall_back_to_defaults(tmp_path):
+    path = tmp_path / "app_config.json"
+    path.write_text(
+        json.dumps({"settings": {"tracker_poll_seconds": "fast", "graph_cache_entries": "8"}}),
+        encoding="utf-8",
+    )
+    store = ConfigStore(path)
+    assert store.setting("tracker_poll_seconds") == 1.0
+    assert store.setting("graph_cache_entries") == 8
+    assert store.setting("break_interval_minutes") == 50
+
+    snapshot = store.snapshot()
+    snapshot["settings"]["graph_cache_entries"] = 99
+    assert store.setting("graph_cache_entries") == 8